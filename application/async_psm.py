@@ -0,0 +1,224 @@
+"""Client asyncio du PointSetManager (PSM), en HTTP/1.1 persistant.
+
+Avec `http.client`, chaque récupération en cours occupe un thread, bloqué
+sur son socket : le nombre de requêtes simultanées vers le PSM est borné
+par le nombre de threads. AsyncPSMClient fait les mêmes requêtes sur
+`asyncio.open_connection`, sans bibliothèque tierce : des milliers de
+récupérations peuvent attendre le PSM dans un seul thread.
+
+Comme PSMConnectionPool, le client garde les connexions ouvertes
+(keep-alive) : au plus max_size à la fois, les connexions au repos depuis
+plus de idle_timeout secondes ou fermées par le PSM étant écartées, et une
+requête sur une connexion réutilisée qui s'avère fermée est rejouée une
+fois sur une connexion neuve.
+
+EventLoopThread fait tourner une boucle asyncio dans un thread démon : le
+code synchrone (vues Flask WSGI) peut y exécuter des coroutines.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Coroutine
+from contextlib import suppress
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Erreurs indiquant qu'une connexion réutilisée a été fermée par le serveur.
+STALE_CONNECTION_ERRORS = (ConnectionError, asyncio.IncompleteReadError)
+
+
+class AsyncPSMClient:
+    """Client HTTP/1.1 asyncio vers un hôte, avec connexions persistantes.
+
+    Un client n'est utilisé que depuis une seule boucle asyncio.
+    """
+
+    def __init__(
+            self, host: str, port: int, max_size: int = 256,
+            idle_timeout: float = 30.0, timeout: float = 5.0
+            ) -> None:
+        """Crée un client sans connexion ; elles sont ouvertes à la demande.
+
+        Args :
+            host, port : adresse du PSM
+            max_size : nombre maximal de connexions ouvertes simultanément
+              (les requêtes suivantes attendent qu'une connexion se libère)
+            idle_timeout : durée (s) au-delà de laquelle une connexion
+              inutilisée est fermée au lieu d'être réutilisée
+            timeout : délai (s) de connexion, puis de réponse du PSM
+        """
+        self.host = host
+        self.port = port
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter, float]] = []
+        self._slots = asyncio.Semaphore(max_size)
+
+    # ---------------- Cycle de vie des connexions ----------------
+    async def _acquire(
+            self
+            ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter, bool]:
+        """Retourne une connexion saine : (lecteur, écrivain, réutilisée ?)."""
+        while self._idle:
+            reader, writer, last_used = self._idle.pop()
+            if (time.monotonic() - last_used <= self.idle_timeout
+                    and not reader.at_eof() and not writer.is_closing()):
+                self.reused += 1
+                return reader, writer, True
+            self._discard(writer)
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.timeout
+        )
+        self.created += 1
+        return reader, writer, False
+
+    def _discard(self, writer: asyncio.StreamWriter) -> None:
+        """Ferme une connexion retirée du pool."""
+        self.discarded += 1
+        with suppress(OSError, RuntimeError):
+            writer.close()
+
+    # ---------------- Requêtes ----------------
+    async def request(self, method: str, path: str) -> tuple[int, bytes]:
+        """Envoie une requête sur une connexion persistante.
+
+        Returns :
+            (code HTTP, corps de la réponse)
+
+        Raises :
+            OSError, TimeoutError, asyncio.IncompleteReadError, ValueError :
+            échec réseau, délai dépassé ou réponse HTTP invalide
+        """
+        async with self._slots:
+            while True:
+                reader, writer, reused = await self._acquire()
+                try:
+                    writer.write(
+                        f"{method} {path} HTTP/1.1\r\n"
+                        f"Host: {self.host}:{self.port}\r\n\r\n".encode("ascii")
+                    )
+                    status, body, keep_alive = await asyncio.wait_for(
+                        _read_response(reader), self.timeout
+                    )
+                except STALE_CONNECTION_ERRORS:
+                    self._discard(writer)
+                    if reused:
+                        continue
+                    raise
+                except BaseException:
+                    self._discard(writer)
+                    raise
+                if keep_alive:
+                    self._idle.append((reader, writer, time.monotonic()))
+                else:
+                    self._discard(writer)
+                return status, body
+
+    def close(self) -> None:
+        """Ferme toutes les connexions au repos."""
+        idle, self._idle = self._idle, []
+        for _, writer, _ in idle:
+            self._discard(writer)
+
+    def stats(self) -> dict[str, int]:
+        """Retourne un instantané des compteurs du client."""
+        return {
+            'idle': len(self._idle),
+            'max_size': self.max_size,
+            'created': self.created,
+            'reused': self.reused,
+            'discarded': self.discarded,
+        }
+
+
+async def _read_response(reader: asyncio.StreamReader) -> tuple[int, bytes, bool]:
+    """Lit une réponse HTTP/1.x ; retourne (code, corps, connexion réutilisable ?).
+
+    Le corps est délimité par Content-Length, par un codage "chunked", ou à
+    défaut par la fermeture de la connexion.
+    """
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("PSM closed the connection")
+    version, status, *_ = status_line.decode("latin-1").split(None, 2)
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    keep_alive = (version == "HTTP/1.1"
+                  and headers.get("connection", "").lower() != "close")
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        body = await _read_chunked(reader)
+    elif "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+    else:
+        body = await reader.read()
+        keep_alive = False
+    return int(status), body, keep_alive
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    """Lit un corps en codage "chunked" (taille hexadécimale, morceau, CRLF)."""
+    chunks = []
+    while True:
+        size = int((await reader.readline()).split(b";")[0], 16)
+        if size == 0:
+            # Fin du corps : en-têtes de fin éventuels, puis ligne vide.
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+
+
+class EventLoopThread:
+    """Boucle asyncio dans un thread démon, démarrée au premier appel."""
+
+    def __init__(self, name: str = "asyncio-loop") -> None:
+        """Prépare la boucle sans la démarrer."""
+        self.name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Boucle du thread, démarrée si besoin."""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name=self.name, daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def run(self, coroutine: Coroutine[Any, Any, T],
+            timeout: float | None = None) -> T:
+        """Exécute coroutine dans la boucle et attend son résultat.
+
+        Raises :
+            L'exception levée par la coroutine
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def stop(self) -> None:
+        """Arrête la boucle et attend la fin du thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
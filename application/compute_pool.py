@@ -0,0 +1,127 @@
+"""Exécution de la triangulation dans un pool de processus.
+
+Le moteur de triangulation est du calcul Python pur : dans un seul processus,
+il garde le GIL et bloque les autres threads du serveur Flask pendant tout
+le calcul. ComputePool répartit les calculs sur des processus persistants
+(`ProcessPoolExecutor`).
+
+Les coordonnées voyagent sous forme d'octets bruts (deux tampons `array`,
+abscisses puis ordonnées) et le résultat revient sous forme des octets du
+tableau d'indices `array('I')` : la sérialisation se réduit à des copies
+mémoire, sans aucun objet Python par point.
+"""
+
+import multiprocessing
+import threading
+from array import array
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from .engines import INCREMENTAL, triangulate
+from .spatial_order import BRIO
+from .types import Bounds, Coordinates
+
+
+def _triangulate_raw(
+        engine: str, order: str, typecode: str, xs: bytes, ys: bytes,
+        bounds: Bounds | None = None
+        ) -> bytes:
+    """Tâche exécutée dans un processus du pool.
+
+    Args :
+        engine, order : moteur et ordre d'insertion (voir engines.triangulate)
+        typecode : type des coordonnées ('f' ou 'd')
+        xs, ys : tampons bruts des abscisses et des ordonnées
+        bounds : boîte englobante des points, si elle est connue
+
+    Returns :
+        Octets du tableau plat array('I') des indices des triangles
+
+    Raises :
+        ValueError : Levée par le moteur, retransmise au processus appelant
+    """
+    return triangulate(
+        memoryview(xs).cast(typecode), memoryview(ys).cast(typecode),
+        engine, order, bounds,
+    ).tobytes()
+
+
+def _coordinates_bytes(coords: Coordinates, typecode: str) -> bytes:
+    """Retourne les octets bruts de coordonnées (tableau ou vue à pas)."""
+    if isinstance(coords, memoryview) and not coords.c_contiguous:
+        return array(typecode, coords).tobytes()
+    return bytes(coords)
+
+
+class ComputePool:
+    """Pool persistant de processus de triangulation.
+
+    Les processus sont démarrés au premier calcul (ou par `warm`) puis
+    réutilisés. La méthode de démarrage est "spawn" : le serveur Flask est
+    multi-thread, et un fork d'un processus multi-thread n'est pas sûr.
+    """
+
+    def __init__(self, workers: int) -> None:
+        """Prépare un pool de workers processus, sans les démarrer."""
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Retourne l'exécuteur, créé au premier appel."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def submit(
+            self, xs: Coordinates, ys: Coordinates, typecode: str,
+            engine: str = INCREMENTAL, order: str = BRIO,
+            bounds: Bounds | None = None
+            ) -> Future:
+        """Soumet une triangulation ; le Future donne les octets des indices."""
+        return self._get_executor().submit(
+            _triangulate_raw, engine, order, typecode,
+            _coordinates_bytes(xs, typecode), _coordinates_bytes(ys, typecode),
+            bounds,
+        )
+
+    def triangulate(
+            self, xs: Coordinates, ys: Coordinates, typecode: str,
+            engine: str = INCREMENTAL, order: str = BRIO,
+            bounds: Bounds | None = None
+            ) -> array:
+        """Triangule dans un processus du pool et attend le résultat.
+
+        Args :
+            xs, ys : coordonnées des points (array ou memoryview)
+            typecode : type des coordonnées ('f' ou 'd')
+            engine, order : moteur et ordre d'insertion (voir engines.triangulate)
+            bounds : boîte englobante des points, si elle est connue
+
+        Returns :
+            Tableau plat array('I') d'indices, identique à engines.triangulate
+
+        Raises :
+            ValueError : Levée par le moteur dans le processus de calcul
+        """
+        indices = array('I')
+        indices.frombytes(self.submit(xs, ys, typecode, engine, order, bounds).result())
+        return indices
+
+    def warm(self) -> None:
+        """Démarre tous les processus du pool et attend qu'ils soient prêts."""
+        executor = self._get_executor()
+        for future in [executor.submit(int) for _ in range(self.workers)]:
+            future.result()
+
+    def shutdown(self) -> None:
+        """Arrête les processus du pool (ils seront relancés au besoin)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
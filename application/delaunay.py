@@ -0,0 +1,283 @@
+"""Moteur de triangulation de Delaunay par diviser-pour-régner (Guibas-Stolfi).
+
+Le moteur suit l'algorithme de Guibas et Stolfi (1985) : les points sont triés
+selon (x, y), l'ensemble est coupé récursivement en deux moitiés, chaque moitié
+est triangulée puis les deux triangulations sont fusionnées en remontant la
+"couture" entre les deux enveloppes convexes. Le coût est en O(n log n).
+
+La structure quad-edge est réduite à sa partie primale : une arête orientée
+est un entier `e`, son arête symétrique est `e ^ 1`, et trois listes plates
+décrivent la topologie :
+- `org[e]`   : sommet d'origine de `e` (-1 si l'arête a été supprimée),
+- `onext[e]` : arête suivante autour de l'origine, sens trigonométrique,
+- `oprev[e]` : arête précédente autour de l'origine (inverse de `onext`).
+
+Les faces se déduisent de ces anneaux : `lnext(e) = oprev[e ^ 1]`.
+"""
+
+from array import array
+from collections.abc import Sequence
+
+from .predicates import IndexedPredicates
+
+EMPTY_INPUT = "Empty input."
+NOT_ENOUGH_POINTS = "Not enough Points : Input must contain at least 3 points."
+COLLINEAR_POINTS = "Collinear Points."
+
+# Taille minimale d'un sous-problème pour alterner l'axe de coupe.
+ALTERNATE_CUTS_MIN_SIZE = 32
+
+
+def delaunay_triangulate(xs: Sequence[float], ys: Sequence[float]) -> array:
+    """Réalise la triangulation de Delaunay d'un ensemble de points 2D.
+
+    Les points en double sont fusionnés : seul le premier (dans l'ordre de
+    tri) est utilisé comme sommet, les autres n'apparaissent dans aucun triangle.
+
+    Args :
+        xs : abscisses des points
+        ys : ordonnées des points (même longueur que xs)
+
+    Returns :
+        Tableau plat array('I') d'indices [a0, b0, c0, a1, b1, c1, ...].
+        Chaque triplet est un triangle orienté dans le sens trigonométrique ;
+        les indices référencent les positions dans xs / ys.
+
+    Raises :
+        ValueError : Ensemble vide, moins de 3 points distincts,
+        ou points tous alignés.
+    """
+    n = len(xs)
+    if n == 0:
+        raise ValueError(EMPTY_INPUT)
+    if n < 3:
+        raise ValueError(NOT_ENOUGH_POINTS)
+
+    # Tri lexicographique (x, y) : deux tris stables à clé native.
+    order = sorted(range(n), key=ys.__getitem__)
+    order.sort(key=xs.__getitem__)
+
+    # Sommets dans l'espace trié, sans doublons.
+    px: list[float] = []
+    py: list[float] = []
+    ids: list[int] = []
+    last_x = last_y = None
+    for i in order:
+        x = xs[i]
+        y = ys[i]
+        if x == last_x and y == last_y:
+            continue
+        px.append(x)
+        py.append(y)
+        ids.append(i)
+        last_x = x
+        last_y = y
+
+    if len(ids) < 3:
+        raise ValueError(NOT_ENOUGH_POINTS)
+
+    predicates = IndexedPredicates(px, py)
+    try:
+        org, onext, oprev = _build(px, py, predicates)
+        flat = _extract_triangles(org, onext, oprev, predicates)
+    finally:
+        predicates.record()
+    if not flat:
+        raise ValueError(COLLINEAR_POINTS)
+    return array('I', map(ids.__getitem__, flat))
+
+
+def _build(
+        px: list[float], py: list[float], predicates: IndexedPredicates
+        ) -> tuple[list[int], list[int], list[int]]:
+    """Construit la triangulation des points triés et retourne les anneaux."""
+    # ccw(a, b, c) > 0 si (a, b, c) est direct ; incircle(a, b, c, d) > 0 si
+    # d est strictement dans le cercle circonscrit de (a, b, c).
+    ccw = predicates.orient
+    incircle = predicates.incircle
+    m = len(px)
+    # Rangs des sommets selon chaque axe de coupe : (x, y) pour l'axe 0,
+    # (y, -x) pour l'axe 1 (rotation d'un quart de tour, qui conserve
+    # l'orientation et donc les prédicats).
+    by_y = sorted(reversed(range(m)), key=py.__getitem__)
+    rank_y = [0] * m
+    for r, v in enumerate(by_y):
+        rank_y[v] = r
+    rank = (range(m), rank_y)
+    perm = list(range(m))
+
+    org: list[int] = []
+    onext: list[int] = []
+    oprev: list[int] = []
+
+    def make_edge(a: int, b: int) -> int:
+        e = len(org)
+        org.append(a)
+        org.append(b)
+        onext.append(e)
+        onext.append(e + 1)
+        oprev.append(e)
+        oprev.append(e + 1)
+        return e
+
+    def splice(a: int, b: int) -> None:
+        an = onext[a]
+        bn = onext[b]
+        onext[a] = bn
+        onext[b] = an
+        oprev[bn] = a
+        oprev[an] = b
+
+    def connect(a: int, b: int) -> int:
+        # Nouvelle arête de dest(a) vers org(b), dans la face gauche de a.
+        e = make_edge(org[a ^ 1], org[b])
+        splice(e, oprev[a ^ 1])
+        splice(e ^ 1, b)
+        return e
+
+    def delete(e: int) -> None:
+        splice(e, oprev[e])
+        s = e ^ 1
+        splice(s, oprev[s])
+        org[e] = -1
+        org[s] = -1
+
+    def hull_extremes(e: int, key: Sequence[int]) -> tuple[int, int]:
+        # Parcourt l'enveloppe convexe à partir de l'arête e (intérieur à
+        # gauche) et retourne (arête directe issue du sommet de clé minimale,
+        # arête indirecte issue du sommet de clé maximale).
+        lo_e = hi_e = e
+        lo_k = hi_k = key[org[e]]
+        f = onext[e ^ 1]
+        while f != e:
+            k = key[org[f]]
+            if k < lo_k:
+                lo_e = f
+                lo_k = k
+            elif k > hi_k:
+                hi_e = f
+                hi_k = k
+            f = onext[f ^ 1]
+        return lo_e, oprev[hi_e]
+
+    def build(lo: int, hi: int, axis: int) -> tuple[int, int]:
+        # perm[lo:hi] est trié selon la clé de l'axe courant. Retourne
+        # (ldo, rdo) : arête de l'enveloppe issue du sommet de clé minimale
+        # (sens trigo.) et issue du sommet de clé maximale (sens horaire).
+        count = hi - lo
+        if count == 2:
+            a = make_edge(perm[lo], perm[lo + 1])
+            return a, a ^ 1
+        if count == 3:
+            s1 = perm[lo]
+            s2 = perm[lo + 1]
+            s3 = perm[lo + 2]
+            a = make_edge(s1, s2)
+            b = make_edge(s2, s3)
+            splice(a ^ 1, b)
+            det = ccw(s1, s2, s3)
+            if det > 0:
+                connect(b, a)
+                return a, b ^ 1
+            if det < 0:
+                c = connect(b, a)
+                return c ^ 1, c
+            return a, b ^ 1
+
+        mid = (lo + hi) // 2
+        if count >= ALTERNATE_CUTS_MIN_SIZE:
+            # Coupes alternées (Dwyer) : les deux moitiés sont triées selon
+            # l'autre axe, puis leurs enveloppes ramenées à l'axe courant.
+            other = 1 - axis
+            key = rank[axis]
+            other_key = rank[other]
+            half = perm[lo:mid]
+            half.sort(key=other_key.__getitem__)
+            perm[lo:mid] = half
+            half = perm[mid:hi]
+            half.sort(key=other_key.__getitem__)
+            perm[mid:hi] = half
+            ldo, ldi = hull_extremes(build(lo, mid, other)[0], key)
+            rdi, rdo = hull_extremes(build(mid, hi, other)[0], key)
+        else:
+            ldo, ldi = build(lo, mid, axis)
+            rdi, rdo = build(mid, hi, axis)
+
+        # Tangente inférieure commune aux deux enveloppes.
+        while True:
+            if ccw(org[rdi], org[ldi], org[ldi ^ 1]) > 0:
+                ldi = oprev[ldi ^ 1]
+            elif ccw(org[ldi], org[rdi ^ 1], org[rdi]) > 0:
+                rdi = onext[rdi ^ 1]
+            else:
+                break
+
+        basel = connect(rdi ^ 1, ldi)
+        if org[ldi] == org[ldo]:
+            ldo = basel ^ 1
+        if org[rdi] == org[rdo]:
+            rdo = basel
+
+        # Remontée de la couture.
+        while True:
+            bo = org[basel]
+            bd = org[basel ^ 1]
+
+            lcand = onext[basel ^ 1]
+            if ccw(org[lcand ^ 1], bd, bo) > 0:
+                while incircle(bd, bo, org[lcand ^ 1],
+                               org[onext[lcand] ^ 1]) > 0:
+                    t = onext[lcand]
+                    delete(lcand)
+                    lcand = t
+
+            rcand = oprev[basel]
+            if ccw(org[rcand ^ 1], bd, bo) > 0:
+                while incircle(bd, bo, org[rcand ^ 1],
+                               org[oprev[rcand] ^ 1]) > 0:
+                    t = oprev[rcand]
+                    delete(rcand)
+                    rcand = t
+
+            lvalid = ccw(org[lcand ^ 1], bd, bo) > 0
+            rvalid = ccw(org[rcand ^ 1], bd, bo) > 0
+            if not lvalid and not rvalid:
+                break
+            # En cas de cocircularité, le candidat droit est préféré.
+            if not lvalid or (rvalid and incircle(
+                    org[lcand ^ 1], org[lcand], org[rcand], org[rcand ^ 1]) >= 0):
+                basel = connect(rcand, basel ^ 1)
+            else:
+                basel = connect(basel ^ 1, lcand ^ 1)
+        return ldo, rdo
+
+    build(0, m, 0)
+    return org, onext, oprev
+
+
+def _extract_triangles(
+        org: list[int], onext: list[int], oprev: list[int],
+        predicates: IndexedPredicates
+        ) -> list[int]:
+    """Parcourt les faces gauches des arêtes et garde les triangles directs."""
+    ccw = predicates.orient
+    flat: list[int] = []
+    seen = bytearray(len(org))
+    for e in range(len(org)):
+        if seen[e] or org[e] < 0:
+            continue
+        e1 = oprev[e ^ 1]
+        e2 = oprev[e1 ^ 1]
+        if oprev[e2 ^ 1] != e:
+            # Face non triangulaire : la face extérieure.
+            seen[e] = 1
+            continue
+        seen[e] = seen[e1] = seen[e2] = 1
+        a = org[e]
+        b = org[e1]
+        c = org[e2]
+        if ccw(a, b, c) > 0:
+            flat.append(a)
+            flat.append(b)
+            flat.append(c)
+    return flat
@@ -0,0 +1,331 @@
+"""Cache disque des triangulations, sous le cache mémoire (ResultCache).
+
+Le cache mémoire est perdu à chaque redémarrage du Triangulateur : tous les
+PointSet déjà demandés sont alors récupérés et recalculés en même temps.
+DiskCache garde les Triangles binaires dans un répertoire, un fichier par
+résultat, nommé par l'empreinte (hexadécimale) du PointSet suivie de la
+version du cache : les fichiers d'une autre version (format des Triangles,
+moteur ou options de calcul différents) ne sont jamais lus.
+
+Chaque fichier est écrit dans un fichier temporaire du même répertoire puis
+renommé (`os.replace`) : un lecteur, ou un redémarrage après un arrêt
+brutal, ne voit jamais de fichier partiel. Un gros résultat peut être
+écrit morceau par morceau (put_chunks, ou tee_chunks pendant son envoi)
+et servi directement depuis son fichier (locate), sans jamais être
+entièrement en mémoire ; get, lui, lit le fichier entier, pour un résultat
+destiné au cache mémoire.
+
+La taille totale est bornée : les fichiers sont évincés du moins récemment
+lu au plus récent. La date de dernier accès est la date de modification du
+fichier, mise à jour à chaque lecture : elle ne dépend pas des options de
+montage (noatime, relatime) et retrouve l'ordre LRU au démarrage, lors du
+parcours du répertoire qui reconstruit l'index en mémoire.
+
+Plusieurs processus peuvent partager le répertoire : un fichier évincé par
+un autre processus est traité comme une absence. Chacun ne compte dans son
+budget que les fichiers qu'il connaît. Pendant un déploiement progressif,
+des processus de versions différentes partagent le répertoire : au
+démarrage, les fichiers d'une autre version sont ignorés, et supprimés
+seulement s'ils n'ont pas été lus depuis stale_after secondes (ils ne
+servent alors plus à aucun processus).
+"""
+
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from contextlib import suppress
+from typing import BinaryIO
+
+TEMP_PREFIX = ".tmp-"
+VERSION_SEPARATOR = "."
+STALE_AFTER = 24 * 3600.0
+
+
+class _TooLarge(Exception):
+    """Contenu plus gros que le budget, découvert pendant l'écriture."""
+
+
+class DiskCache:
+    """Cache LRU sur disque, borné en octets, utilisable depuis plusieurs threads.
+
+    Les erreurs d'écriture (disque plein, droits) ne sont pas levées : le
+    résultat n'est simplement pas mis en cache, et le compteur errors est
+    incrémenté.
+    """
+
+    def __init__(
+            self, directory: str, max_bytes: int, version: str = "",
+            stale_after: float = STALE_AFTER
+            ) -> None:
+        """Ouvre (ou crée) le répertoire du cache et indexe les fichiers présents.
+
+        Les fichiers temporaires laissés par un arrêt brutal sont supprimés,
+        ceux d'une autre version ignorés (voir stale_after) ; les fichiers
+        les moins récemment lus sont évincés si le répertoire dépasse
+        max_bytes.
+
+        Args :
+            directory : répertoire des fichiers du cache
+            max_bytes : taille totale maximale des fichiers
+            version : version des entrées, ajoutée au nom de chaque fichier
+            stale_after : durée (s) sans lecture au-delà de laquelle un
+              fichier d'une autre version est supprimé
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.version = version
+        self.stale_after = stale_after
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+        self._entries: OrderedDict[bytes, int] = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._scan()
+
+    def _path(self, key: bytes) -> str:
+        """Chemin du fichier associé à key."""
+        name = key.hex()
+        if self.version:
+            name += VERSION_SEPARATOR + self.version
+        return os.path.join(self.directory, name)
+
+    def _scan(self) -> None:
+        """Reconstruit l'index à partir du répertoire, dans l'ordre LRU."""
+        found = []
+        now = time.time()
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.startswith(TEMP_PREFIX):
+                    with suppress(OSError):
+                        os.unlink(entry.path)
+                    continue
+                name, _, version = entry.name.partition(VERSION_SEPARATOR)
+                try:
+                    key = bytes.fromhex(name)
+                except ValueError:
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                if version != self.version:
+                    # Résultat d'une autre version, peut-être encore lu par
+                    # un autre processus : supprimé seulement s'il ne l'est plus.
+                    if now - stat.st_mtime > self.stale_after:
+                        with suppress(OSError):
+                            os.unlink(entry.path)
+                    continue
+                found.append((stat.st_mtime_ns, key, stat.st_size))
+        found.sort()
+        with self._lock:
+            for _, key, size in found:
+                self._entries[key] = size
+                self.current_bytes += size
+            self._evict()
+
+    def locate(self, key: bytes) -> tuple[str, int] | None:
+        """Retourne le chemin et la taille du fichier de key (marqué récent), ou None.
+
+        Le fichier est cherché même si key n'est pas dans l'index : il a pu
+        être écrit par un autre processus partageant le répertoire. Il peut
+        être évincé avant d'être ouvert : l'appelant traite alors l'erreur
+        d'ouverture comme une absence.
+        """
+        path = self._path(key)
+        try:
+            size = os.stat(path).st_size
+            os.utime(path)
+        except OSError:
+            # Absent, ou évincé entre-temps (par ce processus ou un autre).
+            self._forget(key)
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            else:
+                self._entries[key] = size
+                self.current_bytes += size
+                self._evict()
+        return path, size
+
+    def get(self, key: bytes) -> bytes | None:
+        """Retourne le contenu associé à key (et le marque récent), ou None.
+
+        Le fichier est lu en entier : pour un gros contenu, locate donne le
+        chemin du fichier, à envoyer ou projeter (mmap) sans le lire.
+        """
+        located = self.locate(key)
+        if located is None:
+            return None
+        path, _ = located
+        try:
+            with open(path, "rb") as file:
+                return file.read()
+        except OSError:
+            self._forget(key)
+            return None
+
+    def put(self, key: bytes, value: bytes) -> None:
+        """Écrit ou remplace une entrée, puis évince pour respecter le budget."""
+        if len(value) <= self.max_bytes:
+            self.put_chunks(key, (value,))
+
+    def put_chunks(self, key: bytes, chunks: Iterable[bytes]) -> str | None:
+        """Écrit une entrée morceau par morceau, puis évince pour respecter le budget.
+
+        Args :
+            key : clé de l'entrée
+            chunks : contenu, en morceaux consommés un à un
+
+        Returns :
+            Chemin du fichier écrit, ou None s'il n'a pas été gardé (contenu
+            plus gros que le budget, ou erreur d'écriture)
+        """
+        path = self._path(key)
+        size = 0
+        try:
+            fd, temp_path = tempfile.mkstemp(prefix=TEMP_PREFIX, dir=self.directory)
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    for chunk in chunks:
+                        file.write(chunk)
+                        size += len(chunk)
+                        if size > self.max_bytes:
+                            raise _TooLarge
+                os.replace(temp_path, path)
+            except BaseException:
+                with suppress(OSError):
+                    os.unlink(temp_path)
+                raise
+        except _TooLarge:
+            return None
+        except OSError:
+            with self._lock:
+                self.errors += 1
+            return None
+        self._add(key, size)
+        return path
+
+    def tee_chunks(self, key: bytes, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Transmet les morceaux de chunks en les écrivant dans l'entrée key.
+
+        Chaque morceau est écrit puis transmis, sans être gardé en mémoire.
+        L'entrée n'est gardée que si tous les morceaux ont été transmis : un
+        itérateur fermé avant la fin (client déconnecté), un contenu plus
+        gros que le budget ou une erreur d'écriture n'écrivent rien, sans
+        interrompre la transmission.
+
+        Args :
+            key : clé de l'entrée
+            chunks : contenu, en morceaux consommés un à un
+
+        Returns :
+            Itérateur sur les morceaux de chunks
+        """
+        try:
+            fd, temp_path = tempfile.mkstemp(prefix=TEMP_PREFIX, dir=self.directory)
+        except OSError:
+            with self._lock:
+                self.errors += 1
+            yield from chunks
+            return
+        file = os.fdopen(fd, "wb")
+        size = 0
+        kept = True
+        try:
+            for chunk in chunks:
+                if kept:
+                    size += len(chunk)
+                    kept = size <= self.max_bytes and self._write(file, chunk)
+                yield chunk
+            if kept:
+                try:
+                    file.close()
+                    os.replace(temp_path, self._path(key))
+                except OSError:
+                    with self._lock:
+                        self.errors += 1
+                else:
+                    self._add(key, size)
+        finally:
+            with suppress(OSError):
+                file.close()
+            with suppress(OSError):
+                os.unlink(temp_path)
+
+    def _write(self, file: BinaryIO, chunk: bytes) -> bool:
+        """Écrit chunk dans file ; False (erreur comptée) si l'écriture échoue."""
+        try:
+            file.write(chunk)
+        except OSError:
+            with self._lock:
+                self.errors += 1
+            return False
+        return True
+
+    def _add(self, key: bytes, size: int) -> None:
+        """Indexe le fichier écrit pour key, puis évince pour respecter le budget."""
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous
+            self._entries[key] = size
+            self.current_bytes += size
+            self._evict()
+
+    def _evict(self) -> None:
+        """Supprime les fichiers les moins récents au-delà du budget (verrou tenu)."""
+        while self.current_bytes > self.max_bytes:
+            old_key, old_size = self._entries.popitem(last=False)
+            self.current_bytes -= old_size
+            self.evictions += 1
+            with suppress(OSError):
+                os.unlink(self._path(old_key))
+
+    def _forget(self, key: bytes) -> None:
+        """Retire key de l'index, sans toucher au répertoire."""
+        with self._lock:
+            size = self._entries.pop(key, None)
+            if size is not None:
+                self.current_bytes -= size
+
+    def clear(self) -> None:
+        """Supprime tous les fichiers du cache et remet les compteurs à zéro."""
+        with self._lock:
+            for key in self._entries:
+                with suppress(OSError):
+                    os.unlink(self._path(key))
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = self.misses = self.evictions = self.errors = 0
+
+    def stats(self) -> dict[str, int]:
+        """Retourne un instantané des compteurs et de l'occupation."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'errors': self.errors,
+            }
+
+    def __contains__(self, key: object) -> bool:
+        """Indique si key est en cache, sans modifier l'ordre LRU ni les compteurs."""
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        """Nombre d'entrées en cache."""
+        return len(self._entries)
@@ -0,0 +1,49 @@
+"""Choix du moteur de triangulation de Delaunay.
+
+- DIVIDE_AND_CONQUER : diviser-pour-régner de Guibas-Stolfi (module `delaunay`).
+- INCREMENTAL : insertion incrémentale avec bascules (module `incremental`),
+  dans un ordre spatial au choix (module `spatial_order`).
+
+Les deux moteurs ont la même interface : coordonnées en entrée, tableau plat
+array('I') de triangles directs en sortie, indices dans l'ordre d'entrée.
+"""
+
+from array import array
+from collections.abc import Sequence
+
+from .delaunay import delaunay_triangulate
+from .incremental import incremental_triangulate
+from .spatial_order import BRIO
+from .types import Bounds
+
+DIVIDE_AND_CONQUER = "divide_and_conquer"
+INCREMENTAL = "incremental"
+ENGINES = (DIVIDE_AND_CONQUER, INCREMENTAL)
+
+
+def triangulate(
+        xs: Sequence[float], ys: Sequence[float],
+        engine: str = INCREMENTAL, order: str = BRIO,
+        bounds: Bounds | None = None
+        ) -> array:
+    """Réalise la triangulation de Delaunay avec le moteur demandé.
+
+    Args :
+        xs, ys : coordonnées des points
+        engine : moteur (voir ENGINES)
+        order : ordre d'insertion du moteur incrémental
+          (voir spatial_order.SPATIAL_ORDERS), ignoré par l'autre moteur
+        bounds : boîte englobante des points, si elle est déjà connue
+          (moteur incrémental)
+
+    Returns :
+        Tableau plat array('I') d'indices de triangles directs
+
+    Raises :
+        ValueError : Moteur inconnu, ou échec de la triangulation
+    """
+    if engine == INCREMENTAL:
+        return incremental_triangulate(xs, ys, order, bounds=bounds)
+    if engine == DIVIDE_AND_CONQUER:
+        return delaunay_triangulate(xs, ys)
+    raise ValueError(f"Unknown triangulation engine {engine!r}")
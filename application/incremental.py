@@ -0,0 +1,310 @@
+"""Moteur de triangulation de Delaunay incrémental (insertion et bascules).
+
+Les points sont insérés un à un, dans un ordre spatial (module
+`spatial_order`) : le triangle qui contient le nouveau point est localisé
+(module `point_location`) par une marche depuis le dernier triangle créé,
+éventuellement précédée d'un saut, il est découpé en trois
+(ou l'arête qui porte le point en quatre), puis la propriété de Delaunay
+est rétablie par bascules d'arêtes (algorithme de Lawson).
+
+Le maillage (module `mesh`) est fermé par des triangles "fantômes" :
+chaque arête de l'enveloppe convexe est bordée, à l'extérieur, d'un
+triangle dont le troisième sommet est le sommet à l'infini INF. Un point
+hors de l'enveloppe est donc toujours dans un triangle (fantôme), et
+l'insertion n'a pas de cas particulier.
+"""
+
+from array import array
+from collections.abc import Sequence
+
+from .delaunay import COLLINEAR_POINTS, EMPTY_INPUT, NOT_ENOUGH_POINTS
+from .mesh import INF, HalfEdgeMesh
+from .point_location import IN_TRIANGLE, LOCATION_STATS, ON_EDGE, PointLocator
+from .predicates import IndexedPredicates
+from .spatial_order import BRIO, NO_ORDER, spatial_order
+from .types import Bounds
+
+
+def incremental_triangulate(
+        xs: Sequence[float], ys: Sequence[float], order: str = BRIO,
+        jump: bool | None = None, bounds: Bounds | None = None
+        ) -> array:
+    """Réalise la triangulation de Delaunay par insertion incrémentale.
+
+    Les points sont recopiés dans l'ordre d'insertion (localité mémoire),
+    puis les indices du résultat sont ramenés à l'ordre d'entrée. Parmi des
+    points en double, seul celui de plus petit indice apparaît dans les
+    triangles.
+
+    Args :
+        xs : abscisses des points
+        ys : ordonnées des points (même longueur que xs)
+        order : ordre d'insertion (voir spatial_order.SPATIAL_ORDERS)
+        jump : saut avant chaque marche de localisation ; par défaut (None),
+          seulement sans ordre spatial (NO_ORDER), où les points consécutifs
+          ne sont pas voisins
+        bounds : boîte englobante des points, si elle est déjà connue
+          (évite de la recalculer pour l'ordre spatial)
+
+    Returns :
+        Tableau plat array('I') d'indices [a0, b0, c0, a1, b1, c1, ...],
+        chaque triangle orienté dans le sens trigonométrique.
+
+    Raises :
+        ValueError : Ensemble vide, moins de 3 points distincts, points tous
+        alignés ou ordre d'insertion inconnu.
+    """
+    n = len(xs)
+    if n == 0:
+        raise ValueError(EMPTY_INPUT)
+    if n < 3:
+        raise ValueError(NOT_ENOUGH_POINTS)
+
+    ids = list(spatial_order(xs, ys, order, bounds))
+    px = [xs[i] for i in ids]
+    py = [ys[i] for i in ids]
+    if jump is None:
+        jump = order == NO_ORDER
+    triangulation = _Triangulation(px, py, ids, jump)
+    try:
+        mesh = triangulation.run()
+    finally:
+        locator = triangulation.locator
+        LOCATION_STATS.record(locator.insertions, locator.steps, locator.jumps)
+        triangulation.predicates.record()
+    return mesh.triangles(ids)
+
+
+class IncrementalMesh:
+    """Triangulation de Delaunay déjà calculée, qui accepte de nouveaux points.
+
+    Le maillage est reconstruit une fois à partir des triangles d'un moteur,
+    puis n'est plus modifié : chaque appel à insert_points travaille sur une
+    copie (tableaux recopiés en bloc). Un même IncrementalMesh peut donc
+    servir, depuis plusieurs threads, à plusieurs insertions indépendantes.
+    """
+
+    __slots__ = ('px', 'py', 'indices', 'mesh')
+
+    def __init__(
+            self, xs: Sequence[float], ys: Sequence[float], indices: array
+            ) -> None:
+        """Reconstruit le maillage des triangles indices sur les points xs, ys.
+
+        Args :
+            xs, ys : coordonnées des points de la triangulation
+            indices : tableau plat array('I') de ses triangles directs
+
+        Raises :
+            ValueError : Aucun triangle, ou triangles qui ne forment pas une
+            triangulation (voir HalfEdgeMesh.from_triangles)
+        """
+        self.px = array('d', xs)
+        self.py = array('d', ys)
+        self.indices = indices
+        self.mesh = HalfEdgeMesh.from_triangles(len(self.px), indices)
+
+    @property
+    def nbytes(self) -> int:
+        """Mémoire occupée par les coordonnées, les triangles et le maillage."""
+        return (self.mesh.nbytes
+                + (len(self.px) + len(self.py)) * self.px.itemsize
+                + len(self.indices) * self.indices.itemsize)
+
+    def insert_points(self, xs: Sequence[float], ys: Sequence[float]) -> array:
+        """Insère les points xs, ys et retourne la triangulation de l'ensemble.
+
+        Le i-ème point inséré a l'indice n + i (n points de départ). Chaque
+        point est localisé par un saut puis une marche, et inséré avec
+        bascules : le travail fait en Python dépend du nombre de points
+        insérés, pas de n. Un triangle modifié par une insertion a toujours le
+        point inséré pour sommet : seuls les triangles des étoiles des
+        nouveaux sommets sont réécrits dans une copie des triangles de départ.
+        Comme pour incremental_triangulate, un point en double n'est pas
+        inséré (le sommet de plus petit indice est gardé).
+
+        Returns :
+            Tableau plat array('I') des triangles directs ; ceux qui ne sont
+            pas modifiés gardent leur position, sauf les derniers, déplacés
+            dans les places libérées quand il y en a plus que de nouveaux
+            triangles
+        """
+        n = len(self.px)
+        k = len(xs)
+        if k == 0:
+            return array('I', self.indices)
+        px = self.px + array('d', xs)
+        py = self.py + array('d', ys)
+        mesh = self.mesh.copy(n + k)
+        triangulation = _Triangulation(px, py, None, jump=True, mesh=mesh)
+        insert = triangulation.insert
+        try:
+            for p in range(n, n + k):
+                insert(p)
+        finally:
+            locator = triangulation.locator
+            LOCATION_STATS.record(locator.insertions, locator.steps, locator.jumps)
+            triangulation.predicates.record()
+
+        changed: set[int] = set()
+        vertex_edge = mesh.vertex_edge
+        for p in range(n, n + k):
+            if vertex_edge[p] >= 0:
+                changed.update(mesh.star(p))
+        return self._updated_triangles(mesh, changed)
+
+    def _updated_triangles(self, mesh: HalfEdgeMesh, changed: set[int]) -> array:
+        """Recopie les triangles de départ et y reporte les triangles changed.
+
+        Les triangles de départ occupent les emplacements 0 à T - 1 du
+        maillage : un emplacement réel y est réécrit sur place ; un
+        emplacement devenu fantôme laisse une place, reprise par un triangle
+        réel d'un emplacement suivant, les autres étant ajoutés à la fin.
+        Les places restantes sont comblées par les derniers triangles du
+        tableau, déplacés un à un (en O(1) chacun), et le tableau raccourci.
+        """
+        vertex = mesh.vertex
+        flat = array('I', self.indices)
+        base_count = len(flat) // 3
+        holes = []
+        added = []
+        for t in sorted(changed):
+            e = 3 * t
+            a = vertex[e]
+            b = vertex[e + 1]
+            c = vertex[e + 2]
+            if a == INF or b == INF or c == INF:
+                if t < base_count:
+                    holes.append(e)
+            elif t < base_count:
+                flat[e] = a
+                flat[e + 1] = b
+                flat[e + 2] = c
+            else:
+                added.append((a, b, c))
+        for e, (a, b, c) in zip(holes, added, strict=False):
+            flat[e] = a
+            flat[e + 1] = b
+            flat[e + 2] = c
+        for a, b, c in added[len(holes):]:
+            flat.append(a)
+            flat.append(b)
+            flat.append(c)
+        # Plus de places que de triangles ajoutés : chacune reçoit le dernier
+        # triangle du tableau, sauf si c'est lui-même une place, retirée.
+        spare = holes[len(added):]
+        first, last = 0, len(spare) - 1
+        end = len(flat)
+        while first <= last:
+            end -= 3
+            if spare[last] == end:
+                last -= 1
+            else:
+                e = spare[first]
+                flat[e:e + 3] = flat[end:end + 3]
+                first += 1
+        del flat[end:]
+        return flat
+
+
+class _Triangulation:
+    """État d'une triangulation incrémentale en cours de construction."""
+
+    def __init__(
+            self, px: Sequence[float], py: Sequence[float], ids: list[int] | None,
+            jump: bool = False, mesh: HalfEdgeMesh | None = None
+            ) -> None:
+        self.px = px
+        self.py = py
+        # None : les indices sont ceux d'origine (un point en double inséré
+        # après coup a toujours un indice plus grand que le sommet présent).
+        self.ids = ids
+        self.mesh = HalfEdgeMesh(len(px)) if mesh is None else mesh
+        self.last = 0
+        # Prédicats robustes sur les indices : orient(a, b, c) > 0 si le
+        # triangle est direct, incircle(a, b, c, d) > 0 si d est dans le
+        # cercle circonscrit de (a, b, c).
+        self.predicates = IndexedPredicates(px, py)
+        self.orient = self.predicates.orient
+        self.incircle = self.predicates.incircle
+        mesh = self.mesh
+        self.locator = PointLocator(
+            px, py, mesh.vertex, mesh.twin, mesh.vertex_edge, self.orient, jump
+        )
+
+    def run(self) -> HalfEdgeMesh:
+        """Insère tous les points et retourne le maillage."""
+        m = len(self.px)
+        px = self.px
+        py = self.py
+        # Premier triangle : deux points distincts puis un point non aligné.
+        second = 1
+        while second < m and px[second] == px[0] and py[second] == py[0]:
+            second += 1
+        third = second + 1
+        while third < m and self.orient(0, second, third) == 0:
+            third += 1
+        if third >= m:
+            distinct = {(x, y) for x, y in zip(px, py, strict=True)}
+            raise ValueError(
+                NOT_ENOUGH_POINTS if len(distinct) < 3 else COLLINEAR_POINTS
+            )
+        if self.orient(0, second, third) < 0:
+            second, third = third, second
+        self.mesh.first_triangle(0, second, third)
+
+        insert = self.insert
+        for p in range(1, m):
+            if p != second and p != third:
+                insert(p)
+        return self.mesh
+
+    def insert(self, p: int) -> None:
+        """Insère le point p et rétablit la propriété de Delaunay."""
+        kind, where = self.locator.locate(p, self.last)
+        mesh = self.mesh
+        if kind == IN_TRIANGLE:
+            self.last = where
+            self.legalize(p, mesh.split_triangle(where, p))
+        elif kind == ON_EDGE:
+            self.last = where // 3
+            self.legalize(p, mesh.split_edge(where, p))
+        else:
+            # Point en double : le sommet garde le plus petit indice d'origine.
+            ids = self.ids
+            if ids is not None and ids[p] < ids[where]:
+                ids[where] = ids[p]
+
+    def legalize(self, p: int, stack: list[int]) -> None:
+        """Bascule les arêtes opposées à p tant qu'elles ne sont pas de Delaunay.
+
+        Pour une arête vers INF, la bascule a lieu si elle rend l'enveloppe
+        convexe ; une arête de l'enveloppe (voisin fantôme) n'est jamais basculée.
+        """
+        mesh = self.mesh
+        vertex = mesh.vertex
+        twin = mesh.twin
+        flip = mesh.flip
+        orient = self.orient
+        incircle = self.incircle
+        while stack:
+            h = stack.pop()
+            # Triangle (u, v, p) de demi-arêtes h, h1, h2 ;
+            # voisin (v, u, d) de demi-arêtes g, g1, g2.
+            u = vertex[h]
+            v = vertex[h - 2 if h % 3 == 2 else h + 1]
+            g = twin[h]
+            d = vertex[g + 2 if g % 3 == 0 else g - 1]
+            if u == INF:
+                legal = orient(d, v, p) <= 0
+            elif v == INF:
+                legal = orient(u, d, p) <= 0
+            elif d == INF:
+                legal = True
+            else:
+                legal = incircle(u, v, p, d) <= 0
+            if legal:
+                continue
+            # Bascule : (u, d, p) en h, h1, h2 et (d, v, p) en g, g1, g2.
+            stack.append(h)
+            stack.append(flip(h))
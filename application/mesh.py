@@ -0,0 +1,377 @@
+"""Maillage triangulaire par demi-arêtes, en tableaux plats array('i').
+
+Le triangle t possède les demi-arêtes 3t, 3t + 1 et 3t + 2 (« corner
+table ») :
+- `vertex[h]` : sommet d'origine de la demi-arête h ; h va de `vertex[h]`
+  au sommet de `next(h)` ;
+- `twin[h]` : demi-arête opposée, dans le triangle voisin (`twin[h] // 3`) ;
+- `next(h)` et `prev(h)` se calculent (h reste dans son triangle) : pas de
+  troisième tableau, ni de recherche.
+- `vertex_edge[v]` : une demi-arête issue du sommet v (-1 si v n'est pas
+  dans le maillage).
+
+Le maillage est fermé par des triangles « fantômes » : chaque arête de
+l'enveloppe convexe est bordée, à l'extérieur, d'un triangle dont le
+troisième sommet est le sommet à l'infini INF.
+
+Un entier de tableau occupe 4 octets, contre 8 (pointeur) plus 28 (objet
+int) dans une liste : un triangle coûte 24 octets (3 demi-arêtes), au lieu
+de 150 environ. La capacité est réservée d'avance : n sommets donnent au
+plus 2n - 2 triangles, fantômes compris.
+"""
+
+import operator
+from array import array
+from collections.abc import Sequence
+from itertools import repeat
+
+from .types import Triangles_Array, Triangles_Geom
+
+INF = -1
+
+NOT_A_TRIANGULATION = "Not a triangulation : edges are not shared by two triangles"
+
+
+class HalfEdgeMesh:
+    """Maillage de demi-arêtes à triangles fantômes, sur n sommets au plus.
+
+    Voisinage, bascule et découpes se font en temps constant ; les
+    triangles réels ne sont convertis (`triangles`, `to_geom`) qu'à la fin.
+    """
+
+    __slots__ = ('vertex', 'twin', 'vertex_edge', 'size')
+
+    def __init__(self, vertex_count: int) -> None:
+        """Réserve la place des triangles de vertex_count sommets."""
+        capacity = 3 * max(2 * vertex_count - 2, 4)
+        zeros = bytes(4 * capacity)
+        self.vertex = array('i', zeros)
+        self.twin = array('i', zeros)
+        # Une case de plus : vertex_edge[INF] reçoit les écritures pour INF.
+        self.vertex_edge = array('i', [-1]) * (vertex_count + 1)
+        # Nombre de demi-arêtes utilisées.
+        self.size = 0
+
+    @classmethod
+    def from_triangles(cls, vertex_count: int, indices: array) -> "HalfEdgeMesh":
+        """Reconstruit le maillage d'une triangulation déjà calculée.
+
+        Les triangles réels occupent, dans l'ordre, les emplacements 0 à T - 1 ;
+        les triangles fantômes de l'enveloppe suivent. Les jumeaux sont
+        retrouvés par un dictionnaire des demi-arêtes construit en C (map, zip) :
+        seules les arêtes de l'enveloppe sont parcourues en Python.
+
+        Args :
+            vertex_count : nombre de sommets (indices de 0 à vertex_count - 1)
+            indices : tableau plat array('I') de triangles directs, formant une
+              triangulation d'un domaine convexe (celle d'un moteur)
+
+        Raises :
+            ValueError : Une arête n'est pas partagée par deux triangles
+            (voisins ou fantôme), ou l'enveloppe n'est pas un cycle simple
+        """
+        size = len(indices)
+        if size == 0 or size % 3:
+            raise ValueError(NOT_A_TRIANGULATION)
+        mesh = cls(vertex_count)
+        origins = array('i', indices.tobytes())
+        # Demi-arête h : origins[h] -> destinations[h], dans son triangle.
+        destinations = array('i', origins)
+        destinations[0::3] = origins[1::3]
+        destinations[1::3] = origins[2::3]
+        destinations[2::3] = origins[0::3]
+        stride = repeat(vertex_count + 1)
+        edges = dict(zip(
+            map(operator.add, map(operator.mul, origins, stride), destinations),
+            range(size),
+            strict=True,
+        ))
+        if len(edges) != size:
+            raise ValueError(NOT_A_TRIANGULATION)
+        twin = array('i', map(
+            edges.get,
+            map(operator.add, map(operator.mul, destinations, stride), origins),
+            repeat(-1),
+        ))
+        del edges
+
+        # Arêtes de l'enveloppe (sans jumeau) : un triangle fantôme chacune.
+        vertex = mesh.vertex
+        leaving: dict[int, int] = {}
+        entering: dict[int, int] = {}
+        g = size
+        h = -1
+        while True:
+            try:
+                h = twin.index(-1, h + 1, size)
+            except ValueError:
+                break
+            if g + 3 > len(vertex):
+                raise ValueError(NOT_A_TRIANGULATION)
+            a = origins[h]
+            b = destinations[h]
+            vertex[g] = b
+            vertex[g + 1] = a
+            vertex[g + 2] = INF
+            twin[h] = g
+            twin.append(h)
+            twin.append(-1)
+            twin.append(-1)
+            if a in leaving or b in entering:
+                raise ValueError(NOT_A_TRIANGULATION)
+            leaving[a] = g + 1      # a -> INF
+            entering[b] = g + 2     # INF -> b
+            g += 3
+        if leaving.keys() != entering.keys():
+            raise ValueError(NOT_A_TRIANGULATION)
+        for v, out in leaving.items():
+            twin[out] = entering[v]
+            twin[entering[v]] = out
+
+        vertex[0:size] = origins
+        mesh.twin[0:g] = twin
+        # Une demi-arête issue de chaque sommet (la dernière trouvée).
+        out_edge = dict(zip(origins, range(size), strict=True))
+        mesh.vertex_edge[0:vertex_count] = array(
+            'i', map(out_edge.get, range(vertex_count), repeat(-1))
+        )
+        mesh.size = g
+        return mesh
+
+    def copy(self, vertex_count: int | None = None) -> "HalfEdgeMesh":
+        """Retourne une copie indépendante, agrandie pour vertex_count sommets.
+
+        Les tableaux sont recopiés en bloc : les emplacements des triangles
+        et des demi-arêtes sont conservés.
+        """
+        old_count = len(self.vertex_edge) - 1
+        if vertex_count is None or vertex_count < old_count:
+            vertex_count = old_count
+        clone = type(self).__new__(type(self))
+        extra = bytes(4 * (3 * max(2 * vertex_count - 2, 4) - len(self.vertex)))
+        clone.vertex = self.vertex + array('i', extra)
+        clone.twin = self.twin + array('i', extra)
+        clone.vertex_edge = (self.vertex_edge[:old_count]
+                             + array('i', [-1]) * (vertex_count - old_count + 1))
+        clone.size = self.size
+        return clone
+
+    def star(self, v: int) -> list[int]:
+        """Retourne les triangles (fantômes compris) qui ont le sommet v.
+
+        Le sommet doit être dans le maillage (vertex_edge[v] >= 0).
+        """
+        twin = self.twin
+        start = h = self.vertex_edge[v]
+        triangles = []
+        while True:
+            triangles.append(h // 3)
+            # Demi-arête suivante issue de v : jumelle de la précédente de h.
+            h = twin[h + 2 if h % 3 == 0 else h - 1]
+            if h == start:
+                return triangles
+
+    @staticmethod
+    def next(h: int) -> int:
+        """Demi-arête suivante dans le triangle de h."""
+        return h - 2 if h % 3 == 2 else h + 1
+
+    @staticmethod
+    def prev(h: int) -> int:
+        """Demi-arête précédente dans le triangle de h."""
+        return h + 2 if h % 3 == 0 else h - 1
+
+    def neighbour(self, h: int) -> int:
+        """Triangle voisin de l'autre côté de la demi-arête h."""
+        return self.twin[h] // 3
+
+    def is_ghost(self, t: int) -> bool:
+        """Vrai si le triangle t a le sommet à l'infini INF."""
+        vertex = self.vertex
+        return INF in (vertex[3 * t], vertex[3 * t + 1], vertex[3 * t + 2])
+
+    @property
+    def triangle_count(self) -> int:
+        """Nombre de triangles, fantômes compris."""
+        return self.size // 3
+
+    @property
+    def nbytes(self) -> int:
+        """Mémoire occupée par les tableaux, capacité réservée comprise."""
+        return (self.vertex.buffer_info()[1] + self.twin.buffer_info()[1]
+                + self.vertex_edge.buffer_info()[1]) * self.vertex.itemsize
+
+    def first_triangle(self, a: int, b: int, c: int) -> None:
+        """Crée le triangle direct (a, b, c) et ses trois triangles fantômes."""
+        self.vertex[0:12] = array('i', (a, b, c, b, a, INF, c, b, INF, a, c, INF))
+        # Arêtes réelles : 0 (a->b) / 3 (b->a), 1 (b->c) / 6, 2 (c->a) / 9.
+        # Arêtes vers INF : 4 (a->INF) / 11, 7 (b->INF) / 5, 10 (c->INF) / 8.
+        self.twin[0:12] = array('i', (3, 6, 9, 0, 11, 7, 1, 5, 10, 2, 8, 4))
+        vertex_edge = self.vertex_edge
+        vertex_edge[a] = 0
+        vertex_edge[b] = 1
+        vertex_edge[c] = 2
+        self.size = 12
+
+    def split_triangle(self, t: int, p: int) -> list[int]:
+        """Découpe le triangle t (a, b, c) en trois autour du sommet p.
+
+        t devient (a, b, p) ; (b, c, p) et (c, a, p) sont ajoutés.
+
+        Returns :
+            Les trois demi-arêtes opposées à p
+        """
+        vertex = self.vertex
+        twin = self.twin
+        e0 = 3 * t
+        e1 = e0 + 1
+        e2 = e0 + 2
+        b = vertex[e1]
+        c = vertex[e2]
+        f0 = self.size
+        k0 = f0 + 3
+        te1 = twin[e1]
+        te2 = twin[e2]
+        vertex[e2] = p
+        vertex[f0] = b
+        vertex[f0 + 1] = c
+        vertex[f0 + 2] = p
+        vertex[k0] = c
+        vertex[k0 + 1] = vertex[e0]
+        vertex[k0 + 2] = p
+        twin[f0] = te1
+        twin[f0 + 1] = k0 + 2
+        twin[f0 + 2] = e1
+        twin[k0] = te2
+        twin[k0 + 1] = e2
+        twin[k0 + 2] = f0 + 1
+        twin[te1] = f0
+        twin[te2] = k0
+        twin[e1] = f0 + 2
+        twin[e2] = k0 + 1
+        vertex_edge = self.vertex_edge
+        vertex_edge[c] = f0 + 1
+        vertex_edge[p] = e2
+        self.size = k0 + 3
+        return [e0, f0, k0]
+
+    def split_edge(self, h: int, p: int) -> list[int]:
+        """Découpe l'arête h (u -> v) et ses deux triangles en quatre autour de p.
+
+        (u, v, w) devient (u, p, w) et (p, v, w) est ajouté ;
+        (v, u, d) devient (v, p, d) et (p, u, d) est ajouté.
+
+        Returns :
+            Les quatre demi-arêtes opposées à p
+        """
+        vertex = self.vertex
+        twin = self.twin
+        k = h % 3
+        h1 = h - 2 if k == 2 else h + 1
+        h2 = h + 2 if k == 0 else h - 1
+        g = twin[h]
+        k = g % 3
+        g1 = g - 2 if k == 2 else g + 1
+        g2 = g + 2 if k == 0 else g - 1
+        u = vertex[h]
+        v = vertex[g]
+        x0 = self.size
+        y0 = x0 + 3
+        th1 = twin[h1]
+        tg1 = twin[g1]
+        vertex[h1] = p
+        vertex[g1] = p
+        vertex[x0] = p
+        vertex[x0 + 1] = v
+        vertex[x0 + 2] = vertex[h2]
+        vertex[y0] = p
+        vertex[y0 + 1] = u
+        vertex[y0 + 2] = vertex[g2]
+        twin[x0] = g
+        twin[x0 + 1] = th1
+        twin[x0 + 2] = h1
+        twin[y0] = h
+        twin[y0 + 1] = tg1
+        twin[y0 + 2] = g1
+        twin[th1] = x0 + 1
+        twin[tg1] = y0 + 1
+        twin[h] = y0
+        twin[g] = x0
+        twin[h1] = x0 + 2
+        twin[g1] = y0 + 2
+        vertex_edge = self.vertex_edge
+        vertex_edge[v] = x0 + 1
+        vertex_edge[u] = y0 + 1
+        vertex_edge[p] = h1
+        self.size = y0 + 3
+        return [h2, x0 + 1, g2, y0 + 1]
+
+    def flip(self, h: int) -> int:
+        """Bascule l'arête h, diagonale du quadrilatère (u, d, v, p).
+
+        Avant : (u, v, p) en h, h1, h2 et (v, u, d) en g, g1, g2 (g = twin[h]).
+        Après : (u, d, p) en h, h1, h2 et (d, v, p) en g, g1, g2.
+
+        Returns :
+            g, la demi-arête de même support que h dans l'autre triangle
+        """
+        vertex = self.vertex
+        twin = self.twin
+        k = h % 3
+        h1 = h - 2 if k == 2 else h + 1
+        h2 = h + 2 if k == 0 else h - 1
+        g = twin[h]
+        k = g % 3
+        g1 = g - 2 if k == 2 else g + 1
+        g2 = g + 2 if k == 0 else g - 1
+        u = vertex[h]
+        v = vertex[h1]
+        d = vertex[g2]
+        p = vertex[h2]
+        tg1 = twin[g1]
+        tg2 = twin[g2]
+        th1 = twin[h1]
+        vertex[h1] = d
+        vertex[g] = d
+        vertex[g1] = v
+        vertex[g2] = p
+        twin[h] = tg1
+        twin[tg1] = h
+        twin[h1] = g2
+        twin[g2] = h1
+        twin[g] = tg2
+        twin[tg2] = g
+        twin[g1] = th1
+        twin[th1] = g1
+        vertex_edge = self.vertex_edge
+        vertex_edge[u] = h
+        vertex_edge[v] = g1
+        vertex_edge[d] = g
+        return g
+
+    def triangles(self, ids: Sequence[int] | None = None) -> array:
+        """Retourne les triangles réels en tableau plat array('I').
+
+        Args :
+            ids : indice de sortie de chaque sommet (par défaut, le sommet)
+        """
+        vertex = self.vertex
+        flat = array('I')
+        append = flat.append
+        for t in range(0, self.size, 3):
+            a = vertex[t]
+            b = vertex[t + 1]
+            c = vertex[t + 2]
+            if a != INF and b != INF and c != INF:
+                if ids is not None:
+                    a = ids[a]
+                    b = ids[b]
+                    c = ids[c]
+                append(a)
+                append(b)
+                append(c)
+        return flat
+
+    def to_geom(self, ids: Sequence[int] | None = None) -> Triangles_Geom:
+        """Retourne les triangles réels au format Triangles_Geom."""
+        return Triangles_Array(self.triangles(ids)).to_geom()
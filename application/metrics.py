@@ -0,0 +1,148 @@
+"""Mesure de la latence de chaque étape du traitement d'une triangulation.
+
+Chaque étape (vérification de l'UUID, récupération auprès du PSM, validation,
+décodage, calcul, encodage) est chronométrée par une horloge monotone
+(`time.perf_counter`) et sa durée alimente un histogramme à seuils fixes.
+Le coût d'une mesure est de l'ordre de la microseconde : l'instrumentation
+reste active en production.
+
+Les histogrammes sont exposés au format texte de Prometheus (`render`),
+de même que des compteurs cumulés (`render_counter`).
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from types import TracebackType
+
+# Seuils (secondes) des histogrammes : de la demi-milliseconde (cache,
+# conversions) à la minute (calcul d'un million de points).
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+STAGE_METRIC_NAME = "triangulator_stage_duration_seconds"
+STAGE_METRIC_HELP = "Duration of each triangulation processing stage."
+
+PREDICATE_CALLS_METRIC_NAME = "triangulator_predicate_calls_total"
+PREDICATE_CALLS_METRIC_HELP = "Geometric predicate evaluations."
+PREDICATE_EXACT_METRIC_NAME = "triangulator_predicate_exact_total"
+PREDICATE_EXACT_METRIC_HELP = (
+    "Geometric predicate evaluations that failed the floating-point filter "
+    "and were computed exactly."
+)
+
+
+class Histogram:
+    """Histogramme de durées à seuils fixes, utilisable depuis plusieurs threads."""
+
+    __slots__ = ('buckets', 'counts', 'total', 'count', '_lock')
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Crée un histogramme vide sur les seuils croissants buckets."""
+        self.buckets = buckets
+        # Une case par seuil, plus une pour les valeurs au-delà du dernier.
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """Ajoute une durée à l'histogramme."""
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.total += seconds
+            self.count += 1
+
+    def snapshot(self) -> tuple[list[int], float, int]:
+        """Retourne (effectifs cumulés par seuil, somme, nombre) à un instant."""
+        with self._lock:
+            counts = list(self.counts)
+            total = self.total
+            count = self.count
+        cumulative = []
+        running = 0
+        for value in counts:
+            running += value
+            cumulative.append(running)
+        return cumulative, total, count
+
+
+class _StageTimer:
+    """Gestionnaire de contexte qui chronomètre une étape."""
+
+    __slots__ = ('_histogram', '_start')
+
+    def __init__(self, histogram: Histogram) -> None:
+        self._histogram = histogram
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(
+            self, exc_type: type[BaseException] | None,
+            exc: BaseException | None, traceback: TracebackType | None
+            ) -> None:
+        # La durée est enregistrée même si l'étape a échoué.
+        self._histogram.observe(time.perf_counter() - self._start)
+
+
+class StageMetrics:
+    """Ensemble des histogrammes de latence, un par étape."""
+
+    def __init__(
+            self, stages: tuple[str, ...],
+            buckets: tuple[float, ...] = DEFAULT_BUCKETS
+            ) -> None:
+        """Crée un histogramme vide pour chaque étape de stages."""
+        self.buckets = buckets
+        self.histograms = {stage: Histogram(buckets) for stage in stages}
+
+    def time(self, stage: str) -> _StageTimer:
+        """Retourne un gestionnaire de contexte chronométrant l'étape stage.
+
+        Raises :
+            KeyError : L'étape n'est pas déclarée
+        """
+        return _StageTimer(self.histograms[stage])
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Enregistre une durée mesurée par ailleurs pour l'étape stage."""
+        self.histograms[stage].observe(seconds)
+
+    def reset(self) -> None:
+        """Remet tous les histogrammes à zéro."""
+        self.histograms = {stage: Histogram(self.buckets) for stage in self.histograms}
+
+    def render(self) -> str:
+        """Retourne les histogrammes au format texte de Prometheus (0.0.4)."""
+        name = STAGE_METRIC_NAME
+        lines = [f"# HELP {name} {STAGE_METRIC_HELP}", f"# TYPE {name} histogram"]
+        bounds = [repr(bound) for bound in self.buckets] + ["+Inf"]
+        for stage, histogram in self.histograms.items():
+            cumulative, total, count = histogram.snapshot()
+            for bound, value in zip(bounds, cumulative, strict=True):
+                lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {value}')
+            lines.append(f'{name}_sum{{stage="{stage}"}} {total!r}')
+            lines.append(f'{name}_count{{stage="{stage}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+def render_counter(
+        name: str, help_text: str, label: str, values: dict[str, int]
+        ) -> str:
+    """Retourne un compteur étiqueté au format texte de Prometheus (0.0.4).
+
+    Args :
+        name : nom de la métrique (suffixe "_total")
+        help_text : description
+        label : nom de l'étiquette
+        values : valeur du compteur pour chaque valeur d'étiquette
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+    for key, value in values.items():
+        lines.append(f'{name}{{{label}="{key}"}} {value}')
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,209 @@
+"""Localisation d'un point dans la triangulation incrémentale (jump-and-walk).
+
+- Marche stochastique à mémoire : depuis un triangle de départ, on traverse
+  une arête qui sépare le triangle du point cherché. Les arêtes sont testées
+  dans un ordre tiré au hasard (ce qui garantit la terminaison même hors
+  Delaunay) et l'arête par laquelle on vient d'entrer n'est pas retestée.
+- Saut (optionnel) : avant de marcher, environ n^(1/3) sommets déjà insérés
+  sont tirés au hasard ; la marche part du plus proche du point cherché.
+  Sans ordre spatial, la longueur de marche passe de O(sqrt(n)) à O(n^(1/6))
+  en moyenne ; avec un ordre spatial, le dernier triangle créé suffit.
+
+Les compteurs globaux LOCATION_STATS (insertions, triangles traversés,
+sauts) donnent la longueur moyenne des marches. Ils ne couvrent que les
+calculs faits dans le processus courant (pas ceux du pool de calcul).
+"""
+
+import random
+import threading
+from collections.abc import Callable
+
+INF = -1
+
+# Résultats de la localisation d'un point.
+IN_TRIANGLE = 0
+ON_EDGE = 1
+ON_VERTEX = 2
+
+# Ordres de test des arêtes d'un triangle, tirés une fois pour toutes.
+_ROTATIONS = ((0, 1, 2), (1, 2, 0), (2, 0, 1))
+_RANDOM_ROTATIONS = tuple(
+    _ROTATIONS[r] for r in (random.Random(0).randrange(3) for _ in range(256))
+)
+
+
+class LocationStats:
+    """Compteurs cumulés de la localisation, utilisables depuis plusieurs threads."""
+
+    def __init__(self) -> None:
+        """Crée des compteurs à zéro."""
+        self.insertions = 0
+        self.steps = 0
+        self.jumps = 0
+        self._lock = threading.Lock()
+
+    def record(self, insertions: int, steps: int, jumps: int) -> None:
+        """Ajoute les compteurs d'une triangulation."""
+        with self._lock:
+            self.insertions += insertions
+            self.steps += steps
+            self.jumps += jumps
+
+    def reset(self) -> None:
+        """Remet les compteurs à zéro."""
+        with self._lock:
+            self.insertions = self.steps = self.jumps = 0
+
+    def snapshot(self) -> dict[str, float]:
+        """Retourne les compteurs et la longueur moyenne de marche par insertion."""
+        with self._lock:
+            insertions, steps, jumps = self.insertions, self.steps, self.jumps
+        return {
+            'insertions': insertions,
+            'steps': steps,
+            'jumps': jumps,
+            'average_walk_length': steps / insertions if insertions else 0.0,
+        }
+
+
+LOCATION_STATS = LocationStats()
+
+
+class PointLocator:
+    """Marche (et saut) dans un maillage de demi-arêtes à triangles fantômes.
+
+    Le maillage est décrit par les tableaux `vertex` et `twin` (voir le
+    module `incremental`) ; `vertex_edge[v]` donne une demi-arête issue du
+    sommet v (-1 si v n'est pas encore inséré), utilisée par le saut.
+    """
+
+    def __init__(
+            self, px: list[float], py: list[float],
+            vertex: list[int], twin: list[int], vertex_edge: list[int],
+            orient: Callable[[int, int, int], float], jump: bool, seed: int = 0
+            ) -> None:
+        """Associe le localisateur au maillage et à ses prédicats."""
+        self.px = px
+        self.py = py
+        self.vertex = vertex
+        self.twin = twin
+        self.vertex_edge = vertex_edge
+        self.orient = orient
+        self.jump_enabled = jump
+        self._randrange = random.Random(seed).randrange
+        self.insertions = 0
+        self.steps = 0
+        self.jumps = 0
+
+    def locate(self, p: int, start: int) -> tuple[int, int]:
+        """Localise le point p, depuis le triangle start ou après un saut.
+
+        Returns :
+            (IN_TRIANGLE, t), (ON_EDGE, h) ou (ON_VERTEX, sommet)
+        """
+        self.insertions += 1
+        if self.jump_enabled and p > 1:
+            start = self.jump(p, start)
+        return self.walk(p, start)
+
+    def jump(self, p: int, start: int) -> int:
+        """Retourne le triangle issu du plus proche de ~p^(1/3) sommets tirés.
+
+        Les candidats sont tirés parmi les points d'indice inférieur à p (déjà
+        insérés, sauf doublons) ; un sommet réel du triangle start, dernier
+        triangle créé, est aussi candidat.
+        """
+        px = self.px
+        py = self.py
+        vertex_edge = self.vertex_edge
+        x = px[p]
+        y = py[p]
+        best_edge = 3 * start
+        if self.vertex[best_edge] == INF:
+            best_edge += 1
+        v = self.vertex[best_edge]
+        best_d = (px[v] - x) ** 2 + (py[v] - y) ** 2
+        randrange = self._randrange
+        for _ in range(int(p ** (1 / 3))):
+            v = randrange(p)
+            edge = vertex_edge[v]
+            if edge < 0:
+                continue
+            d = (px[v] - x) ** 2 + (py[v] - y) ** 2
+            if d < best_d:
+                best_d = d
+                best_edge = edge
+        self.jumps += 1
+        return best_edge // 3
+
+    def walk(self, p: int, t: int) -> tuple[int, int]:
+        """Marche stochastique à mémoire depuis le triangle t vers le point p."""
+        vertex = self.vertex
+        twin = self.twin
+        orient = self.orient
+        rotations = _RANDOM_ROTATIONS
+        steps = self.steps
+        entered = -1
+        while True:
+            steps += 1
+            base = 3 * t
+            a = vertex[base]
+            b = vertex[base + 1]
+            c = vertex[base + 2]
+            if a == INF or b == INF or c == INF:
+                # Triangle fantôme : seule son arête réelle compte.
+                h = base + (1 if a == INF else 2 if b == INF else 0)
+                u = vertex[h]
+                v = vertex[base + (h - base + 1) % 3]
+                o = orient(u, v, p)
+                if o > 0:
+                    self.steps = steps
+                    return IN_TRIANGLE, t
+                if o == 0:
+                    found = self._on_segment(h, u, v, p)
+                    if found is not None:
+                        self.steps = steps
+                        return found
+                entered = twin[h]
+                t = entered // 3
+                continue
+
+            # Arêtes dans un ordre aléatoire, sauf celle par laquelle on
+            # est entré (p est de l'autre côté, déjà testé).
+            corners = (a, b, c)
+            zero = -1
+            for k in rotations[steps & 255]:
+                h = base + k
+                if h == entered:
+                    continue
+                o = orient(corners[k], corners[k - 2], p)
+                if o < 0:
+                    break
+                if o == 0 and zero < 0:
+                    zero = k
+            else:
+                self.steps = steps
+                if zero < 0:
+                    return IN_TRIANGLE, t
+                # p est sur une arête, ou sur un sommet si deux arêtes sont nulles.
+                return self._on_segment(base + zero, corners[zero],
+                                        corners[zero - 2], p)
+            entered = twin[h]
+            t = entered // 3
+
+    def _on_segment(
+            self, h: int, u: int, v: int, p: int
+            ) -> tuple[int, int] | None:
+        """Pour p aligné avec l'arête h (u->v) : sommet, arête, ou None si dehors."""
+        px = self.px
+        py = self.py
+        x = px[p]
+        y = py[p]
+        if x == px[u] and y == py[u]:
+            return ON_VERTEX, u
+        if x == px[v] and y == py[v]:
+            return ON_VERTEX, v
+        if (min(px[u], px[v]) <= x <= max(px[u], px[v])
+                and min(py[u], py[v]) <= y <= max(py[u], py[v])):
+            return ON_EDGE, h
+        return None
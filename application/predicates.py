@@ -0,0 +1,301 @@
+"""Prédicats géométriques robustes : orientation et cercle circonscrit.
+
+Les deux prédicats suivent le schéma adaptatif de Shewchuk (1997) :
+- chemin rapide : le déterminant est calculé en flottants, avec une borne
+  d'erreur (constante statique multipliée par une majoration des termes,
+  calculée au vol) ; si le résultat dépasse la borne, son signe est sûr ;
+- chemin exact, quand le filtre échoue (points alignés ou cocirculaires,
+  ou presque) : les coordonnées sont converties en entiers (un flottant est
+  un rationnel dyadique exact) et le déterminant est calculé sans erreur.
+
+Le signe retourné est toujours exact : les triangulations restent valides
+sur les grilles, les points cocirculaires et les entrées presque dégénérées.
+
+Les moteurs de triangulation utilisent `IndexedPredicates`, qui lie les
+prédicats aux listes de coordonnées (un appel de fonction de moins par test,
+ce qui compte en Python) et compte localement les appels et les recours au
+chemin exact. Ils sont reportés en fin de calcul dans PREDICATE_STATS (taux
+de réussite du filtre), pour le processus courant.
+"""
+
+import threading
+from collections.abc import Callable, Sequence
+
+# Bornes d'erreur relatives du chemin rapide (Shewchuk, "Adaptive Precision
+# Floating-Point Arithmetic and Fast Robust Geometric Predicates").
+EPSILON = 2.0 ** -53
+ORIENT2D_ERROR_BOUND = (3.0 + 16.0 * EPSILON) * EPSILON
+INCIRCLE_ERROR_BOUND = (10.0 + 96.0 * EPSILON) * EPSILON
+# Le permanent de incircle, somme de six |produits| pondérés par les
+# « lifts » (carrés des distances à d), est majoré par
+# alift * (blift + clift) + blift * clift, car |x * y| <= (x^2 + y^2) / 2.
+# Cette majoration évite six abs() par appel ; 11 epsilons au lieu de 10
+# couvrent aussi son arrondi.
+INCIRCLE_LIFT_BOUND = 11.0 * EPSILON
+
+ORIENT2D = "orient2d"
+INCIRCLE = "incircle"
+PREDICATES = (ORIENT2D, INCIRCLE)
+
+
+class PredicateStats:
+    """Compteurs cumulés des prédicats, utilisables depuis plusieurs threads."""
+
+    def __init__(self) -> None:
+        """Crée des compteurs à zéro."""
+        self._lock = threading.Lock()
+        self.calls = dict.fromkeys(PREDICATES, 0)
+        self.exact = dict.fromkeys(PREDICATES, 0)
+
+    def record(self, name: str, calls: int, exact: int) -> None:
+        """Ajoute les appels et recours exacts d'un prédicat."""
+        with self._lock:
+            self.calls[name] += calls
+            self.exact[name] += exact
+
+    def reset(self) -> None:
+        """Remet les compteurs à zéro."""
+        with self._lock:
+            self.calls = dict.fromkeys(PREDICATES, 0)
+            self.exact = dict.fromkeys(PREDICATES, 0)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Retourne, par prédicat, les appels, recours exacts et taux de filtre."""
+        with self._lock:
+            calls = dict(self.calls)
+            exact = dict(self.exact)
+        return {
+            name: {
+                'calls': calls[name],
+                'exact': exact[name],
+                'filter_hit_rate': (
+                    (calls[name] - exact[name]) / calls[name] if calls[name] else 1.0
+                ),
+            }
+            for name in PREDICATES
+        }
+
+
+PREDICATE_STATS = PredicateStats()
+
+
+def orient2d(
+        ax: float, ay: float, bx: float, by: float, cx: float, cy: float
+        ) -> float:
+    """Orientation du triangle (a, b, c).
+
+    Returns :
+        Un flottant > 0 si (a, b, c) tourne dans le sens trigonométrique,
+        < 0 dans le sens horaire, 0 si les points sont alignés. Le signe est
+        exact ; la valeur n'est qu'approchée (±1 après un calcul exact).
+    """
+    detleft = (ax - cx) * (by - cy)
+    detright = (ay - cy) * (bx - cx)
+    det = detleft - detright
+    # Termes de signes opposés (ou nul) : pas de cancellation, signe sûr.
+    if detleft > 0.0:
+        if detright <= 0.0:
+            return det
+        detsum = detleft + detright
+    elif detleft < 0.0:
+        if detright >= 0.0:
+            return det
+        detsum = -detleft - detright
+    else:
+        return det
+    bound = ORIENT2D_ERROR_BOUND * detsum
+    if det >= bound or -det >= bound:
+        return det
+    return _orient2d_exact(ax, ay, bx, by, cx, cy)
+
+
+def incircle(
+        ax: float, ay: float, bx: float, by: float,
+        cx: float, cy: float, dx: float, dy: float
+        ) -> float:
+    """Position de d par rapport au cercle circonscrit de (a, b, c), direct.
+
+    Returns :
+        Un flottant > 0 si d est strictement dans le cercle, < 0 s'il est
+        dehors, 0 s'il est dessus. Le signe est exact ; la valeur n'est
+        qu'approchée (±1 après un calcul exact).
+    """
+    adx = ax - dx
+    ady = ay - dy
+    bdx = bx - dx
+    bdy = by - dy
+    cdx = cx - dx
+    cdy = cy - dy
+    alift = adx * adx + ady * ady
+    blift = bdx * bdx + bdy * bdy
+    clift = cdx * cdx + cdy * cdy
+    det = (alift * (bdx * cdy - cdx * bdy)
+           + blift * (cdx * ady - adx * cdy)
+           + clift * (adx * bdy - bdx * ady))
+    bound = INCIRCLE_LIFT_BOUND * (alift * (blift + clift) + blift * clift)
+    if det > bound or -det > bound:
+        return det
+    if (dx, dy) in ((ax, ay), (bx, by), (cx, cy)):
+        # d confondu avec un sommet : il est sur le cercle.
+        return 0.0
+    return _incircle_exact(ax, ay, bx, by, cx, cy, dx, dy)
+
+
+def line_orientation(
+        ax: float, ay: float, bx: float, by: float
+        ) -> Callable[[float, float], int]:
+    """Retourne orient(cx, cy), du signe exact de orient2d(a, b, c), a et b fixés.
+
+    Sans filtre flottant : le calcul est toujours exact, en entiers. Il est
+    fait pour parcourir des points alignés, où le filtre échouerait à chaque
+    appel ; a et b ne sont convertis qu'une fois, c par deux
+    `as_integer_ratio()`.
+    """
+    ratios = [value.as_integer_ratio() for value in (ax, ay, bx, by)]
+    scale = max(denominator for _, denominator in ratios)
+    ax, ay, bx, by = (numerator * (scale // denominator)
+                      for numerator, denominator in ratios)
+    ux = bx - ax
+    uy = by - ay
+
+    def orient(cx: float, cy: float) -> int:
+        # orient2d(a, b, c) = ux * (cy - ay) - uy * (cx - ax), multiplié par
+        # les dénominateurs (positifs) scale, qx et qy.
+        px, qx = cx.as_integer_ratio()
+        py, qy = cy.as_integer_ratio()
+        return ux * (py * scale - ay * qy) * qx - uy * (px * scale - ax * qx) * qy
+
+    return orient
+
+
+class IndexedPredicates:
+    """Prédicats sur des indices de points, avec compteurs locaux.
+
+    `orient(a, b, c)` et `incircle(a, b, c, d)` ont la même sémantique que
+    orient2d et incircle appliqués aux points px[i], py[i].
+    """
+
+    def __init__(self, px: Sequence[float], py: Sequence[float]) -> None:
+        """Lie les prédicats aux coordonnées px, py."""
+        self.orient, self.incircle, self._counts = _bind(px, py)
+
+    def record(self, stats: PredicateStats | None = None) -> None:
+        """Ajoute les compteurs dans stats (par défaut PREDICATE_STATS)."""
+        stats = PREDICATE_STATS if stats is None else stats
+        orient_calls, orient_exact, incircle_calls, incircle_exact = self._counts()
+        stats.record(ORIENT2D, orient_calls, orient_exact)
+        stats.record(INCIRCLE, incircle_calls, incircle_exact)
+
+
+def _bind(
+        px: Sequence[float], py: Sequence[float]
+        ) -> tuple[Callable[..., float], Callable[..., float],
+                   Callable[[], tuple[int, int, int, int]]]:
+    """Retourne (orient, incircle, compteurs) en fermetures sur px, py.
+
+    Le chemin rapide est recopié de orient2d et incircle : une fermeture
+    évite un appel de fonction par test.
+    """
+    orient_calls = orient_exact = incircle_calls = incircle_exact = 0
+
+    def orient(a: int, b: int, c: int) -> float:
+        nonlocal orient_calls, orient_exact
+        orient_calls += 1
+        cx = px[c]
+        cy = py[c]
+        detleft = (px[a] - cx) * (py[b] - cy)
+        detright = (py[a] - cy) * (px[b] - cx)
+        det = detleft - detright
+        if detleft > 0.0:
+            if detright <= 0.0:
+                return det
+            detsum = detleft + detright
+        elif detleft < 0.0:
+            if detright >= 0.0:
+                return det
+            detsum = -detleft - detright
+        else:
+            return det
+        bound = ORIENT2D_ERROR_BOUND * detsum
+        if det >= bound or -det >= bound:
+            return det
+        orient_exact += 1
+        return _orient2d_exact(px[a], py[a], px[b], py[b], cx, cy)
+
+    def incircle(a: int, b: int, c: int, d: int) -> float:
+        nonlocal incircle_calls, incircle_exact
+        incircle_calls += 1
+        dx = px[d]
+        dy = py[d]
+        adx = px[a] - dx
+        ady = py[a] - dy
+        bdx = px[b] - dx
+        bdy = py[b] - dy
+        cdx = px[c] - dx
+        cdy = py[c] - dy
+        alift = adx * adx + ady * ady
+        blift = bdx * bdx + bdy * bdy
+        clift = cdx * cdx + cdy * cdy
+        det = (alift * (bdx * cdy - cdx * bdy)
+               + blift * (cdx * ady - adx * cdy)
+               + clift * (adx * bdy - bdx * ady))
+        bound = INCIRCLE_LIFT_BOUND * (alift * (blift + clift) + blift * clift)
+        if det > bound or -det > bound:
+            return det
+        ax = px[a]
+        ay = py[a]
+        bx = px[b]
+        by = py[b]
+        cx = px[c]
+        cy = py[c]
+        if (dx, dy) in ((ax, ay), (bx, by), (cx, cy)):
+            return 0.0
+        incircle_exact += 1
+        return _incircle_exact(ax, ay, bx, by, cx, cy, dx, dy)
+
+    def counts() -> tuple[int, int, int, int]:
+        return orient_calls, orient_exact, incircle_calls, incircle_exact
+
+    return orient, incircle, counts
+
+
+def _to_integers(*values: float) -> list[int]:
+    """Retourne les valeurs multipliées par un même facteur 2^k, en entiers."""
+    # Cas courant des entrées dégénérées (grilles) : coordonnées entières.
+    integers = list(map(int, values))
+    if integers == list(values):
+        return integers
+    ratios = [value.as_integer_ratio() for value in values]
+    # Les dénominateurs sont des puissances de 2 : le plus grand est un
+    # multiple commun.
+    scale = max(denominator for _, denominator in ratios)
+    return [numerator * (scale // denominator) for numerator, denominator in ratios]
+
+
+def _sign(value: int) -> float:
+    return float((value > 0) - (value < 0))
+
+
+def _orient2d_exact(
+        ax: float, ay: float, bx: float, by: float, cx: float, cy: float
+        ) -> float:
+    """Signe exact de orient2d, calculé sur des entiers."""
+    ax, ay, bx, by, cx, cy = _to_integers(ax, ay, bx, by, cx, cy)
+    return _sign((ax - cx) * (by - cy) - (ay - cy) * (bx - cx))
+
+
+def _incircle_exact(
+        ax: float, ay: float, bx: float, by: float,
+        cx: float, cy: float, dx: float, dy: float
+        ) -> float:
+    """Signe exact de incircle, calculé sur des entiers."""
+    ax, ay, bx, by, cx, cy, dx, dy = _to_integers(ax, ay, bx, by, cx, cy, dx, dy)
+    adx = ax - dx
+    ady = ay - dy
+    bdx = bx - dx
+    bdy = by - dy
+    cdx = cx - dx
+    cdy = cy - dy
+    return _sign((adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+                 + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+                 + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady))
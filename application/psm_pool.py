@@ -0,0 +1,190 @@
+"""Pool de connexions HTTP persistantes (keep-alive) vers le PointSetManager.
+
+Chaque requête au PSM réutilise une connexion `http.client.HTTPConnection`
+déjà ouverte au lieu de payer une nouvelle poignée de main TCP.
+Le pool est borné (max_size connexions au total), utilisable depuis plusieurs
+threads, et vérifie l'état d'une connexion avant de la réutiliser :
+- une connexion inutilisée depuis plus de idle_timeout secondes est fermée,
+- une connexion dont le socket est lisible au repos (fermeture côté PSM,
+  données inattendues) est fermée.
+"""
+
+import http.client
+import select
+import socket
+import threading
+import time
+from collections import deque
+from contextlib import suppress
+
+# Erreurs indiquant qu'une connexion réutilisée a été fermée par le serveur.
+STALE_CONNECTION_ERRORS = (ConnectionError, http.client.BadStatusLine)
+
+
+class PoolTimeout(Exception):
+    """Aucune connexion ne s'est libérée dans le délai imparti."""
+
+
+class PSMConnectionPool:
+    """Pool borné de connexions HTTP/1.1 persistantes vers un hôte."""
+
+    def __init__(
+            self, host: str, port: int, max_size: int = 8,
+            idle_timeout: float = 30.0, timeout: float = 5.0,
+            acquire_timeout: float | None = None
+            ) -> None:
+        """Crée un pool vide ; les connexions sont ouvertes à la demande.
+
+        Args :
+            host, port : adresse du PSM
+            max_size : nombre maximal de connexions ouvertes simultanément
+            idle_timeout : durée (s) au-delà de laquelle une connexion
+              inutilisée est fermée au lieu d'être réutilisée
+            timeout : délai (s) des opérations réseau de chaque connexion
+            acquire_timeout : délai (s) d'attente d'une connexion libre
+              (None : attente du délai réseau `timeout`)
+        """
+        self.host = host
+        self.port = port
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.acquire_timeout = timeout if acquire_timeout is None else acquire_timeout
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self._idle: deque[tuple[http.client.HTTPConnection, float]] = deque()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_size)
+
+    # ---------------- Cycle de vie des connexions ----------------
+    def _new_connection(self) -> http.client.HTTPConnection:
+        """Ouvre (paresseusement) une nouvelle connexion vers le PSM."""
+        self.created += 1
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _is_healthy(self, conn: http.client.HTTPConnection, last_used: float) -> bool:
+        """Indique si une connexion au repos peut être réutilisée."""
+        if time.monotonic() - last_used > self.idle_timeout:
+            return False
+        sock = conn.sock
+        if not isinstance(sock, socket.socket):
+            # Pas encore connectée : http.client ouvrira le socket au besoin.
+            return True
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        # Au repos, un socket lisible signale une fermeture côté serveur.
+        return not readable
+
+    def acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        """Réserve une connexion saine ; retourne (connexion, réutilisée ?).
+
+        Raises :
+            PoolTimeout : max_size connexions sont déjà utilisées
+        """
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise PoolTimeout(f"No free PSM connection after {self.acquire_timeout}s")
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn, last_used = self._idle.pop()
+            if self._is_healthy(conn, last_used):
+                self.reused += 1
+                return conn, True
+            self._discard(conn)
+        return self._new_connection(), False
+
+    def release(self, conn: http.client.HTTPConnection, reusable: bool = True) -> None:
+        """Rend une connexion au pool (ou la ferme si elle n'est plus fiable)."""
+        try:
+            if reusable:
+                with self._lock:
+                    self._idle.append((conn, time.monotonic()))
+            else:
+                self._discard(conn)
+        finally:
+            self._slots.release()
+
+    def _discard(self, conn: http.client.HTTPConnection) -> None:
+        """Ferme une connexion retirée du pool."""
+        self.discarded += 1
+        with suppress(OSError):
+            conn.close()
+
+    # ---------------- Requêtes ----------------
+    def request(self, method: str, path: str) -> tuple[int, bytes]:
+        """Envoie une requête sur une connexion du pool.
+
+        Si une connexion réutilisée s'avère fermée par le PSM, la requête est
+        rejouée une fois sur une connexion neuve (requêtes idempotentes).
+
+        Returns :
+            (code HTTP, corps de la réponse)
+
+        Raises :
+            PoolTimeout, OSError, http.client.HTTPException : échec réseau
+        """
+        while True:
+            conn, reused = self.acquire()
+            try:
+                conn.request(method, path)
+                response = conn.getresponse()
+                body = response.read()
+            except STALE_CONNECTION_ERRORS:
+                self.release(conn, reusable=False)
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                self.release(conn, reusable=False)
+                raise
+            # Si le PSM a demandé la fermeture, http.client a déjà fermé le
+            # socket : l'objet connexion se reconnectera à sa prochaine requête.
+            self.release(conn)
+            return response.status, body
+
+    def warm(self, count: int) -> int:
+        """Ouvre jusqu'à count connexions à l'avance et les met au repos.
+
+        Returns :
+            Nombre de connexions effectivement ouvertes (0 si le PSM est injoignable)
+        """
+        opened = []
+        try:
+            for _ in range(min(count, self.max_size)):
+                conn, _ = self.acquire()
+                try:
+                    if conn.sock is None:
+                        conn.connect()
+                except OSError:
+                    self.release(conn, reusable=False)
+                    break
+                opened.append(conn)
+        except PoolTimeout:
+            pass
+        for conn in opened:
+            self.release(conn)
+        return len(opened)
+
+    def close(self) -> None:
+        """Ferme toutes les connexions au repos."""
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+        for conn, _ in idle:
+            self._discard(conn)
+
+    def stats(self) -> dict[str, int]:
+        """Retourne un instantané des compteurs du pool."""
+        with self._lock:
+            idle = len(self._idle)
+        return {
+            'idle': idle,
+            'max_size': self.max_size,
+            'created': self.created,
+            'reused': self.reused,
+            'discarded': self.discarded,
+        }
@@ -0,0 +1,122 @@
+"""Cache en mémoire des triangulations, adressé par le contenu du PointSet.
+
+`triangulation_pipeline` est une fonction pure de ses octets d'entrée : deux
+PointSet identiques donnent les mêmes Triangles. Le cache associe donc
+l'empreinte (blake2b) du PointSet binaire aux Triangles binaires déjà encodés.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+DIGEST_SIZE = 16
+VERSION_SIZE = 8
+
+
+def point_set_digest(pointSet: bytes) -> bytes:
+    """Retourne l'empreinte du contenu d'un PointSet binaire.
+
+    Args :
+        pointSet : PointSet au format binaire (tout objet tampon)
+
+    Returns :
+        Empreinte blake2b de DIGEST_SIZE octets
+    """
+    return hashlib.blake2b(pointSet, digest_size=DIGEST_SIZE).digest()
+
+
+def settings_version(*settings: object) -> str:
+    """Retourne une version courte (hexadécimale) d'un ensemble de réglages.
+
+    Args :
+        settings : réglages dont dépendent les Triangles (format, moteur, options)
+
+    Returns :
+        Empreinte blake2b de VERSION_SIZE octets, en hexadécimal
+    """
+    text = "\0".join(map(str, settings))
+    return hashlib.blake2b(text.encode(), digest_size=VERSION_SIZE).hexdigest()
+
+
+class ResultCache:
+    """Cache LRU borné en octets, utilisable depuis plusieurs threads.
+
+    Les entrées sont évincées de la moins récemment utilisée à la plus
+    récente jusqu'à respecter le budget. Une valeur plus grosse que le budget
+    n'est pas mise en cache. Les compteurs hits / misses / evictions
+    permettent de suivre l'efficacité du cache.
+
+    Les valeurs sont en général des bytes ; pour d'autres objets, sizeof
+    donne leur taille en octets.
+    """
+
+    def __init__(
+            self, max_bytes: int, sizeof: Callable[[Any], int] = len
+            ) -> None:
+        """Crée un cache vide dont la taille totale ne dépasse pas max_bytes."""
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._sizeof = sizeof
+        self._entries: OrderedDict[bytes, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> bytes | None:
+        """Retourne la valeur associée à key (et la marque récente), ou None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: bytes, value: bytes) -> None:
+        """Ajoute ou remplace une entrée, puis évince pour respecter le budget."""
+        sizeof = self._sizeof
+        size = len(key) + sizeof(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= len(key) + sizeof(previous)
+            self._entries[key] = value
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                old_key, old_value = self._entries.popitem(last=False)
+                self.current_bytes -= len(old_key) + sizeof(old_value)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Vide le cache et remet les compteurs à zéro."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Retourne un instantané des compteurs et de l'occupation."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def __contains__(self, key: object) -> bool:
+        """Indique si key est en cache, sans modifier l'ordre LRU ni les compteurs."""
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        """Nombre d'entrées en cache."""
+        return len(self._entries)
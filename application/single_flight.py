@@ -0,0 +1,81 @@
+"""Regroupement des requêtes concurrentes identiques (« single flight »).
+
+Quand un tableau de bord se rafraîchit, des dizaines de requêtes arrivent
+en même temps pour un même PointSetId. Sans regroupement, chacune refait la
+récupération auprès du PSM et le calcul. SingleFlight ne laisse passer que
+la première requête d'une clé (le « meneur ») : les suivantes, arrivées
+pendant son exécution, attendent son Future et reçoivent le même résultat,
+ou la même exception. La clé est retirée de la table dès la fin de
+l'exécution : une requête ultérieure refait le travail (le cache des
+résultats prend alors le relais).
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Table des exécutions en cours, partagées entre threads par clé."""
+
+    def __init__(self) -> None:
+        """Crée une table vide."""
+        self._lock = threading.Lock()
+        self._inflight: dict[Hashable, Future] = {}
+        self.leaders = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> T:
+        """Exécute function() pour key, ou attend l'exécution déjà en cours.
+
+        Args :
+            key : clé de regroupement (ex. le PointSetId)
+            function : travail à faire, sans argument
+
+        Returns :
+            Le résultat de function(), commun à tous les appels regroupés
+
+        Raises :
+            L'exception levée par function(), transmise à tous les appels
+            regroupés
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+                self.leaders += 1
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result()
+
+        try:
+            result = function()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def stats(self) -> dict[str, int]:
+        """Retourne les exécutions en cours, menées et partagées."""
+        with self._lock:
+            return {
+                'inflight': len(self._inflight),
+                'leaders': self.leaders,
+                'shared': self.shared,
+            }
+
+    def __len__(self) -> int:
+        """Nombre de clés en cours d'exécution."""
+        with self._lock:
+            return len(self._inflight)
@@ -0,0 +1,147 @@
+"""Ordres d'insertion spatiaux pour la triangulation incrémentale.
+
+Insérer les points dans l'ordre quelconque du PSM rend la localisation
+coûteuse (longues marches d'un bout à l'autre du maillage) et les accès
+mémoire dispersés. Trier les points le long d'une courbe de Hilbert rend
+deux points consécutifs proches dans le plan.
+
+- `hilbert_order` : tri par clé de Hilbert (coordonnées quantifiées sur
+  HILBERT_BITS bits par axe), en O(n log n).
+- `brio_order` : BRIO (Biased Randomized Insertion Order, Amenta et al.) :
+  les points sont répartis au hasard en tours de tailles doublantes, chaque
+  tour étant trié selon la courbe de Hilbert. L'aléa protège contre les
+  configurations défavorables, le tri garde la localité.
+"""
+
+import random
+from collections.abc import Sequence
+
+from .types import Bounds
+
+HILBERT_BITS = 16
+
+NO_ORDER = "none"
+HILBERT = "hilbert"
+BRIO = "brio"
+SPATIAL_ORDERS = (NO_ORDER, HILBERT, BRIO)
+
+
+def _build_hilbert_table() -> list[int]:
+    """Construit la table de transition de la courbe de Hilbert, 4 bits par pas.
+
+    L'état est l'orientation courante de la courbe : un éventuel complément
+    des bits (c) suivi d'un éventuel échange des axes (sw). Pour chaque état
+    et chaque couple de quartets (x, y), la table donne les 8 bits de clé
+    produits et le nouvel état, rangé dans les bits 8 et 9 de l'entrée.
+    """
+    table = [0] * (4 * 256)
+    for state in range(4):
+        for nibbles in range(256):
+            c, sw = state >> 1, state & 1
+            x4, y4 = nibbles >> 4, nibbles & 15
+            digits = 0
+            for bit in (3, 2, 1, 0):
+                tx = ((x4 >> bit) & 1) ^ c
+                ty = ((y4 >> bit) & 1) ^ c
+                if sw:
+                    tx, ty = ty, tx
+                digits = (digits << 2) | ((3 * tx) ^ ty)
+                if ty == 0:
+                    c ^= tx
+                    sw ^= 1
+            table[(state << 8) | nibbles] = digits | ((c << 1 | sw) << 8)
+    return table
+
+
+_HILBERT_TABLE = _build_hilbert_table()
+
+
+def hilbert_keys(
+        xs: Sequence[float], ys: Sequence[float], bounds: Bounds | None = None
+        ) -> list[int]:
+    """Retourne la clé de Hilbert (2 * HILBERT_BITS bits) de chaque point.
+
+    Les coordonnées sont ramenées sur une grille de 2^HILBERT_BITS cases par
+    axe, à la même échelle sur les deux axes (boîte englobante carrée).
+    La boîte englobante des points est calculée si elle n'est pas fournie
+    (bounds).
+    """
+    n = len(xs)
+    if n == 0:
+        return []
+    if bounds is None:
+        bounds = (min(xs), min(ys), max(xs), max(ys))
+    min_x, min_y, max_x, max_y = bounds
+    span = max(max_x - min_x, max_y - min_y)
+    top = (1 << HILBERT_BITS) - 1
+    scale = top / span if span > 0 else 0.0
+    table = _HILBERT_TABLE
+
+    keys = []
+    append = keys.append
+    for x, y in zip(xs, ys, strict=True):
+        qx = int((x - min_x) * scale)
+        qy = int((y - min_y) * scale)
+        e = table[((qx >> 8) & 0xF0) | ((qy >> 12) & 15)]
+        key = e & 255
+        e = table[(e & 768) | ((qx >> 4) & 0xF0) | ((qy >> 8) & 15)]
+        key = (key << 8) | (e & 255)
+        e = table[(e & 768) | (qx & 0xF0) | ((qy >> 4) & 15)]
+        key = (key << 8) | (e & 255)
+        e = table[(e & 768) | ((qx << 4) & 0xF0) | (qy & 15)]
+        append((key << 8) | (e & 255))
+    return keys
+
+
+def hilbert_order(
+        xs: Sequence[float], ys: Sequence[float], bounds: Bounds | None = None
+        ) -> list[int]:
+    """Retourne les indices des points triés le long de la courbe de Hilbert."""
+    return sorted(range(len(xs)), key=hilbert_keys(xs, ys, bounds).__getitem__)
+
+
+def brio_order(
+        xs: Sequence[float], ys: Sequence[float], seed: int = 0,
+        bounds: Bounds | None = None
+        ) -> list[int]:
+    """Retourne un ordre d'insertion BRIO des points.
+
+    Chaque point tombe dans le dernier tour avec une probabilité 1/2, dans
+    l'avant-dernier avec une probabilité 1/4, etc. Les tours sont insérés
+    du plus petit au plus grand, chacun trié selon la courbe de Hilbert.
+    Le générateur est initialisé par seed : l'ordre est reproductible.
+    """
+    n = len(xs)
+    keys = hilbert_keys(xs, ys, bounds)
+    last_round = max(1, n.bit_length())
+    bits = 2 * HILBERT_BITS
+    getrandbits = random.Random(seed).getrandbits
+    for i in range(n):
+        r = getrandbits(last_round) | (1 << last_round)
+        # Nombre de zéros de poids faible : loi géométrique de paramètre 1/2.
+        zeros = (r & -r).bit_length() - 1
+        keys[i] |= (last_round - zeros) << bits
+    return sorted(range(n), key=keys.__getitem__)
+
+
+def spatial_order(
+        xs: Sequence[float], ys: Sequence[float], method: str = BRIO,
+        bounds: Bounds | None = None
+        ) -> list[int] | range:
+    """Retourne l'ordre d'insertion des points selon la méthode demandée.
+
+    Args :
+        xs, ys : coordonnées des points
+        method : NO_ORDER (ordre d'entrée), HILBERT ou BRIO
+        bounds : boîte englobante des points, si elle est déjà connue
+
+    Raises :
+        ValueError : Méthode inconnue
+    """
+    if method == BRIO:
+        return brio_order(xs, ys, bounds=bounds)
+    if method == HILBERT:
+        return hilbert_order(xs, ys, bounds)
+    if method == NO_ORDER:
+        return range(len(xs))
+    raise ValueError(f"Unknown spatial order {method!r}")
@@ -0,0 +1 @@
+"""Tests de performance (lents), exécutés séparément des tests unitaires."""
@@ -0,0 +1,62 @@
+"""Fixtures des tests de performance : rapport JSON des mesures, caches vides.
+
+Les mesures enregistrées pendant la session sont écrites dans le fichier
+désigné par la variable d'environnement PERF_REPORT (par défaut
+perf_report.json, dans le répertoire de lancement).
+"""
+
+import json
+import os
+import platform
+import time
+from collections.abc import Callable, Iterator
+
+import pytest
+
+from application.triangulator_app import MESH_CACHE, POINT_SET_DIGESTS, RESULT_CACHE
+
+PERF_REPORT = os.environ.get("PERF_REPORT", "perf_report.json")
+
+
+@pytest.fixture(scope="session")
+def perf_report() -> Iterator[Callable[..., None]]:
+    """Retourne une fonction record(stage, n, seconds, **extra) de collecte.
+
+    Le rapport est écrit à la fin de la session, si au moins une mesure
+    a été enregistrée.
+    """
+    results: list[dict] = []
+
+    def record(stage: str, n: int, seconds: float, **extra) -> None:
+        results.append({
+            'stage': stage,
+            'n': n,
+            'seconds': seconds,
+            'us_per_point': seconds / n * 1e6 if n else None,
+            **extra,
+        })
+
+    yield record
+
+    if results:
+        report = {
+            'created': time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'results': results,
+        }
+        with open(PERF_REPORT, "w", encoding="utf-8") as report_file:
+            json.dump(report, report_file, indent=2)
+
+
+# Fixture commune - un résultat mis en cache par un test ne fausse pas les
+# mesures du suivant.
+@pytest.fixture(autouse=True)
+def empty_caches():
+    """Vide les caches des triangulations et des maillages avant chaque test."""
+    for cache in (RESULT_CACHE, MESH_CACHE, POINT_SET_DIGESTS):
+        cache.clear()
+    yield
+    for cache in (RESULT_CACHE, MESH_CACHE, POINT_SET_DIGESTS):
+        cache.clear()
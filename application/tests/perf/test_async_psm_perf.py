@@ -0,0 +1,121 @@
+"""Tests de performance du client asyncio du PSM.
+
+Un PSM local lent (LATENCY secondes par requête) reçoit FETCHES
+récupérations simultanées : avec AsyncPSMClient, elles sont toutes en
+attente dans un seul thread ; avec psm_client_fetch_data, leur nombre est
+borné par les WORKERS threads du pool.
+"""
+
+import asyncio
+import os
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from application import triangulator_app
+from application.async_psm import AsyncPSMClient, EventLoopThread
+from application.psm_pool import PSMConnectionPool
+from application.triangulator_app import (
+    psm_client_fetch_data,
+    psm_client_fetch_data_async,
+)
+
+pytestmark = pytest.mark.perf
+
+N = 10**2
+FETCHES = 2000
+WORKERS = 32
+LATENCY = 0.1
+PAYLOAD = struct.pack('I', N) + os.urandom(8 * N)
+RESPONSE = (b"HTTP/1.1 200 OK\r\nContent-Type: application/octet-stream\r\n"
+            b"Content-Length: %d\r\n\r\n" % len(PAYLOAD)) + PAYLOAD
+
+
+class _SlowPSM:
+    """PSM local asyncio : chaque réponse est envoyée après LATENCY secondes."""
+
+    def __init__(self) -> None:
+        """Aucune requête en cours."""
+        self.inflight = 0
+        self.peak = 0
+
+    async def handle(self, reader, writer):
+        """Répond à chaque requête de la connexion, en keep-alive."""
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                self.inflight += 1
+                self.peak = max(self.peak, self.inflight)
+                await asyncio.sleep(LATENCY)
+                self.inflight -= 1
+                writer.write(RESPONSE)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture(scope="module")
+def slow_psm():
+    """Démarre le PSM lent dans sa propre boucle ; retourne (psm, hôte, port)."""
+    psm = _SlowPSM()
+    loop_thread = EventLoopThread("slow-psm")
+
+    async def start():
+        return await asyncio.start_server(psm.handle, "127.0.0.1", 0,
+                                          backlog=FETCHES)
+
+    server = loop_thread.run(start())
+    yield (psm, *server.sockets[0].getsockname()[:2])
+    loop_thread.loop.call_soon_threadsafe(server.close)
+    loop_thread.stop()
+
+
+def test_01_async_fetches_are_not_bounded_by_threads(slow_psm, perf_report):
+    """FETCHES récupérations simultanées : bien plus rapide qu'avec WORKERS threads."""
+    psm, host, port = slow_psm
+    uuid = "a1b2c3d4-e5f6-7890-1234-567890abcdef"
+
+    client = AsyncPSMClient(host, port, max_size=FETCHES, timeout=30)
+
+    async def fetch_all():
+        try:
+            return await asyncio.gather(
+                *(psm_client_fetch_data_async(uuid) for _ in range(FETCHES))
+            )
+        finally:
+            client.close()
+            await asyncio.sleep(0)
+
+    psm.peak = 0
+    with patch.object(triangulator_app, "ASYNC_PSM_CLIENT", client):
+        start = time.perf_counter()
+        bodies = asyncio.run(fetch_all())
+        async_seconds = time.perf_counter() - start
+    async_peak = psm.peak
+    assert all(body == PAYLOAD for body in bodies)
+
+    pool = PSMConnectionPool(host, port, max_size=WORKERS, timeout=30)
+    psm.peak = 0
+    with patch.object(triangulator_app, "PSM_POOL", pool), \
+         ThreadPoolExecutor(WORKERS) as executor:
+        start = time.perf_counter()
+        bodies = list(executor.map(psm_client_fetch_data, [uuid] * FETCHES))
+        threaded_seconds = time.perf_counter() - start
+    pool.close()
+    threaded_peak = psm.peak
+    assert all(body == PAYLOAD for body in bodies)
+
+    perf_report("psm_fetch_async", FETCHES, async_seconds,
+                peak_inflight=async_peak, latency=LATENCY)
+    perf_report("psm_fetch_threaded", FETCHES, threaded_seconds,
+                peak_inflight=threaded_peak, workers=WORKERS, latency=LATENCY)
+
+    assert threaded_peak <= WORKERS
+    assert async_peak > FETCHES // 2
+    assert async_seconds < threaded_seconds / 2, (
+        f"async {async_seconds:.2f} s, {WORKERS} threads {threaded_seconds:.2f} s"
+    )
@@ -0,0 +1,59 @@
+"""Tests de performance pour le pool de processus de triangulation.
+
+Sur une charge mixte (petits et grands PointSet), le débit du pool doit
+croître presque linéairement avec le nombre de coeurs disponibles.
+"""
+
+import os
+import random
+import time
+from array import array
+from concurrent.futures import wait
+
+import pytest
+
+from application.compute_pool import ComputePool
+from application.engines import triangulate
+
+pytestmark = pytest.mark.perf
+
+# Charge mixte : beaucoup de petits PointSet, quelques grands.
+WORKLOAD_SIZES = [10**3] * 16 + [10**4] * 8 + [5 * 10**4] * 2
+# Efficacité minimale par coeur (débit pool / débit séquentiel / coeurs).
+MIN_EFFICIENCY = 0.7
+
+
+def workload() -> list[tuple[array, array]]:
+    """Génère les PointSet de la charge mixte (coordonnées 'f')."""
+    rng = random.Random(0)
+    return [(array('f', (rng.random() for _ in range(n))),
+             array('f', (rng.random() for _ in range(n))))
+            for n in WORKLOAD_SIZES]
+
+
+def test_01_compute_pool_throughput_scales_with_cores():
+    """Le débit du pool atteint MIN_EFFICIENCY x coeurs x débit séquentiel."""
+    cores = os.cpu_count() or 1
+    point_sets = workload()
+
+    start = time.perf_counter()
+    for xs, ys in point_sets:
+        triangulate(xs, ys)
+    sequential = time.perf_counter() - start
+
+    pool = ComputePool(cores)
+    pool.warm()
+    try:
+        start = time.perf_counter()
+        futures = [pool.submit(xs, ys, 'f') for xs, ys in point_sets]
+        wait(futures)
+        pooled = time.perf_counter() - start
+    finally:
+        pool.shutdown()
+
+    assert all(future.exception() is None for future in futures)
+    speedup = sequential / pooled
+    assert speedup >= MIN_EFFICIENCY * cores, (
+        f"{cores} cores : sequential {sequential:.2f}s, pool {pooled:.2f}s "
+        f"(x{speedup:.2f})"
+    )
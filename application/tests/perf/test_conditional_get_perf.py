@@ -0,0 +1,72 @@
+"""Tests de performance des requêtes conditionnelles (If-None-Match).
+
+Compare, pour un PointSet de N points, une revalidation (304 Not Modified)
+à une réponse complète (200), servie depuis le cache des résultats ou
+recalculée. Le PSM est remplacé par un mock qui répond en PSM_LATENCY
+secondes : un 304 pour un PointSetId connu évite aussi cet aller-retour.
+"""
+
+import random
+import struct
+import time
+import uuid
+from collections.abc import Callable
+from unittest.mock import patch
+
+import pytest
+
+from application.triangulator_app import RESULT_CACHE, triangulator_app
+
+pytestmark = pytest.mark.perf
+
+N = 10**4
+REPEATS = 20
+PSM_LATENCY = 0.002
+
+
+def best_time(function: Callable[[], object]) -> float:
+    """Meilleur temps (secondes) de function() sur REPEATS essais."""
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_01_revalidation_skips_compute_and_encode(perf_report):
+    """Un 304 coûte bien moins qu'un 200, même servi depuis le cache."""
+    rng = random.Random(0)
+    point_set = struct.pack('I', N) + struct.pack(
+        f'{2 * N}f', *(rng.random() for _ in range(2 * N))
+    )
+    client = triangulator_app.test_client()
+    url = f"/triangulation/{uuid.uuid4()}"
+
+    def fetch(_):
+        time.sleep(PSM_LATENCY)
+        return point_set
+
+    with patch('application.triangulator_app.psm_client_fetch_data', fetch):
+        RESULT_CACHE.clear()
+        start = time.perf_counter()
+        response = client.get(url)
+        body = response.get_data()
+        computed = time.perf_counter() - start
+        etag = response.headers["ETag"]
+
+        cached = best_time(lambda: client.get(url).get_data())
+        revalidated = best_time(
+            lambda: client.get(url, headers={"If-None-Match": etag}).status_code
+        )
+        assert client.get(url).get_data() == body
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    perf_report("get_computed", N, computed, psm_latency=PSM_LATENCY)
+    perf_report("get_cached", N, cached, psm_latency=PSM_LATENCY)
+    perf_report("get_not_modified", N, revalidated, psm_latency=PSM_LATENCY)
+
+    assert revalidated < cached < computed, (
+        f"304 {revalidated * 1e3:.2f} ms, cached 200 {cached * 1e3:.2f} ms, "
+        f"computed 200 {computed * 1e3:.2f} ms"
+    )
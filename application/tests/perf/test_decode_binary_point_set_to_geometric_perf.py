@@ -0,0 +1,33 @@
+"""Tests de performance pour la fonction decode_binary_point_set_to_geometric.
+
+Le décodage sans copie doit rester de l'ordre de la microseconde,
+quelle que soit la taille du PointSet.
+"""
+
+import os
+import struct
+import time
+
+import pytest
+
+from application.triangulator_app import decode_binary_point_set_to_geometric
+
+pytestmark = pytest.mark.perf
+
+N = 10**6
+MAX_DECODE_SECONDS = 1e-3
+
+
+def test_01_decode_binary_point_set_to_geometric_zero_copy_time():
+    """Décoder 10^6 points prend moins d'une milliseconde."""
+    # Octets aléatoires : seule la structure compte, pas les valeurs.
+    payload = struct.pack('I', N) + os.urandom(8 * N)
+
+    best = float('inf')
+    for _ in range(20):
+        start = time.perf_counter()
+        points = decode_binary_point_set_to_geometric(payload)
+        best = min(best, time.perf_counter() - start)
+
+    assert len(points) == N
+    assert best < MAX_DECODE_SECONDS, f"{best * 1e6:.1f} us"
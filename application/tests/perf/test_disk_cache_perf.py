@@ -0,0 +1,76 @@
+"""Tests de performance du cache disque des triangulations (DiskCache).
+
+Chronomètre le parcours du répertoire au démarrage (reconstruction de
+l'index) pour ENTRIES fichiers, et la lecture d'un résultat sur disque
+comparée à son recalcul.
+"""
+
+import os
+import random
+import struct
+import time
+
+import pytest
+
+from application.disk_cache import DiskCache
+from application.result_cache import point_set_digest
+from application.triangulator_app import triangulation_pipeline
+
+pytestmark = pytest.mark.perf
+
+ENTRIES = 100_000
+ENTRY_BYTES = 64
+MAX_SCAN_SECONDS = 1.0
+N = 10**4
+
+
+@pytest.fixture(scope="module")
+def populated_directory(tmp_path_factory) -> str:
+    """Répertoire de ENTRIES fichiers de cache, aux dates d'accès variées."""
+    directory = tmp_path_factory.mktemp("disk_cache")
+    value = b'x' * ENTRY_BYTES
+    for i in range(ENTRIES):
+        path = directory / i.to_bytes(16, "big").hex()
+        path.write_bytes(value)
+        os.utime(path, (i, ENTRIES - i))
+    return str(directory)
+
+
+def test_01_startup_scan(populated_directory, perf_report):
+    """L'index de ENTRIES fichiers est reconstruit en moins de MAX_SCAN_SECONDS."""
+    start = time.perf_counter()
+    cache = DiskCache(populated_directory, max_bytes=ENTRIES * ENTRY_BYTES)
+    seconds = time.perf_counter() - start
+
+    perf_report("disk_cache_scan", ENTRIES, seconds)
+
+    assert len(cache) == ENTRIES
+    # Le moins récemment lu en tête : mtime décroît avec i.
+    assert next(iter(cache._entries)) == (ENTRIES - 1).to_bytes(16, "big")
+    assert seconds < MAX_SCAN_SECONDS, f"scan {seconds:.2f} s for {ENTRIES} entries"
+
+
+def test_02_disk_hit_is_faster_than_recompute(tmp_path, perf_report):
+    """Relire des Triangles sur disque coûte bien moins que les recalculer."""
+    rng = random.Random(0)
+    point_set = struct.pack('I', N) + struct.pack(
+        f'{2 * N}f', *(rng.random() for _ in range(2 * N))
+    )
+    key = point_set_digest(point_set)
+
+    start = time.perf_counter()
+    triangles = triangulation_pipeline(point_set)
+    computed = time.perf_counter() - start
+
+    cache = DiskCache(str(tmp_path), max_bytes=1 << 30)
+    cache.put(key, triangles)
+    start = time.perf_counter()
+    assert DiskCache(str(tmp_path), max_bytes=1 << 30).get(key) == triangles
+    read = time.perf_counter() - start
+
+    perf_report("disk_cache_read", N, read, bytes=len(triangles))
+    perf_report("disk_cache_recompute", N, computed)
+
+    assert read < computed / 10, (
+        f"disk read {read * 1e3:.2f} ms, recompute {computed * 1e3:.2f} ms"
+    )
@@ -0,0 +1,98 @@
+"""Tests de performance de l'ajout de points à une triangulation.
+
+Compare l'insertion de DELTA points dans la triangulation en cache d'un
+PointSet de N points (POST /triangulation/{pointSetId}/points) au calcul
+complet de l'union, et vérifie que le coût de l'insertion suit le nombre de
+points ajoutés plutôt que N.
+"""
+
+import random
+import struct
+import time
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from application.incremental import IncrementalMesh, incremental_triangulate
+from application.triangulator_app import RESULT_CACHE, triangulator_app
+
+pytestmark = pytest.mark.perf
+
+N = 10**5
+DELTA = 10
+REPEATS = 10
+SIZES = [10**4, 10**5]
+
+
+def random_coords(rng: random.Random, count: int) -> list[float]:
+    """2 * count coordonnées tirées uniformément dans le carré unité."""
+    return [rng.random() for _ in range(2 * count)]
+
+
+def pack_points(coords: list[float]) -> bytes:
+    """PointSet binaire des coordonnées (x0, y0, x1, y1, ...)."""
+    return struct.pack('I', len(coords) // 2) + struct.pack(f'{len(coords)}f', *coords)
+
+
+def test_01_insert_is_faster_than_recompute(perf_report):
+    """Ajouter DELTA points coûte bien moins que trianguler l'union."""
+    rng = random.Random(0)
+    base = pack_points(random_coords(rng, N))
+    deltas = [pack_points(random_coords(rng, DELTA)) for _ in range(REPEATS + 1)]
+    client = triangulator_app.test_client()
+    url = f"/triangulation/{uuid.uuid4()}/points"
+
+    with patch('application.triangulator_app.psm_client_fetch_data',
+               return_value=base):
+        RESULT_CACHE.clear()
+        start = time.perf_counter()
+        assert client.post(url, data=deltas[0]).status_code == 200
+        first = time.perf_counter() - start
+
+        # Points différents à chaque requête : aucune réponse en cache.
+        inserted = float('inf')
+        for delta in deltas[1:]:
+            start = time.perf_counter()
+            assert client.post(url, data=delta).status_code == 200
+            inserted = min(inserted, time.perf_counter() - start)
+
+        union = struct.pack('I', N + DELTA) + base[4:] + deltas[0][4:]
+        RESULT_CACHE.clear()
+        start = time.perf_counter()
+        with patch('application.triangulator_app.psm_client_fetch_data',
+                   return_value=union):
+            assert client.get(f"/triangulation/{uuid.uuid4()}").status_code == 200
+        computed = time.perf_counter() - start
+
+    perf_report("insert_points_first", N, first, delta=DELTA)
+    perf_report("insert_points", N, inserted, delta=DELTA)
+    perf_report("insert_points_recompute", N + DELTA, computed)
+
+    assert inserted < computed / 50, (
+        f"insert {inserted * 1e3:.2f} ms, recompute {computed * 1e3:.2f} ms"
+    )
+
+
+def test_02_insert_cost_follows_the_delta(perf_report):
+    """Taille de base multipliée par 10 : insertion bien moins de 10 fois plus lente."""
+    rng = random.Random(1)
+    added = random_coords(rng, DELTA)
+    timings = []
+    for n in SIZES:
+        coords = random_coords(rng, n)
+        xs, ys = coords[0::2], coords[1::2]
+        mesh = IncrementalMesh(xs, ys, incremental_triangulate(xs, ys))
+
+        best = float('inf')
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            mesh.insert_points(added[0::2], added[1::2])
+            best = min(best, time.perf_counter() - start)
+        timings.append(best)
+        perf_report("insert_points_mesh", n, best, delta=DELTA)
+
+    growth = SIZES[1] / SIZES[0]
+    assert timings[1] < timings[0] * growth / 2, (
+        f"{DELTA} points : {[f'{t * 1e3:.2f} ms' for t in timings]} for {SIZES}"
+    )
@@ -0,0 +1,53 @@
+"""Tests de performance mémoire du maillage par demi-arêtes.
+
+Compare la mémoire par triangle du maillage en tableaux array('i') à celle
+des mêmes données en listes Python, et à celle du format Triangles_Geom
+(un dictionnaire par triangle).
+"""
+
+import random
+import time
+import tracemalloc
+
+import pytest
+
+from application.incremental import _Triangulation
+from application.spatial_order import brio_order
+
+pytestmark = pytest.mark.perf
+
+N = 10**5
+# Gain minimal de mémoire par triangle.
+MIN_MEMORY_RATIO = 8.0
+
+
+def test_01_bytes_per_triangle(perf_report):
+    """Le maillage occupe au moins MIN_MEMORY_RATIO fois moins de mémoire."""
+    rng = random.Random(0)
+    xs = [rng.random() for _ in range(N)]
+    ys = [rng.random() for _ in range(N)]
+    ids = brio_order(xs, ys)
+    triangulation = _Triangulation([xs[i] for i in ids], [ys[i] for i in ids], ids)
+    start = time.perf_counter()
+    mesh = triangulation.run()
+    elapsed = time.perf_counter() - start
+    triangles = mesh.triangle_count
+    mesh_bytes = mesh.nbytes / triangles
+
+    tracemalloc.start()
+    try:
+        lists = [list(mesh.vertex[:mesh.size]), list(mesh.twin[:mesh.size]),
+                 list(mesh.vertex_edge)]
+        list_bytes = tracemalloc.get_traced_memory()[0] / triangles
+        del lists
+        before = tracemalloc.get_traced_memory()[0]
+        geom = mesh.to_geom(ids)
+        geom_bytes = (tracemalloc.get_traced_memory()[0] - before) / len(geom)
+    finally:
+        tracemalloc.stop()
+
+    perf_report("mesh", N, elapsed, bytes_per_triangle=mesh_bytes,
+                list_bytes_per_triangle=list_bytes,
+                geom_bytes_per_triangle=geom_bytes)
+    assert list_bytes > MIN_MEMORY_RATIO * mesh_bytes
+    assert geom_bytes > MIN_MEMORY_RATIO * mesh_bytes
@@ -0,0 +1,41 @@
+"""Tests de performance de la localisation de points (jump-and-walk).
+
+Le rapport donne, pour chaque ordre d'insertion, avec et sans saut, la
+durée de la triangulation et la longueur moyenne des marches de
+localisation (triangles traversés par insertion).
+"""
+
+import random
+import time
+
+import pytest
+
+from application.incremental import incremental_triangulate
+from application.point_location import LOCATION_STATS
+from application.spatial_order import NO_ORDER, SPATIAL_ORDERS
+
+pytestmark = pytest.mark.perf
+
+N = 2 * 10**4
+# Longueur moyenne de marche maximale avec un ordre spatial.
+MAX_ORDERED_WALK = 8.0
+
+
+@pytest.mark.parametrize("order", SPATIAL_ORDERS)
+@pytest.mark.parametrize("jump", [False, True])
+def test_01_average_walk_length(order, jump, perf_report):
+    """Mesure la longueur moyenne de marche par insertion."""
+    rng = random.Random(0)
+    xs = [rng.random() for _ in range(N)]
+    ys = [rng.random() for _ in range(N)]
+
+    LOCATION_STATS.reset()
+    start = time.perf_counter()
+    incremental_triangulate(xs, ys, order, jump=jump)
+    elapsed = time.perf_counter() - start
+    stats = LOCATION_STATS.snapshot()
+    perf_report(f"point_location_{order}", N, elapsed, jump=jump, **stats)
+
+    assert stats['insertions'] == N - 3
+    if order != NO_ORDER:
+        assert stats['average_walk_length'] < MAX_ORDERED_WALK, stats
@@ -0,0 +1,67 @@
+"""Tests de performance de la détection des PointSets dégénérés.
+
+Compare point_set_degeneracy à l'échec des moteurs de triangulation sur des
+points tous alignés, et mesure la réponse sur des points en position
+générale. Les temps sont écrits dans le rapport JSON (fixture perf_report).
+"""
+
+import random
+import time
+from array import array
+
+import pytest
+
+from application.engines import ENGINES, triangulate
+from application.triangulator_app import point_set_degeneracy
+
+pytestmark = pytest.mark.perf
+
+SIZES = [10**3, 10**4, 10**5]
+# Sur des points alignés, la détection doit coûter moins que cette fraction
+# de l'échec du moteur le plus rapide.
+MAX_SHARE_OF_ENGINE = 0.25
+# Sur des points en position générale, elle ne doit pas dépasser ce temps.
+MAX_GENERAL_POSITION_SECONDS = 1e-3
+
+
+def collinear_points(n: int) -> tuple[array, array]:
+    """Retourne n points distincts, exactement alignés (float32), en oblique."""
+    return (array('f', [0.5 * i for i in range(n)]),
+            array('f', [0.25 * i + 1.0 for i in range(n)]))
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_01_collinear_fails_fast(n, perf_report):
+    """Points alignés : détection en une passe, bien avant l'échec du moteur."""
+    xs, ys = collinear_points(n)
+
+    start = time.perf_counter()
+    reason = point_set_degeneracy(xs, ys)
+    check_seconds = time.perf_counter() - start
+
+    engine_seconds = {}
+    for engine in ENGINES:
+        start = time.perf_counter()
+        with pytest.raises(ValueError, match=reason):
+            triangulate(xs, ys, engine)
+        engine_seconds[engine] = time.perf_counter() - start
+
+    perf_report("degeneracy_check", n, check_seconds, points="collinear",
+                **{f"{engine}_seconds": s for engine, s in engine_seconds.items()})
+    assert check_seconds < MAX_SHARE_OF_ENGINE * min(engine_seconds.values())
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_02_general_position_is_immediate(n, perf_report):
+    """Points aléatoires : le troisième point suffit, quel que soit n."""
+    rng = random.Random(0)
+    xs = array('f', [rng.random() for _ in range(n)])
+    ys = array('f', [rng.random() for _ in range(n)])
+
+    start = time.perf_counter()
+    reason = point_set_degeneracy(xs, ys)
+    seconds = time.perf_counter() - start
+
+    perf_report("degeneracy_check", n, seconds, points="uniform")
+    assert reason is None
+    assert seconds < MAX_GENERAL_POSITION_SECONDS
@@ -0,0 +1,61 @@
+"""Tests de performance des prédicats géométriques filtrés.
+
+Pour chaque moteur, sur des points uniformes, une grille (points alignés et
+cocirculaires) et des points sur un cercle, le rapport donne la durée de la
+triangulation et le taux de réussite du filtre flottant de chaque prédicat.
+"""
+
+import math
+import random
+import time
+
+import pytest
+
+from application.engines import ENGINES, triangulate
+from application.predicates import INCIRCLE, ORIENT2D, PREDICATE_STATS
+
+pytestmark = pytest.mark.perf
+
+N = 2 * 10**4
+# Taux minimal de réussite du filtre sur des points en position générale.
+MIN_UNIFORM_HIT_RATE = 0.99
+
+
+def uniform(n: int) -> tuple[list[float], list[float]]:
+    """Points uniformes dans le carré unité."""
+    rng = random.Random(0)
+    return [rng.random() for _ in range(n)], [rng.random() for _ in range(n)]
+
+
+def grid(n: int) -> tuple[list[float], list[float]]:
+    """Grille carrée d'environ n points à coordonnées entières."""
+    side = math.isqrt(n)
+    return ([float(i % side) for i in range(side * side)],
+            [float(i // side) for i in range(side * side)])
+
+
+def circle(n: int) -> tuple[list[float], list[float]]:
+    """Points (presque) cocirculaires, à l'arrondi flottant près."""
+    angles = [2 * math.pi * i / n for i in range(n)]
+    return [math.cos(a) for a in angles], [math.sin(a) for a in angles]
+
+
+@pytest.mark.parametrize("distribution", [uniform, grid, circle])
+@pytest.mark.parametrize("engine", ENGINES)
+def test_01_filter_hit_rate(engine, distribution, perf_report):
+    """Mesure le taux de réussite du filtre ; il tient en position générale."""
+    xs, ys = distribution(N)
+
+    PREDICATE_STATS.reset()
+    start = time.perf_counter()
+    triangulate(xs, ys, engine)
+    elapsed = time.perf_counter() - start
+    stats = PREDICATE_STATS.snapshot()
+    perf_report(f"predicates_{engine}", len(xs), elapsed,
+                distribution=distribution.__name__,
+                orient2d_hit_rate=stats[ORIENT2D]['filter_hit_rate'],
+                incircle_hit_rate=stats[INCIRCLE]['filter_hit_rate'])
+
+    if distribution is uniform:
+        for name in (ORIENT2D, INCIRCLE):
+            assert stats[name]['filter_hit_rate'] > MIN_UNIFORM_HIT_RATE, stats
@@ -0,0 +1,95 @@
+"""Tests de performance pour la fonction psm_client_fetch_data.
+
+Compare la latence médiane (p50) d'une récupération de PointSet auprès d'un
+PSM local, avec une connexion neuve par requête puis avec le pool de
+connexions persistantes.
+"""
+
+import http.client
+import os
+import statistics
+import struct
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from application import triangulator_app
+from application.psm_pool import PSMConnectionPool
+from application.triangulator_app import psm_client_fetch_data
+
+pytestmark = pytest.mark.perf
+
+N = 10**3
+REQUESTS = 500
+PAYLOAD = struct.pack('I', N) + os.urandom(8 * N)
+
+
+class _PSMStandIn(BaseHTTPRequestHandler):
+    """PSM local : GET /pointset/{id} renvoie toujours le même PointSet."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # noqa: N802
+        """Renvoie PAYLOAD en gardant la connexion ouverte."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, *args):
+        """Pas de journal pendant la mesure."""
+
+
+@pytest.fixture(scope="module")
+def psm_server():
+    """Démarre le PSM local dans un thread ; retourne (hôte, port)."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PSMStandIn)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,),
+                              daemon=True)
+    thread.start()
+    yield server.server_address
+    server.shutdown()
+    server.server_close()
+
+
+def fetch_p50(fetch) -> float:
+    """Latence médiane (secondes) de REQUESTS appels à fetch()."""
+    samples = []
+    for _ in range(REQUESTS):
+        start = time.perf_counter()
+        body = fetch()
+        samples.append(time.perf_counter() - start)
+    assert body == PAYLOAD
+    return statistics.median(samples)
+
+
+def test_01_psm_client_fetch_data_pool_lowers_p50(psm_server):
+    """Le pool keep-alive réduit la latence médiane d'une récupération."""
+    host, port = psm_server
+    uuid = "a1b2c3d4-e5f6-7890-1234-567890abcdef"
+
+    def fetch_new_connection():
+        conn = http.client.HTTPConnection(host, port, timeout=5)
+        try:
+            conn.request("GET", f"/pointset/{uuid}")
+            return conn.getresponse().read()
+        finally:
+            conn.close()
+
+    pool = PSMConnectionPool(host, port)
+    with patch.object(triangulator_app, "PSM_POOL", pool):
+        pool.warm(1)
+        pooled = fetch_p50(lambda: psm_client_fetch_data(uuid))
+    pool.close()
+    before = fetch_p50(fetch_new_connection)
+
+    assert pool.stats()['created'] == 1
+    assert pooled < before, (
+        f"p50 pooled {pooled * 1e6:.0f} us, new connection {before * 1e6:.0f} us"
+    )
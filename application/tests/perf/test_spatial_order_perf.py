@@ -0,0 +1,71 @@
+"""Tests de performance de l'ordre d'insertion du moteur incrémental.
+
+Compare l'ordre d'entrée, l'ordre de Hilbert et BRIO sur trois
+distributions : uniforme, en amas et en spirale. Sans ordre spatial, chaque
+localisation traverse le maillage ; avec, le coût par point reste constant.
+"""
+
+import math
+import random
+import time
+
+import pytest
+
+from application.engines import DIVIDE_AND_CONQUER, triangulate
+from application.incremental import incremental_triangulate
+from application.spatial_order import BRIO, HILBERT, NO_ORDER
+
+pytestmark = pytest.mark.perf
+
+N = 2 * 10**4
+# Gain minimal d'un ordre spatial sur l'ordre d'entrée.
+MIN_SPEEDUP = 2.0
+
+
+def uniform(n: int, rng: random.Random) -> tuple[list[float], list[float]]:
+    """Points uniformes dans le carré unité."""
+    return [rng.random() for _ in range(n)], [rng.random() for _ in range(n)]
+
+
+def clustered(n: int, rng: random.Random) -> tuple[list[float], list[float]]:
+    """Points gaussiens autour de 20 centres."""
+    centers = [(rng.random(), rng.random()) for _ in range(20)]
+    xs, ys = [], []
+    for _ in range(n):
+        cx, cy = rng.choice(centers)
+        xs.append(rng.gauss(cx, 0.01))
+        ys.append(rng.gauss(cy, 0.01))
+    return xs, ys
+
+
+def spiral(n: int, rng: random.Random) -> tuple[list[float], list[float]]:
+    """Points le long d'une spirale d'Archimède, légèrement bruités."""
+    xs, ys = [], []
+    for i in range(n):
+        t = i / n
+        angle = 60 * math.pi * t
+        xs.append(t * math.cos(angle) + rng.gauss(0, 1e-4))
+        ys.append(t * math.sin(angle) + rng.gauss(0, 1e-4))
+    return xs, ys
+
+
+@pytest.mark.parametrize("distribution", [uniform, clustered, spiral])
+def test_01_spatial_order_speeds_up_insertion(distribution, perf_report):
+    """Hilbert et BRIO sont au moins MIN_SPEEDUP fois plus rapides que l'ordre brut."""
+    xs, ys = distribution(N, random.Random(0))
+    name = distribution.__name__
+
+    times = {}
+    for order in (NO_ORDER, HILBERT, BRIO):
+        start = time.perf_counter()
+        incremental_triangulate(xs, ys, order)
+        times[order] = time.perf_counter() - start
+        perf_report(f"incremental_{order}", N, times[order], distribution=name)
+
+    start = time.perf_counter()
+    triangulate(xs, ys, DIVIDE_AND_CONQUER)
+    perf_report(DIVIDE_AND_CONQUER, N, time.perf_counter() - start,
+                distribution=name)
+
+    for order in (HILBERT, BRIO):
+        assert times[NO_ORDER] > MIN_SPEEDUP * times[order], times
@@ -0,0 +1,77 @@
+"""Tests de performance de l'envoi des Triangles depuis un fichier (send_file).
+
+Mesure, avec tracemalloc, le pic de mémoire allouée par le worker pendant
+qu'il envoie une réponse, l'application WSGI étant itérée morceau par
+morceau comme le ferait un serveur. Les fichiers de Triangles de SIZES
+octets sont placés directement dans SPILL_CACHE : seul l'envoi est mesuré.
+"""
+
+import struct
+import time
+import tracemalloc
+import uuid
+from unittest.mock import patch
+
+import pytest
+from werkzeug.test import EnvironBuilder
+
+from application.disk_cache import DiskCache
+from application.result_cache import ResultCache, point_set_digest
+from application.triangulator_app import triangulator_app
+
+pytestmark = pytest.mark.perf
+
+SIZES = [2**23, 2**25, 2**27]
+CHUNK = b'\0' * 2**20
+MAX_PEAK_BYTES = 2**20
+
+
+def serve(point_set: bytes) -> tuple[int, float, int]:
+    """Envoie GET /triangulation par l'application WSGI, sans garder le corps.
+
+    Returns :
+        (octets envoyés, durée en secondes, pic de mémoire allouée pendant
+        l'envoi)
+    """
+    environ = EnvironBuilder(path=f"/triangulation/{uuid.uuid4()}").get_environ()
+    sent = 0
+    with patch('application.triangulator_app.psm_client_fetch_data',
+               return_value=point_set):
+        tracemalloc.start()
+        try:
+            start = time.perf_counter()
+            app_iter = triangulator_app.wsgi_app(environ, lambda *args: None)
+            try:
+                for chunk in app_iter:
+                    sent += len(chunk)
+            finally:
+                app_iter.close()
+            seconds = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return sent, seconds, peak
+
+
+def test_01_peak_memory_is_flat(tmp_path, perf_report):
+    """Pic de mémoire de l'envoi indépendant de la taille des Triangles."""
+    cache = DiskCache(str(tmp_path), max_bytes=2 * sum(SIZES))
+    peaks = []
+    with patch('application.triangulator_app.SPILL_CACHE', cache), \
+         patch('application.triangulator_app.SPILL_MIN_BYTES', 1), \
+         patch('application.triangulator_app.RESULT_CACHE', ResultCache(0)):
+        # Le premier envoi (mise en route : imports, caches de Flask) n'est
+        # pas compté.
+        for attempt, size in enumerate([SIZES[0], *SIZES]):
+            point_set = struct.pack('I', 1) + struct.pack('2f', size, 0)
+            cache.put_chunks(point_set_digest(point_set),
+                             (CHUNK for _ in range(size // len(CHUNK))))
+
+            sent, seconds, peak = serve(point_set)
+
+            assert sent == size
+            if attempt:
+                peaks.append(peak)
+                perf_report("send_spilled_file", size, seconds, peak_bytes=peak)
+
+    assert max(peaks) < MAX_PEAK_BYTES, f"peaks {peaks} bytes for sizes {SIZES}"
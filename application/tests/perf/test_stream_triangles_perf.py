@@ -0,0 +1,106 @@
+"""Tests de performance de l'envoi par morceaux des Triangles (GET /triangulation).
+
+Mesure, avec tracemalloc, le pic de mémoire allouée par le worker pendant
+qu'il encode et envoie une réponse de plus de STREAM_MIN_BYTES octets,
+l'application WSGI étant itérée morceau par morceau comme le ferait un
+serveur. Le calcul est remplacé par un résultat préparé avant la mesure :
+seuls l'encodage, l'envoi et l'écriture dans DISK_CACHE sont mesurés.
+"""
+
+import random
+import struct
+import time
+import tracemalloc
+import uuid
+from array import array
+from unittest.mock import patch
+
+import pytest
+from werkzeug.test import EnvironBuilder
+
+from application.disk_cache import DiskCache
+from application.result_cache import point_set_digest
+from application.triangulator_app import (
+    STREAM_CHUNK_SIZE,
+    STREAM_MIN_BYTES,
+    triangles_binary_size,
+    triangulator_app,
+)
+from application.types import PointSet_Array, Triangles_Array
+
+pytestmark = pytest.mark.perf
+
+SIZES = [2**18, 2**20]
+MAX_PEAK_BYTES = 4 * STREAM_CHUNK_SIZE
+
+
+def prepared_result(n: int) -> tuple[bytes, dict]:
+    """PointSet binaire de n points et résultat de calcul (2n triangles) préparé."""
+    rng = random.Random(n)
+    xs = array('f', (rng.random() for _ in range(n)))
+    ys = array('f', (rng.random() for _ in range(n)))
+    indices = array('I', (rng.randrange(n) for _ in range(3 * 2 * n)))
+    coords = array('f', (c for xy in zip(xs, ys, strict=True) for c in xy))
+    point_set = struct.pack('I', n) + coords.tobytes()
+    return point_set, {
+        'points': PointSet_Array(xs, ys), 'triangles': Triangles_Array(indices),
+    }
+
+
+def serve(point_set: bytes, result: dict) -> tuple[int, float, int]:
+    """Envoie GET /triangulation par l'application WSGI, sans garder le corps.
+
+    Returns :
+        (octets envoyés, durée en secondes, pic de mémoire allouée pendant
+        l'envoi)
+    """
+    environ = EnvironBuilder(path=f"/triangulation/{uuid.uuid4()}").get_environ()
+    sent = 0
+    with patch('application.triangulator_app.psm_client_fetch_data',
+               return_value=point_set), \
+         patch('application.triangulator_app._triangulate_point_set',
+               return_value=result):
+        tracemalloc.start()
+        try:
+            start = time.perf_counter()
+            app_iter = triangulator_app.wsgi_app(environ, lambda *args: None)
+            try:
+                for chunk in app_iter:
+                    sent += len(chunk)
+            finally:
+                app_iter.close()
+            seconds = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return sent, seconds, peak
+
+
+@pytest.mark.parametrize("disk_cache", [False, True])
+def test_01_peak_memory_follows_the_chunk_size(disk_cache, tmp_path, perf_report):
+    """Pic de mémoire de l'envoi proche de STREAM_CHUNK_SIZE, pas de la taille.
+
+    Avec DISK_CACHE, les morceaux y sont écrits pendant l'envoi, sans être
+    gardés en mémoire.
+    """
+    cache = DiskCache(str(tmp_path), max_bytes=1 << 30) if disk_cache else None
+    peaks = []
+    with patch('application.triangulator_app.DISK_CACHE', cache):
+        # Le premier envoi (mise en route : imports, caches de Flask), d'un
+        # autre PointSet, n'est pas compté.
+        for attempt, n in enumerate([SIZES[0] // 2, *SIZES]):
+            point_set, result = prepared_result(n)
+            size = triangles_binary_size(n, 2 * n)
+            assert size > STREAM_MIN_BYTES
+
+            sent, seconds, peak = serve(point_set, result)
+
+            assert sent == size
+            if cache is not None:
+                assert cache.locate(point_set_digest(point_set))[1] == size
+            if attempt:
+                peaks.append(peak)
+                perf_report("send_streamed_triangles", size, seconds,
+                            peak_bytes=peak, disk_cache=disk_cache)
+
+    assert max(peaks) < MAX_PEAK_BYTES, f"peaks {peaks} bytes for sizes {SIZES}"
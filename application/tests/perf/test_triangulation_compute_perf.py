@@ -0,0 +1,49 @@
+"""Tests de performance pour la fonction triangulation_compute.
+
+Vérifie que le coût par point reste stable de 10^3 à 10^6 points,
+ce qui est attendu d'un moteur en O(n log n).
+"""
+
+import random
+import time
+
+import pytest
+
+from application.triangulator_app import triangulation_compute
+from application.types import PointSet_Geom
+
+pytestmark = pytest.mark.perf
+
+SIZES = [10**3, 10**4, 10**5, 10**6]
+# Le facteur log n (x2 entre 10^3 et 10^6) et les effets de cache
+# restent sous ce ratio ; un moteur quadratique le dépasse d'un facteur 1000.
+MAX_PER_POINT_RATIO = 3.0
+
+
+def random_point_set(n: int, seed: int = 0) -> PointSet_Geom:
+    """Génère n points uniformément répartis dans le carré unité."""
+    rng = random.Random(seed)
+    return [{'x': rng.random(), 'y': rng.random()} for _ in range(n)]
+
+
+def per_point_cost(n: int) -> float:
+    """Mesure le meilleur temps par point (en secondes) sur quelques essais."""
+    point_set = random_point_set(n)
+    repeats = max(1, 10**4 // n)
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = triangulation_compute(point_set)
+        best = min(best, time.perf_counter() - start)
+    assert len(result['triangles']) > 0
+    return best / n
+
+
+def test_01_triangulation_compute_per_point_cost_is_flat():
+    """Le coût par point à 10^6 reste du même ordre qu'à 10^3."""
+    costs = {n: per_point_cost(n) for n in SIZES}
+
+    ratio = costs[SIZES[-1]] / costs[SIZES[0]]
+    assert ratio < MAX_PER_POINT_RATIO, {
+        n: f"{cost * 1e6:.1f} us/point" for n, cost in costs.items()
+    }
@@ -0,0 +1,96 @@
+"""Tests de performance des étapes de triangulation_pipeline.
+
+Chronomètre validate_point_set, decode_binary_point_set_to_geometric,
+validate_and_decode_point_set (les deux précédentes en une étape),
+deduplicate_point_set, triangulation_compute,
+encode_triangulation_result_to_binary et le pipeline complet, de 10^1 à
+10^6 points. Les temps sont écrits dans le rapport JSON (fixture
+perf_report).
+"""
+
+import random
+import struct
+import time
+from collections.abc import Callable
+
+import pytest
+
+from application.triangulator_app import (
+    RESULT_CACHE,
+    decode_binary_point_set_to_geometric,
+    deduplicate_point_set,
+    encode_triangulation_result_to_binary,
+    triangulation_compute,
+    triangulation_pipeline,
+    validate_and_decode_point_set,
+    validate_point_set,
+)
+
+pytestmark = pytest.mark.perf
+
+SIZES = [10**k for k in range(1, 7)]
+# À partir de cette taille, chaque étape de conversion (validation,
+# détection des doublons, décodage, encodage) doit peser moins que cette
+# fraction du calcul.
+CODEC_SHARE_MIN_SIZE = 10**3
+MAX_CODEC_SHARE = 0.05
+
+
+def random_point_set_binary(n: int, seed: int = 0) -> bytes:
+    """Génère un PointSet binaire de n points uniformes dans le carré unité."""
+    rng = random.Random(seed)
+    return struct.pack('I', n) + struct.pack(
+        f'{2 * n}f', *(rng.random() for _ in range(2 * n))
+    )
+
+
+def best_time(function: Callable[[], object], repeats: int) -> float:
+    """Meilleur temps (secondes) de function() sur repeats essais."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_01_triangulation_pipeline_stage_times(n, perf_report):
+    """Chronomètre chaque étape et le pipeline complet pour n points."""
+    point_set = random_point_set_binary(n)
+    fast_repeats = max(3, 10**6 // n)
+    compute_repeats = max(1, 10**4 // n)
+
+    points = decode_binary_point_set_to_geometric(point_set)
+    result = triangulation_compute(points)
+
+    def pipeline_without_cache():
+        RESULT_CACHE.clear()
+        return triangulation_pipeline(point_set)
+
+    times = {
+        'validate': best_time(lambda: validate_point_set(point_set), fast_repeats),
+        'validate_decode': best_time(
+            lambda: validate_and_decode_point_set(point_set), fast_repeats
+        ),
+        'deduplicate': best_time(
+            lambda: deduplicate_point_set(point_set), fast_repeats
+        ),
+        'decode': best_time(
+            lambda: decode_binary_point_set_to_geometric(point_set), fast_repeats
+        ),
+        'compute': best_time(lambda: triangulation_compute(points), compute_repeats),
+        'encode': best_time(
+            lambda: encode_triangulation_result_to_binary(result), fast_repeats
+        ),
+        'pipeline': best_time(pipeline_without_cache, compute_repeats),
+    }
+    RESULT_CACHE.clear()
+
+    for stage, seconds in times.items():
+        perf_report(stage, n, seconds, triangles=len(result['triangles']))
+
+    if n >= CODEC_SHARE_MIN_SIZE:
+        for stage in ('validate', 'validate_decode', 'deduplicate', 'decode',
+                      'encode'):
+            assert times[stage] < MAX_CODEC_SHARE * times['compute'], times
@@ -0,0 +1,114 @@
+"""Tests de performance pour la route POST /triangulations.
+
+Compare IDS triangulations demandées en un seul POST /triangulations à
+IDS appels successifs de GET /triangulation/{pointSetId}, face à un PSM
+local qui répond après LATENCY secondes.
+"""
+
+import random
+import struct
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from application import triangulator_app
+from application.async_psm import AsyncPSMClient
+from application.psm_pool import PSMConnectionPool
+
+pytestmark = pytest.mark.perf
+
+N = 50
+IDS = 500
+LATENCY = 0.005
+
+
+class _PSMStandIn(BaseHTTPRequestHandler):
+    """PSM local : GET /pointset/{id} renvoie N points tirés à partir de id."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # noqa: N802
+        """Renvoie le PointSet de l'id après LATENCY secondes."""
+        rng = random.Random(self.path)
+        coords = [rng.uniform(-1000, 1000) for _ in range(2 * N)]
+        payload = struct.pack('I', N) + struct.pack(f'{2 * N}f', *coords)
+        time.sleep(LATENCY)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        """Pas de journal pendant la mesure."""
+
+
+class _PSMServer(ThreadingHTTPServer):
+    """Serveur du PSM local.
+
+    File d'attente assez longue pour les connexions ouvertes en même temps
+    par ASYNC_PSM_CLIENT : avec la valeur par défaut (5), les connexions
+    refusées ne sont retentées qu'après une seconde.
+    """
+
+    daemon_threads = True
+    request_queue_size = 128
+
+
+@pytest.fixture(scope="module")
+def psm_clients():
+    """Démarre le PSM local ; retourne un pool de connexions et un client asyncio."""
+    server = _PSMServer(("127.0.0.1", 0), _PSMStandIn)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,),
+                              daemon=True)
+    thread.start()
+    pool = PSMConnectionPool(*server.server_address, max_size=8)
+    async_client = AsyncPSMClient(*server.server_address, max_size=64)
+    yield pool, async_client
+
+    async def close():
+        async_client.close()
+
+    triangulator_app.ASYNC_LOOP.run(close())
+    pool.close()
+    server.shutdown()
+    server.server_close()
+
+
+def test_01_batch_is_faster_than_sequential_calls(psm_clients, perf_report):
+    """Un POST de IDS PointSetId est plus rapide que IDS GET successifs."""
+    psm_pool, async_client = psm_clients
+    client = triangulator_app.triangulator_app.test_client()
+    # PointSetId différents pour les deux mesures : pas de cache partagé.
+    batched_ids = [str(uuid.uuid4()) for _ in range(IDS)]
+    sequential_ids = [str(uuid.uuid4()) for _ in range(IDS)]
+
+    with patch.object(triangulator_app, "PSM_POOL", psm_pool), \
+         patch.object(triangulator_app, "ASYNC_PSM_CLIENT", async_client):
+        start = time.perf_counter()
+        response = client.post("/triangulations", json=batched_ids)
+        batched = time.perf_counter() - start
+        assert response.status_code == 200
+        body = response.get_data()
+
+        start = time.perf_counter()
+        for pointSetId in sequential_ids:
+            assert client.get(f"/triangulation/{pointSetId}").status_code == 200
+        sequential = time.perf_counter() - start
+
+    assert struct.unpack_from('I', body, 0) == (IDS,)
+    assert struct.unpack_from('I', body, 4) == (200,)
+
+    perf_report("triangulations_batch", IDS * N, batched,
+                ids=IDS, workers=triangulator_app.BATCH_WORKERS, latency=LATENCY)
+    perf_report("triangulations_sequential", IDS * N, sequential,
+                ids=IDS, latency=LATENCY)
+
+    assert batched < sequential, (
+        f"batch {batched:.2f} s, sequential {sequential:.2f} s"
+    )
@@ -0,0 +1,61 @@
+"""Tests de performance pour la fonction validate_and_decode_point_set.
+
+À 10^6 points, l'étape fusionnée est comparée à l'enchaînement qu'elle
+remplace : validate_point_set, decode_binary_point_set_to_geometric, puis
+le calcul de la boîte englobante par l'ordre spatial (min et max). Les temps
+sont écrits dans le rapport JSON (fixture perf_report).
+"""
+
+import random
+import struct
+import time
+from collections.abc import Callable
+
+import pytest
+
+from application.triangulator_app import (
+    decode_binary_point_set_to_geometric,
+    validate_and_decode_point_set,
+    validate_point_set,
+)
+
+pytestmark = pytest.mark.perf
+
+N = 10**6
+REPEATS = 10
+
+
+def best_time(function: Callable[[], object], repeats: int = REPEATS) -> float:
+    """Meilleur temps (secondes) de function() sur repeats essais."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def separate_stages(point_set: bytes) -> tuple:
+    """Vérification, décodage, puis boîte englobante, en étapes séparées."""
+    validate_point_set(point_set)
+    points = decode_binary_point_set_to_geometric(point_set)
+    xs, ys = points.xs, points.ys
+    return points, (min(xs), min(ys), max(xs), max(ys))
+
+
+def test_01_fused_stage_saves_a_pass(perf_report):
+    """L'étape fusionnée évite le parcours de validation (somme) à 10^6 points."""
+    rng = random.Random(0)
+    point_set = struct.pack('I', N) + struct.pack(
+        f'{2 * N}f', *(rng.random() for _ in range(2 * N))
+    )
+    assert validate_and_decode_point_set(point_set)[1] == (
+        separate_stages(point_set)[1]
+    )
+
+    separate = best_time(lambda: separate_stages(point_set))
+    fused = best_time(lambda: validate_and_decode_point_set(point_set))
+
+    perf_report("validate+decode+bounds", N, separate)
+    perf_report("validate_decode", N, fused, speedup=separate / fused)
+    assert fused < separate, (fused, separate)
@@ -0,0 +1,41 @@
+"""Tests de performance pour la fonction validate_triangles.
+
+La vérification d'un Triangles de 10^6 triangles (en-têtes, longueur et
+indices des sommets) ne parcourt les indices qu'une fois, en C (max() sur
+une vue memoryview). Les temps sont écrits dans le rapport JSON (fixture
+perf_report).
+"""
+
+import random
+import struct
+import time
+
+import pytest
+
+from application.triangulator_app import validate_triangles
+
+pytestmark = pytest.mark.perf
+
+SIZES = [10**4, 10**5, 10**6]
+# Budget par triangle (3 indices), largement sous le coût du calcul.
+MAX_SECONDS_PER_TRIANGLE = 0.5e-6
+
+
+@pytest.mark.parametrize("t", SIZES)
+def test_01_validate_triangles_time(t, perf_report):
+    """Vérifie t triangles sur t / 2 sommets en moins de 0.5 us par triangle."""
+    n = t // 2 + 2
+    rng = random.Random(0)
+    binary = (
+        struct.pack('I', n) + bytes(8 * n) + struct.pack('I', t)
+        + struct.pack(f'{3 * t}I', *(rng.randrange(n) for _ in range(3 * t)))
+    )
+
+    best = float('inf')
+    for _ in range(5):
+        start = time.perf_counter()
+        validate_triangles(binary)
+        best = min(best, time.perf_counter() - start)
+
+    perf_report("validate_triangles", t, best, points=n)
+    assert best < MAX_SECONDS_PER_TRIANGLE * t, f"{best * 1e3:.1f} ms"
@@ -6,9 +6,60 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from application.predicates import PREDICATE_STATS
+from application.triangulator_app import (
+    PSM_POOL,
+    RESULT_CACHE,
+    STAGE_METRICS,
+    triangulator_app,
+)
 from application.types import PointSet_Geom, Triangles_Geom, Triangulation_Result
 
 
+# Fixture commune - le cache des résultats ne doit pas relier les tests
+@pytest.fixture(autouse=True)
+def empty_result_cache():
+    """Vide le cache des triangulations avant chaque test."""
+    RESULT_CACHE.clear()
+    yield
+    RESULT_CACHE.clear()
+
+
+# Fixture commune - une connexion (mockée) ne doit pas passer d'un test à l'autre
+@pytest.fixture(autouse=True)
+def empty_psm_pool():
+    """Ferme les connexions au repos du pool PSM avant et après chaque test."""
+    PSM_POOL.close()
+    yield
+    PSM_POOL.close()
+
+
+# Fixture commune - les mesures d'un test ne passent pas au suivant
+@pytest.fixture(autouse=True)
+def empty_stage_metrics():
+    """Remet à zéro les histogrammes de latence et compteurs avant chaque test."""
+    STAGE_METRICS.reset()
+    PREDICATE_STATS.reset()
+    yield
+
+
+# Fixture commune - tests des routes, par le client de test Flask
+@pytest.fixture
+def client():
+    """Client de test Flask."""
+    return triangulator_app.test_client()
+
+
+# Fixture commune - PointSet du carré unité (4 points, 2 triangles)
+SQUARE_POINT_SET = struct.pack('I', 4) + struct.pack('8f', 0, 0, 1, 0, 1, 1, 0, 1)
+
+
+@pytest.fixture
+def square_point_set() -> bytes:
+    """PointSet binaire du carré unité, renvoyé par les PSM simulés."""
+    return SQUARE_POINT_SET
+
+
 # Fixture - test_check_valid_uuid.py
 @pytest.fixture(params=[
     "a1b2c3d4-e5f6-7890-1234-567890abcdef",  # Standard
@@ -99,15 +150,15 @@ def point_set_binary_geometric_pairs(request):
             ],
             'triangles':[
                 {'v1': 0, 'v2': 1, 'v3': 2},
-                {'v1': 0, 'v2': 1, 'v4': 2},
+                {'v1': 1, 'v2': 3, 'v3': 2},
                 
             ]
         }),
         "encoded_binary_expected":(
-            struct.pack('I', 3) + 
-            struct.pack('ffffff', 0.0, 0.0, 1.0, 0.0, 0.0, 1.0) + 
-            struct.pack('I', 1) + 
-            struct.pack('III', 0, 1, 2)
+            struct.pack('I', 4) + 
+            struct.pack('ffffffff', 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 1.0) + 
+            struct.pack('I', 2) + 
+            struct.pack('IIIIII', 0, 1, 2, 1, 3, 2)
             
         )
     },
@@ -285,7 +336,7 @@ _1_PointSet = (
                 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1,   #Pts 1 to 5
                 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9, 2.0) #Pts 6 to 10
 )
-_1_expected_result = "None"
+_1_expected_result = None
 _1_message = "None"
 
 # Case 2 - Not-valid Point Set
@@ -0,0 +1,141 @@
+"""Tests unitaires du client asyncio du PSM (AsyncPSMClient, EventLoopThread)."""
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from werkzeug.exceptions import HTTPException, NotFound
+
+from application.async_psm import AsyncPSMClient, EventLoopThread
+from application.triangulator_app import (
+    ASYNC_LOOP,
+    PSM_NOT_FOUND,
+    PSM_UNAVAILABLE,
+    psm_client_fetch_data_async,
+)
+
+VALID_UUID = str(uuid.uuid4())
+
+
+async def serve(responses: list[bytes], close_after: bool = False):
+    """Démarre un PSM local qui envoie les réponses brutes, une par requête.
+
+    Returns :
+        (serveur, port, liste des connexions reçues)
+    """
+    connections = []
+
+    async def handle(reader, writer):
+        connections.append(writer)
+        while responses:
+            request = await reader.readuntil(b"\r\n\r\n")
+            assert request.startswith(b"GET /pointset/")
+            writer.write(responses.pop(0))
+            await writer.drain()
+            if close_after:
+                break
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1], connections
+
+
+def ok(body: bytes, *headers: str) -> bytes:
+    """Réponse HTTP/1.1 200 avec Content-Length et en-têtes supplémentaires."""
+    lines = ["HTTP/1.1 200 OK", f"Content-Length: {len(body)}", *headers]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode() + body
+
+
+def test_01_keep_alive_reuses_the_connection():
+    """Deux requêtes successives : une seule connexion TCP."""
+    async def scenario():
+        server, port, connections = await serve([ok(b"first"), ok(b"second")])
+        client = AsyncPSMClient("127.0.0.1", port)
+        async with server:
+            first = await client.request("GET", "/pointset/a")
+            second = await client.request("GET", "/pointset/b")
+            client.close()
+        return first, second, client.stats(), len(connections)
+
+    first, second, stats, connections = asyncio.run(scenario())
+
+    assert first == (200, b"first")
+    assert second == (200, b"second")
+    assert (stats['created'], stats['reused'], connections) == (1, 1, 1)
+
+
+def test_02_chunked_and_connection_close():
+    """Corps "chunked" ; "Connection: close" : la connexion n'est pas gardée."""
+    chunked = (b"HTTP/1.1 404 Not Found\r\nTransfer-Encoding: chunked\r\n"
+               b"Connection: close\r\n\r\n3\r\nabc\r\n2\r\nde\r\n0\r\n\r\n")
+
+    async def scenario():
+        server, port, _ = await serve([chunked])
+        client = AsyncPSMClient("127.0.0.1", port)
+        async with server:
+            response = await client.request("GET", "/pointset/a")
+        return response, client.stats()
+
+    response, stats = asyncio.run(scenario())
+
+    assert response == (404, b"abcde")
+    assert stats['idle'] == 0
+    assert stats['discarded'] == 1
+
+
+def test_03_stale_connection_is_replayed():
+    """Connexion réutilisée fermée par le PSM : requête rejouée une fois."""
+    async def scenario():
+        server, port, connections = await serve(
+            [ok(b"first"), ok(b"second")], close_after=True
+        )
+        client = AsyncPSMClient("127.0.0.1", port)
+        async with server:
+            await client.request("GET", "/pointset/a")
+            await asyncio.sleep(0.05)
+            second = await client.request("GET", "/pointset/b")
+        return second, client.stats(), len(connections)
+
+    second, stats, connections = asyncio.run(scenario())
+
+    assert second == (200, b"second")
+    assert stats['created'] == connections == 2
+
+
+def test_04_event_loop_thread():
+    """Coroutines exécutées dans le thread de la boucle ; exceptions transmises."""
+    loop_thread = EventLoopThread()
+
+    async def fail():
+        raise NotFound("missing")
+
+    try:
+        assert loop_thread.run(asyncio.sleep(0, result=42)) == 42
+        with pytest.raises(NotFound):
+            loop_thread.run(fail())
+    finally:
+        loop_thread.stop()
+
+
+@pytest.mark.parametrize("psm_request, status, message", [
+    (AsyncMock(), 200, None),
+    (AsyncMock(return_value=(404, b"")), 404, PSM_NOT_FOUND),
+    (AsyncMock(side_effect=ConnectionRefusedError), 503, PSM_UNAVAILABLE),
+    (AsyncMock(side_effect=asyncio.TimeoutError), 503, PSM_UNAVAILABLE),
+])
+def test_05_fetch_data_async_errors(psm_request, status, message, square_point_set):
+    """psm_client_fetch_data_async : mêmes erreurs HTTP que la variante synchrone."""
+    if status == 200:
+        psm_request.return_value = (200, square_point_set)
+    with patch('application.triangulator_app.ASYNC_PSM_CLIENT.request', psm_request):
+        try:
+            result = ASYNC_LOOP.run(psm_client_fetch_data_async(VALID_UUID))
+        except HTTPException as error:
+            result = error
+
+    psm_request.assert_awaited_once_with("GET", f"/pointset/{VALID_UUID}")
+    if status == 200:
+        assert result == square_point_set
+    else:
+        assert (result.code, result.description) == (status, message)
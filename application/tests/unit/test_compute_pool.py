@@ -0,0 +1,63 @@
+"""Tests unitaires du pool de processus de triangulation."""
+
+import random
+import struct
+from array import array
+from unittest.mock import patch
+
+import pytest
+
+from application.compute_pool import ComputePool
+from application.delaunay import COLLINEAR_POINTS
+from application.engines import DIVIDE_AND_CONQUER, triangulate
+from application.triangulator_app import (
+    decode_binary_point_set_to_geometric,
+    triangulation_compute,
+)
+
+
+@pytest.fixture(scope="module")
+def compute_pool():
+    """Pool d'un processus, partagé par les tests du module."""
+    pool = ComputePool(1)
+    yield pool
+    pool.shutdown()
+
+
+def test_01_pool_matches_inline_engine(compute_pool):
+    """Le pool retourne les mêmes indices que le moteur appelé directement."""
+    rng = random.Random(0)
+    xs = array('f', (rng.random() for _ in range(500)))
+    ys = array('f', (rng.random() for _ in range(500)))
+
+    assert compute_pool.triangulate(xs, ys, 'f') == triangulate(xs, ys)
+    assert (compute_pool.triangulate(xs, ys, 'f', DIVIDE_AND_CONQUER)
+            == triangulate(xs, ys, DIVIDE_AND_CONQUER))
+
+
+def test_02_pool_accepts_strided_views(compute_pool):
+    """Les vues à pas de 2 d'un PointSet décodé sont envoyées correctement."""
+    point_set = struct.pack('I', 4) + struct.pack('f' * 8, 0, 0, 1, 0, 1, 1, 0, 1)
+    points = decode_binary_point_set_to_geometric(point_set)
+
+    with patch('application.triangulator_app.COMPUTE_POOL', compute_pool):
+        pooled = triangulation_compute(points)
+    inline = triangulation_compute(points)
+
+    assert pooled['triangles'] == inline['triangles']
+    assert pooled['points'] is points
+
+
+def test_03_pool_propagates_engine_errors(compute_pool):
+    """Une ValueError du moteur est relevée dans le processus appelant."""
+    xs = array('d', [0.0, 1.0, 2.0])
+    ys = array('d', [0.0, 1.0, 2.0])
+
+    with pytest.raises(ValueError, match=COLLINEAR_POINTS):
+        compute_pool.triangulate(xs, ys, 'd')
+
+
+def test_04_pool_requires_a_worker():
+    """Un pool sans processus est refusé."""
+    with pytest.raises(ValueError):
+        ComputePool(0)
@@ -0,0 +1,101 @@
+"""Tests unitaires des requêtes conditionnelles sur GET /triangulation/{pointSetId}.
+
+Le PSM est remplacé par un mock de psm_client_fetch_data ; la route est
+appelée par le client de test Flask.
+"""
+
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from application.result_cache import point_set_digest
+from application.triangulator_app import (
+    POINT_SET_DIGESTS,
+    TRIANGLES_CACHE_CONTROL,
+    point_set_etag,
+)
+
+
+@pytest.fixture
+def square_etag(square_point_set) -> str:
+    """ETag (entre guillemets) des Triangles du carré unité."""
+    return f'"{point_set_etag(point_set_digest(square_point_set))}"'
+
+
+@pytest.fixture
+def mock_fetch_data(square_point_set):
+    """PSM simulé : tout PointSetId désigne le carré unité."""
+    with patch('application.triangulator_app.psm_client_fetch_data',
+               return_value=square_point_set) as mock:
+        yield mock
+
+
+def test_01_response_carries_etag_and_cache_control(
+        client, mock_fetch_data, square_etag):
+    """Réponse 200 : ETag fort (empreinte du PointSet), Cache-Control immuable."""
+    response = client.get(f"/triangulation/{uuid.uuid4()}")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == square_etag
+    assert response.headers["Cache-Control"] == TRIANGLES_CACHE_CONTROL
+
+
+@pytest.mark.parametrize("if_none_match", ["{etag}", "W/{etag}", "*"])
+def test_02_known_id_is_not_fetched_again(
+        client, mock_fetch_data, square_etag, if_none_match):
+    """ETag déjà vu pour ce PointSetId : 304, sans PSM ni calcul."""
+    if_none_match = if_none_match.format(etag=square_etag)
+    pointSetId = str(uuid.uuid4())
+    client.get(f"/triangulation/{pointSetId}")
+
+    with patch('application.triangulator_app.triangulation_pipeline_payload') as pipe:
+        response = client.get(f"/triangulation/{pointSetId}",
+                              headers={"If-None-Match": if_none_match})
+
+    assert response.status_code == 304
+    assert response.get_data() == b""
+    assert response.headers["ETag"] == square_etag
+    assert response.headers["Cache-Control"] == TRIANGLES_CACHE_CONTROL
+    mock_fetch_data.assert_called_once_with(pointSetId)
+    pipe.assert_not_called()
+
+
+def test_03_unknown_id_is_fetched_but_not_computed(
+        client, mock_fetch_data, square_etag, square_point_set):
+    """PointSetId absent de POINT_SET_DIGESTS : récupéré, 304 sans calcul."""
+    pointSetId = str(uuid.uuid4())
+
+    with patch('application.triangulator_app.triangulation_pipeline_payload') as pipe:
+        response = client.get(f"/triangulation/{pointSetId}",
+                              headers={"If-None-Match": square_etag})
+
+    assert response.status_code == 304
+    mock_fetch_data.assert_called_once_with(pointSetId)
+    pipe.assert_not_called()
+    assert POINT_SET_DIGESTS.get(pointSetId.encode()) == (
+        point_set_digest(square_point_set)
+    )
+
+
+def test_04_stale_etag_gets_the_triangles(
+        client, mock_fetch_data, square_etag, square_point_set):
+    """ETag différent : 200 avec les Triangles, une seule récupération."""
+    pointSetId = str(uuid.uuid4())
+
+    response = client.get(f"/triangulation/{pointSetId}",
+                          headers={"If-None-Match": '"0123", "4567"'})
+
+    assert response.status_code == 200
+    assert response.get_data().startswith(square_point_set)
+    assert response.headers["ETag"] == square_etag
+    mock_fetch_data.assert_called_once_with(pointSetId)
+
+
+def test_05_invalid_id_with_if_none_match(client, mock_fetch_data):
+    """PointSetId invalide : 400, même avec If-None-Match: *."""
+    response = client.get("/triangulation/not-a-uuid",
+                          headers={"If-None-Match": "*"})
+
+    assert response.status_code == 400
+    mock_fetch_data.assert_not_called()
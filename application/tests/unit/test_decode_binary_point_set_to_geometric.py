@@ -3,6 +3,11 @@
 Vérifie si la conversion est correcte pour un ensembe d'entrée différentes.
 """
 
+import struct
+from array import array
+
+import pytest
+
 from application.triangulator_app import decode_binary_point_set_to_geometric
 
 
@@ -13,4 +18,39 @@ def test_01_decode_binary_point_set_to_geometric(point_set_binary_geometric_pair
 
     actual = decode_binary_point_set_to_geometric(binary)
     
-    assert actual == expected
\ No newline at end of file
+    assert actual == expected
+
+def test_02_decode_is_zero_copy():
+    """Les coordonnées sont des vues sur le tampon d'entrée, sans duplication."""
+    binary = struct.pack('Iffff', 2, 5.5, 12.5, 1, 13)
+
+    actual = decode_binary_point_set_to_geometric(binary)
+
+    assert isinstance(actual.xs, memoryview)
+    assert actual.xs.obj is binary
+    assert actual.ys.obj is binary
+    assert list(actual.xs) == [5.5, 1.0]
+    assert list(actual.ys) == [12.5, 13.0]
+
+
+def test_03_decode_with_copy_is_independent(point_set_binary_geometric_pairs):
+    """Avec copy=True, les coordonnées sont des array('f') indépendants."""
+    expected = point_set_binary_geometric_pairs["decoded_geometric"]
+    binary = bytearray(point_set_binary_geometric_pairs["encoded_binary"])
+
+    actual = decode_binary_point_set_to_geometric(binary, copy=True)
+    binary[4:] = bytes(len(binary) - 4)
+
+    assert isinstance(actual.xs, array)
+    assert actual == expected
+
+
+@pytest.mark.parametrize("binary", [
+    b'',                                   # Pas d'en-tête
+    struct.pack('I', 2) + struct.pack('ff', 1, 2),   # 2 points annoncés, 1 reçu
+    struct.pack('I', 0) + b'\x00',         # Octet en trop
+])
+def test_04_decode_rejects_length_mismatch(binary):
+    """La longueur du flux doit correspondre au nombre de points annoncé."""
+    with pytest.raises(ValueError):
+        decode_binary_point_set_to_geometric(binary)
@@ -0,0 +1,65 @@
+"""Tests unitaires pour la détection des points en double (deduplicate_point_set)."""
+
+import struct
+from array import array
+from unittest.mock import patch
+
+import pytest
+from werkzeug.exceptions import InternalServerError
+
+from application.triangulator_app import (
+    DUPLICATES_REJECT,
+    POINT_SET_DUPLICATE_POINTS,
+    compact_point_set,
+    deduplicate_point_set,
+    triangulation_pipeline,
+)
+
+
+def point_set(*coords: float) -> bytes:
+    """PointSet binaire des points (x0, y0, x1, y1, ...)."""
+    return struct.pack('I', len(coords) // 2) + struct.pack(f'{len(coords)}f', *coords)
+
+
+def test_01_distinct_points():
+    """Points tous distincts : pas de table de correspondance."""
+    assert deduplicate_point_set(point_set(0, 0, 1, 0, 0, 1)) is None
+    assert deduplicate_point_set(point_set()) is None
+
+
+def test_02_collapse_keeps_first_occurrences():
+    """Les premiers exemplaires sont gardés, dans l'ordre du PointSet."""
+    pointSet = point_set(0, 0, 1, 0, 0, 0, 0, 1, 1, 0, 0, 0)
+
+    keep = deduplicate_point_set(pointSet)
+
+    assert keep == array('I', [0, 1, 3])
+    assert compact_point_set(pointSet, keep).to_geom() == [
+        {'x': 0.0, 'y': 0.0}, {'x': 1.0, 'y': 0.0}, {'x': 0.0, 'y': 1.0},
+    ]
+
+
+def test_03_reject_duplicates():
+    """Mode DUPLICATES_REJECT : ValueError, puis 500 par le pipeline."""
+    pointSet = point_set(0, 0, 1, 0, 0, 1, 1, 0)
+
+    with patch('application.triangulator_app.DUPLICATE_POINTS', DUPLICATES_REJECT):
+        with pytest.raises(ValueError, match=POINT_SET_DUPLICATE_POINTS):
+            deduplicate_point_set(pointSet)
+        with pytest.raises(InternalServerError) as excinfo:
+            triangulation_pipeline(pointSet)
+
+    assert POINT_SET_DUPLICATE_POINTS in str(excinfo.value)
+
+
+def test_04_pipeline_addresses_original_vertices():
+    """Triangles calculés sur les points distincts, indices d'origine en sortie."""
+    pointSet = point_set(1, 1, 1, 1, 0, 0, 1, 0, 0, 0, 0, 1)
+
+    result = triangulation_pipeline(pointSet)
+
+    assert result[:len(pointSet)] == pointSet
+    (t,) = struct.unpack_from('I', result, len(pointSet))
+    indices = struct.unpack_from(f'{3 * t}I', result, len(pointSet) + 4)
+    assert t == 2
+    assert set(indices) == {0, 2, 3, 5}
@@ -0,0 +1,226 @@
+"""Tests unitaires pour le cache disque des triangulations (DiskCache).
+
+Vérifie la persistance entre instances, le budget en octets, l'éviction
+LRU (y compris l'ordre retrouvé au redémarrage), la version des entrées et
+l'intégration au pipeline.
+"""
+
+import os
+import struct
+from unittest.mock import Mock, patch
+
+from application.disk_cache import TEMP_PREFIX, DiskCache
+from application.result_cache import ResultCache, point_set_digest, settings_version
+from application.triangulator_app import (
+    CACHE_VERSION,
+    _triangulate_point_set,
+    point_set_etag,
+    triangulation_pipeline,
+)
+
+KEY_A, KEY_B, KEY_C, KEY_D = (bytes([i]) * 16 for i in range(4))
+
+
+def set_access_time(cache: DiskCache, key: bytes, seconds: int) -> None:
+    """Date de dernier accès (mtime) du fichier de key, ramenée à seconds."""
+    os.utime(os.path.join(cache.directory, key.hex()), (seconds, seconds))
+
+
+def test_01_disk_cache_hit_miss(tmp_path):
+    """Un get sur une clé absente est un miss, sur une clé présente un hit."""
+    cache = DiskCache(str(tmp_path), max_bytes=100)
+
+    assert cache.get(KEY_A) is None
+    cache.put(KEY_A, b'value')
+
+    assert cache.get(KEY_A) == b'value'
+    assert os.listdir(tmp_path) == [KEY_A.hex()]
+    assert cache.stats() == {
+        'entries': 1, 'bytes': 5, 'max_bytes': 100,
+        'hits': 1, 'misses': 1, 'evictions': 0, 'errors': 0,
+    }
+
+
+def test_02_disk_cache_survives_restart(tmp_path):
+    """Une nouvelle instance retrouve les entrées, ignore les autres fichiers.
+
+    Les fichiers temporaires (écriture interrompue) sont supprimés.
+    """
+    DiskCache(str(tmp_path), max_bytes=100).put(KEY_A, b'value')
+    (tmp_path / f"{TEMP_PREFIX}partial").write_bytes(b'val')
+    (tmp_path / "README").write_bytes(b'not an entry')
+
+    cache = DiskCache(str(tmp_path), max_bytes=100)
+
+    assert len(cache) == 1
+    assert cache.current_bytes == 5
+    assert cache.get(KEY_A) == b'value'
+    assert sorted(os.listdir(tmp_path)) == sorted(["README", KEY_A.hex()])
+
+
+def test_03_disk_cache_lru_eviction(tmp_path):
+    """Le budget est respecté en supprimant le fichier le moins récemment lu."""
+    cache = DiskCache(str(tmp_path), max_bytes=30)
+    for key in (KEY_A, KEY_B, KEY_C):
+        cache.put(key, b'x' * 10)
+    cache.get(KEY_A)                # KEY_B devient la moins récente
+
+    cache.put(KEY_D, b'x' * 10)
+
+    assert KEY_B not in cache
+    assert not os.path.exists(tmp_path / KEY_B.hex())
+    assert all(key in cache for key in (KEY_A, KEY_C, KEY_D))
+    assert cache.current_bytes == 30
+    assert cache.evictions == 1
+
+
+def test_04_disk_cache_lru_order_after_restart(tmp_path):
+    """Au démarrage, l'ordre LRU suit la date d'accès, et le budget s'applique."""
+    cache = DiskCache(str(tmp_path), max_bytes=100)
+    for key, seconds in ((KEY_A, 3), (KEY_B, 1), (KEY_C, 2)):
+        cache.put(key, b'x' * 10)
+        set_access_time(cache, key, seconds)
+
+    restarted = DiskCache(str(tmp_path), max_bytes=20)
+
+    assert KEY_B not in restarted
+    assert list(restarted._entries) == [KEY_C, KEY_A]
+    assert sorted(os.listdir(tmp_path)) == sorted([KEY_A.hex(), KEY_C.hex()])
+
+
+def test_05_disk_cache_oversized_value_replace_and_clear(tmp_path):
+    """Valeur plus grosse que le budget ignorée ; put remplace ; clear vide."""
+    cache = DiskCache(str(tmp_path), max_bytes=10)
+    cache.put(KEY_A, b'x' * 11)
+    assert KEY_A not in cache
+    assert os.listdir(tmp_path) == []
+
+    cache.put(KEY_A, b'12345')
+    cache.put(KEY_A, b'123')
+    assert cache.get(KEY_A) == b'123'
+    assert cache.current_bytes == 3
+
+    cache.clear()
+    assert len(cache) == 0
+    assert os.listdir(tmp_path) == []
+
+
+def test_06_disk_cache_shared_directory(tmp_path):
+    """Fichiers écrits ou supprimés par une autre instance (autre processus)."""
+    cache = DiskCache(str(tmp_path), max_bytes=100)
+    other = DiskCache(str(tmp_path), max_bytes=100)
+
+    other.put(KEY_A, b'value')
+    assert cache.get(KEY_A) == b'value'
+    assert cache.current_bytes == 5
+
+    other.clear()
+    assert cache.get(KEY_A) is None
+    assert KEY_A not in cache
+    assert cache.current_bytes == 0
+
+
+def test_07_disk_cache_write_error(tmp_path):
+    """Une erreur d'écriture n'est pas levée : l'entrée n'est pas gardée."""
+    cache = DiskCache(str(tmp_path), max_bytes=100)
+
+    with patch('application.disk_cache.os.replace', side_effect=OSError):
+        cache.put(KEY_A, b'value')
+
+    assert KEY_A not in cache
+    assert cache.errors == 1
+    assert os.listdir(tmp_path) == []
+
+
+@patch('application.triangulator_app._triangulate_point_set',
+       wraps=_triangulate_point_set)
+def test_08_pipeline_reads_and_fills_the_disk_tier(mock_triangulate: Mock, tmp_path):
+    """Le pipeline écrit sur disque, puis relit le disque après un redémarrage."""
+    point_set = struct.pack('I', 3) + struct.pack('6f', 0, 0, 1, 0, 0, 1)
+    key = point_set_digest(point_set)
+
+    with patch('application.triangulator_app.RESULT_CACHE', ResultCache(1 << 20)), \
+         patch('application.triangulator_app.DISK_CACHE',
+               DiskCache(str(tmp_path), 1 << 20)) as disk_cache:
+        triangles = triangulation_pipeline(point_set)
+        assert disk_cache.get(key) == triangles
+
+    # Redémarrage : cache mémoire vide, nouvelle instance sur le répertoire.
+    restarted_memory = ResultCache(1 << 20)
+    with patch('application.triangulator_app.RESULT_CACHE', restarted_memory), \
+         patch('application.triangulator_app.DISK_CACHE',
+               DiskCache(str(tmp_path), 1 << 20)):
+        assert triangulation_pipeline(point_set) == triangles
+
+    mock_triangulate.assert_called_once()
+    assert restarted_memory.get(key) == triangles
+
+
+def test_09_disk_cache_put_chunks_and_locate(tmp_path):
+    """Écriture par morceaux ; locate donne le fichier sans le lire."""
+    cache = DiskCache(str(tmp_path), max_bytes=10)
+
+    path = cache.put_chunks(KEY_A, iter([b'123', b'45']))
+    assert cache.locate(KEY_A) == (path, 5)
+    with open(path, "rb") as file:
+        assert file.read() == b'12345'
+
+    # Contenu plus gros que le budget découvert en cours d'écriture.
+    assert cache.put_chunks(KEY_B, iter([b'x' * 6, b'x' * 6])) is None
+    assert cache.locate(KEY_B) is None
+    assert os.listdir(tmp_path) == [KEY_A.hex()]
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+
+def test_10_disk_cache_ignores_other_versions(tmp_path):
+    """Fichiers d'une autre version : ignorés, supprimés une fois périmés."""
+    DiskCache(str(tmp_path), max_bytes=100, version="v1").put(KEY_A, b'old')
+    DiskCache(str(tmp_path), max_bytes=100).put(KEY_B, b'unversioned')
+
+    cache = DiskCache(str(tmp_path), max_bytes=100, version="v2")
+
+    # Encore utilisés par les processus de l'autre version : gardés.
+    assert len(cache) == 0
+    assert cache.get(KEY_A) is None
+    assert sorted(os.listdir(tmp_path)) == sorted([f"{KEY_A.hex()}.v1", KEY_B.hex()])
+    cache.put(KEY_A, b'new')
+    assert DiskCache(str(tmp_path), max_bytes=100, version="v1").get(KEY_A) == b'old'
+
+    # Non lus depuis stale_after secondes : supprimés.
+    os.utime(tmp_path / KEY_B.hex(), (0, 0))
+    restarted = DiskCache(str(tmp_path), max_bytes=100, version="v2",
+                          stale_after=3600)
+    assert restarted.get(KEY_A) == b'new'
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        [f"{KEY_A.hex()}.v1", f"{KEY_A.hex()}.v2"]
+    )
+
+
+def test_11_settings_change_the_cache_version():
+    """Moteur ou options différents : autre version, autre ETag."""
+    digest = point_set_digest(b'point set')
+    assert point_set_etag(digest).startswith(CACHE_VERSION)
+    assert settings_version(1, "incremental") == settings_version(1, "incremental")
+    assert settings_version(1, "incremental") != settings_version(1, "divide")
+    assert settings_version(1, "incremental") != settings_version(2, "incremental")
+
+
+def test_12_disk_cache_tee_chunks(tmp_path):
+    """tee_chunks transmet les morceaux ; l'entrée n'est gardée qu'en fin d'envoi."""
+    cache = DiskCache(str(tmp_path), max_bytes=10)
+
+    assert list(cache.tee_chunks(KEY_A, iter([b'123', b'45']))) == [b'123', b'45']
+    assert cache.get(KEY_A) == b'12345'
+
+    # Itérateur fermé avant la fin (client déconnecté) : rien n'est écrit.
+    chunks = cache.tee_chunks(KEY_B, iter([b'123', b'45']))
+    assert next(chunks) == b'123'
+    chunks.close()
+
+    # Contenu plus gros que le budget : transmis en entier, pas gardé.
+    large = [b'x' * 6, b'x' * 6]
+    assert list(cache.tee_chunks(KEY_C, iter(large))) == large
+
+    assert os.listdir(tmp_path) == [KEY_A.hex()]
+    assert len(cache) == 1
@@ -3,7 +3,21 @@
 Vérifie si la conversion est correcte pour un ensembe d'entrée différentes.
 """
 
-from application.triangulator_app import encode_triangulation_result_to_binary
+import random
+import struct
+import tracemalloc
+from array import array
+
+import pytest
+
+from application.triangulator_app import (
+    decode_binary_point_set_to_geometric,
+    encode_triangulation_result_into,
+    encode_triangulation_result_to_binary,
+    iter_triangulation_result_chunks,
+    triangles_binary_size,
+)
+from application.types import PointSet_Array, Triangles_Array
 
 
 def test_01_encode_triangulation_result_to_binary(
@@ -15,4 +29,72 @@ def test_01_encode_triangulation_result_to_binary(
     
     actual = encode_triangulation_result_to_binary(geometric)
     
-    assert actual == expected
\ No newline at end of file
+    assert actual == expected
+
+def test_02_encode_into_caller_buffer(triangulations_geometric_binary_pairs):
+    """L'encodage dans un tampon fourni écrit les mêmes octets à l'offset donné."""
+    expected = triangulations_geometric_binary_pairs["encoded_binary_expected"]
+    geometric = triangulations_geometric_binary_pairs["geometric_input"]
+    buffer = bytearray(b'\xaa' * (len(expected) + 10))
+
+    written = encode_triangulation_result_into(geometric, buffer, offset=3)
+
+    assert written == len(expected)
+    assert bytes(buffer[3:3 + written]) == expected
+    assert buffer[:3] == b'\xaa' * 3
+    assert buffer[3 + written:] == b'\xaa' * 7
+
+
+def test_03_encode_into_too_small_buffer(triangulations_geometric_binary_pairs):
+    """Un tampon trop petit est refusé."""
+    expected = triangulations_geometric_binary_pairs["encoded_binary_expected"]
+    geometric = triangulations_geometric_binary_pairs["geometric_input"]
+
+    with pytest.raises(ValueError):
+        encode_triangulation_result_into(geometric, bytearray(len(expected) - 1))
+
+
+def test_04_encode_decoded_point_set_round_trip():
+    """Un PointSet décodé sans copie est réencodé à l'identique."""
+    point_set = struct.pack('I', 3) + struct.pack('ffffff', 0, 0, 1, 0, 0, 1)
+    points = decode_binary_point_set_to_geometric(point_set)
+    result = {'points': points, 'triangles': Triangles_Array(array('I', [0, 1, 2]))}
+
+    actual = encode_triangulation_result_to_binary(result)
+
+    assert len(actual) == triangles_binary_size(3, 1)
+    assert actual == point_set + struct.pack('IIII', 1, 0, 1, 2)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 12, 64, 1 << 16])
+def test_05_iter_chunks_matches_one_block_encoding(
+        triangulations_geometric_binary_pairs, chunk_size
+    ):
+    """La concaténation des morceaux est égale à l'encodage en un bloc."""
+    expected = triangulations_geometric_binary_pairs["encoded_binary_expected"]
+    geometric = triangulations_geometric_binary_pairs["geometric_input"]
+
+    chunks = list(iter_triangulation_result_chunks(geometric, chunk_size))
+
+    assert b''.join(chunks) == expected
+    assert all(len(chunk) <= max(chunk_size, 12) for chunk in chunks)
+
+
+def test_06_iter_chunks_constant_memory():
+    """Le pic mémoire de l'encodage par morceaux ne dépend pas de la taille."""
+    n = 10**5
+    rng = random.Random(0)
+    points = PointSet_Array(array('f', (rng.random() for _ in range(n))),
+                            array('f', (rng.random() for _ in range(n))))
+    indices = array('I', (rng.randrange(n) for _ in range(3 * 2 * n)))
+    result = {'points': points, 'triangles': Triangles_Array(indices)}
+    chunk_size = 1 << 14
+
+    tracemalloc.start()
+    total = sum(len(c) for c in iter_triangulation_result_chunks(result, chunk_size))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert total == triangles_binary_size(n, 2 * n)
+    assert total > 100 * chunk_size
+    assert peak < 4 * chunk_size
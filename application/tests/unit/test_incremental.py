@@ -0,0 +1,164 @@
+"""Tests unitaires du moteur de triangulation incrémental."""
+
+import math
+import random
+from array import array
+from types import SimpleNamespace
+
+import pytest
+
+from application.delaunay import (
+    COLLINEAR_POINTS,
+    NOT_ENOUGH_POINTS,
+    delaunay_triangulate,
+)
+from application.incremental import IncrementalMesh, incremental_triangulate
+from application.mesh import INF
+from application.spatial_order import SPATIAL_ORDERS
+
+
+def triangle_set(flat) -> set[tuple[int, int, int]]:
+    """Triangles sous forme canonique (rotation commençant au plus petit indice)."""
+    triangles = set()
+    for i in range(0, len(flat), 3):
+        a, b, c = flat[i:i + 3]
+        triangles.add(min((a, b, c), (b, c, a), (c, a, b)))
+    return triangles
+
+
+def signed_area(xs, ys, a, b, c) -> float:
+    """Double de l'aire signée du triangle (a, b, c)."""
+    return (xs[b] - xs[a]) * (ys[c] - ys[a]) - (ys[b] - ys[a]) * (xs[c] - xs[a])
+
+
+@pytest.mark.parametrize("order", SPATIAL_ORDERS)
+@pytest.mark.parametrize("seed", range(3))
+def test_01_matches_divide_and_conquer(order, seed):
+    """En position générale, la triangulation de Delaunay est unique."""
+    rng = random.Random(seed)
+    xs = [rng.random() for _ in range(300)]
+    ys = [rng.random() for _ in range(300)]
+
+    actual = triangle_set(incremental_triangulate(xs, ys, order))
+
+    assert actual == triangle_set(delaunay_triangulate(xs, ys))
+
+
+@pytest.mark.parametrize("order", SPATIAL_ORDERS)
+def test_02_grid_with_collinear_and_cocircular_points(order):
+    """Grille : points sur les arêtes et cocirculaires, 2 triangles par case."""
+    side = 8
+    xs = [float(i % side) for i in range(side * side)]
+    ys = [float(i // side) for i in range(side * side)]
+
+    flat = incremental_triangulate(xs, ys, order)
+
+    assert len(flat) // 3 == 2 * (side - 1) ** 2
+    areas = [signed_area(xs, ys, *flat[i:i + 3]) for i in range(0, len(flat), 3)]
+    assert all(area > 0 for area in areas)
+    assert math.fsum(areas) == 2 * (side - 1) ** 2
+
+
+def test_03_duplicates_keep_smallest_index():
+    """Les doublons ne produisent pas de sommet ; le plus petit indice est gardé."""
+    xs = [1.0, 0.0, 1.0, 0.0, 0.0]
+    ys = [0.0, 1.0, 0.0, 0.0, 0.0]
+
+    flat = incremental_triangulate(xs, ys)
+
+    assert sorted(flat) == [0, 1, 3]
+
+
+def test_04_collinear_points_first():
+    """Des points alignés en tête d'insertion sont insérés après coup."""
+    xs = [0.0, 1.0, 2.0, 3.0, 1.5]
+    ys = [0.0, 0.0, 0.0, 0.0, 1.0]
+
+    flat = incremental_triangulate(xs, ys, "none")
+
+    assert len(flat) // 3 == 3
+    assert set(flat) == {0, 1, 2, 3, 4}
+
+
+@pytest.mark.parametrize("xs, ys, message", [
+    ([0.0, 1.0, 2.0], [0.0, 1.0, 2.0], COLLINEAR_POINTS),
+    ([0.0, 0.0, 1.0], [0.0, 0.0, 1.0], NOT_ENOUGH_POINTS),
+])
+def test_05_degenerate_inputs(xs, ys, message):
+    """Points alignés ou moins de 3 points distincts : ValueError."""
+    with pytest.raises(ValueError, match=message):
+        incremental_triangulate(xs, ys)
+
+
+@pytest.mark.parametrize("outside", [False, True])
+@pytest.mark.parametrize("count", [1, 10, 100])
+def test_06_inserted_points_match_full_triangulation(outside, count):
+    """Points ajoutés (dans l'enveloppe ou au-delà) : même triangulation."""
+    rng = random.Random(count)
+    n = 400
+    xs = [rng.random() for _ in range(n + count)]
+    ys = [rng.random() for _ in range(n + count)]
+    if outside:
+        xs[n:] = [3 * x - 1 for x in xs[n:]]
+    mesh = IncrementalMesh(xs[:n], ys[:n], incremental_triangulate(xs[:n], ys[:n]))
+
+    actual = mesh.insert_points(xs[n:], ys[n:])
+
+    assert len(actual) == 3 * len(triangle_set(actual))
+    assert triangle_set(actual) == triangle_set(delaunay_triangulate(xs, ys))
+
+
+def test_07_insertion_keeps_the_base_mesh():
+    """Insertions indépendantes : le maillage de base n'est pas modifié."""
+    xs = [0.0, 1.0, 1.0, 0.0]
+    ys = [0.0, 0.0, 1.0, 1.0]
+    base = incremental_triangulate(xs, ys)
+    mesh = IncrementalMesh(xs, ys, base)
+
+    first = mesh.insert_points([0.5], [0.25])
+    second = mesh.insert_points([2.0], [0.5])
+
+    assert len(first) // 3 == 4
+    assert len(second) // 3 == 3
+    assert 4 in first and 4 in second
+    assert mesh.insert_points([], []) == base
+    assert mesh.mesh.triangles() == base
+
+
+def test_08_inserted_duplicates_keep_smallest_index():
+    """Un point ajouté en double d'un sommet n'apparaît pas dans les triangles."""
+    xs = [0.0, 1.0, 0.0]
+    ys = [0.0, 0.0, 1.0]
+    mesh = IncrementalMesh(xs, ys, incremental_triangulate(xs, ys))
+
+    flat = mesh.insert_points([1.0, 1.0, 1.0], [0.0, 1.0, 1.0])
+
+    assert sorted(set(flat)) == [0, 1, 2, 4]
+    areas = [signed_area(xs + [1.0, 1.0, 1.0], ys + [0.0, 1.0, 1.0], *flat[i:i + 3])
+             for i in range(0, len(flat), 3)]
+    assert all(area > 0 for area in areas)
+
+
+@pytest.mark.parametrize("ghosts, expected", [
+    ({0, 1}, [3, 2]),
+    ({1, 3}, [0, 2]),
+    ({2, 3}, [0, 1]),
+    ({0, 1, 2, 3}, []),
+])
+def test_09_freed_slots_take_the_last_triangles(ghosts, expected):
+    """Places libérées sans nouveau triangle : comblées par les derniers."""
+    xs = [0.0, 1.0, 1.0, 0.0, 0.5]
+    ys = [0.0, 0.0, 1.0, 1.0, 0.5]
+    base = incremental_triangulate(xs, ys)
+    mesh = IncrementalMesh(xs, ys, base)
+    triangles = [tuple(base[3 * t:3 * t + 3]) for t in range(4)]
+    # Emplacements ghosts devenus fantômes, les autres inchangés.
+    vertex = array('i', base)
+    for t in ghosts:
+        vertex[3 * t + 2] = INF
+
+    flat = mesh._updated_triangles(SimpleNamespace(vertex=vertex), ghosts)
+
+    assert [tuple(flat[i:i + 3]) for i in range(0, len(flat), 3)] == [
+        triangles[t] for t in expected
+    ]
@@ -0,0 +1,147 @@
+"""Tests unitaires du maillage par demi-arêtes en tableaux plats."""
+
+from array import array
+
+import pytest
+
+from application.mesh import INF, NOT_A_TRIANGULATION, HalfEdgeMesh
+
+
+def check_mesh(mesh: HalfEdgeMesh) -> None:
+    """Vérifie les invariants d'adjacence sur toutes les demi-arêtes utilisées."""
+    vertex = mesh.vertex
+    twin = mesh.twin
+    for h in range(mesh.size):
+        g = twin[h]
+        assert twin[g] == h
+        # h et son opposée ont les mêmes extrémités, en sens inverse.
+        assert vertex[h] == vertex[mesh.next(g)]
+        assert vertex[g] == vertex[mesh.next(h)]
+    for v, h in enumerate(mesh.vertex_edge[:-1]):
+        if h >= 0:
+            assert vertex[h] == v
+
+
+@pytest.fixture
+def mesh() -> HalfEdgeMesh:
+    """Triangle (0, 1, 2) et ses trois triangles fantômes, place pour 6 sommets."""
+    mesh = HalfEdgeMesh(6)
+    mesh.first_triangle(0, 1, 2)
+    return mesh
+
+
+def test_01_first_triangle(mesh):
+    """Un triangle réel, trois fantômes, adjacences cohérentes."""
+    check_mesh(mesh)
+    assert mesh.triangle_count == 4
+    assert [mesh.is_ghost(t) for t in range(4)] == [False, True, True, True]
+    assert mesh.triangles() == array('I', [0, 1, 2])
+
+
+def test_02_next_prev_neighbour(mesh):
+    """Les demi-arêtes next et prev restent dans le triangle ; voisin fantôme."""
+    assert [mesh.next(h) for h in range(6)] == [1, 2, 0, 4, 5, 3]
+    assert [mesh.prev(h) for h in range(6)] == [2, 0, 1, 5, 3, 4]
+    assert mesh.neighbour(0) == 1
+    assert mesh.is_ghost(mesh.neighbour(0))
+
+
+def test_03_split_triangle(mesh):
+    """Découpe en trois : deux triangles de plus, p sur les trois."""
+    opposite = mesh.split_triangle(0, 3)
+
+    check_mesh(mesh)
+    assert mesh.triangle_count == 6
+    assert sorted(map(sorted, zip(*[iter(mesh.triangles())] * 3, strict=True))) == [
+        [0, 1, 3], [0, 2, 3], [1, 2, 3],
+    ]
+    assert {(mesh.vertex[h], mesh.vertex[mesh.next(h)]) for h in opposite} == {
+        (0, 1), (1, 2), (2, 0),
+    }
+
+
+def test_04_split_edge(mesh):
+    """Découpe de l'arête 0 -> 1, entre le triangle réel et un fantôme."""
+    opposite = mesh.split_edge(0, 3)
+
+    check_mesh(mesh)
+    assert mesh.triangle_count == 6
+    assert sorted(map(sorted, zip(*[iter(mesh.triangles())] * 3, strict=True))) == [
+        [0, 2, 3], [1, 2, 3],
+    ]
+    ends = {(mesh.vertex[h], mesh.vertex[mesh.next(h)]) for h in opposite}
+    assert ends == {(1, 2), (2, 0), (0, INF), (INF, 1)}
+
+
+def test_05_flip(mesh):
+    """Bascule de la diagonale d'un quadrilatère convexe."""
+    mesh.split_edge(0, 3)
+    mesh.split_triangle(mesh.neighbour(2), 4)
+    before = sorted(map(sorted, zip(*[iter(mesh.triangles())] * 3, strict=True)))
+    # Arête 2 -> 3, diagonale entre (x, 2, 3) et (2, 3, y).
+    h = next(h for h in range(mesh.size)
+             if mesh.vertex[h] == 2 and mesh.vertex[mesh.next(h)] == 3)
+    u, v = mesh.vertex[h], mesh.vertex[mesh.next(h)]
+    p = mesh.vertex[mesh.prev(h)]
+    d = mesh.vertex[mesh.prev(mesh.twin[h])]
+
+    g = mesh.flip(h)
+
+    check_mesh(mesh)
+    vertex = mesh.vertex
+    assert (vertex[h], vertex[mesh.next(h)], vertex[mesh.prev(h)]) == (u, d, p)
+    assert (vertex[g], vertex[mesh.next(g)], vertex[mesh.prev(g)]) == (d, v, p)
+    assert len(mesh.triangles()) == 3 * len(before)
+
+
+def test_06_export_with_ids(mesh):
+    """Les triangles exportés passent par la table des indices d'origine."""
+    ids = [10, 11, 12]
+
+    assert mesh.triangles(ids) == array('I', [10, 11, 12])
+    assert mesh.to_geom(ids) == [{'v1': 10, 'v2': 11, 'v3': 12}]
+
+
+def test_07_capacity_and_memory():
+    """Pour n sommets : 2n - 2 triangles au plus, 4 octets par entier."""
+    mesh = HalfEdgeMesh(1000)
+
+    assert len(mesh.vertex) == 3 * (2 * 1000 - 2)
+    assert mesh.nbytes == 4 * (2 * 3 * (2 * 1000 - 2) + 1001)
+
+
+def test_08_from_triangles():
+    """Carré (0, 1, 2, 3) en deux triangles : quatre fantômes, jumeaux retrouvés."""
+    indices = array('I', [0, 1, 2, 0, 2, 3])
+
+    mesh = HalfEdgeMesh.from_triangles(4, indices)
+
+    check_mesh(mesh)
+    assert mesh.triangle_count == 6
+    assert [mesh.is_ghost(t) for t in range(6)] == [False] * 2 + [True] * 4
+    assert mesh.triangles() == indices
+    assert sorted(mesh.star(0)) == [0, 1, 2, 5]
+
+
+@pytest.mark.parametrize("indices", [
+    array('I'),
+    array('I', [0, 1, 2, 0, 1, 2]),         # arête 0 -> 1 en double
+    array('I', [0, 1, 2, 2, 3, 4]),         # enveloppe qui repasse par 2
+])
+def test_09_from_triangles_not_a_triangulation(indices):
+    """Aucun triangle, ou triangles qui ne ferment pas un domaine : ValueError."""
+    with pytest.raises(ValueError, match=NOT_A_TRIANGULATION):
+        HalfEdgeMesh.from_triangles(5, indices)
+
+
+def test_10_copy_is_independent_and_larger(mesh):
+    """La copie garde les emplacements et reçoit des sommets de plus."""
+    copy = mesh.copy(8)
+    copy.split_triangle(0, 7)
+
+    check_mesh(copy)
+    check_mesh(mesh)
+    assert mesh.triangles() == array('I', [0, 1, 2])
+    assert len(copy.vertex) == 3 * (2 * 8 - 2)
+    assert len(copy.vertex_edge) == 9
+    assert sorted(copy.star(7)) == [0, 4, 5]
@@ -0,0 +1,68 @@
+"""Tests unitaires des histogrammes de latence par étape."""
+
+import pytest
+
+from application.metrics import (
+    STAGE_METRIC_NAME,
+    Histogram,
+    StageMetrics,
+    render_counter,
+)
+
+
+def test_01_histogram_cumulative_buckets():
+    """Les effectifs sont cumulés par seuil ; '+Inf' compte tout."""
+    histogram = Histogram((0.1, 1.0))
+    for seconds in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(seconds)
+
+    cumulative, total, count = histogram.snapshot()
+
+    assert cumulative == [2, 3, 4]
+    assert total == pytest.approx(2.65)
+    assert count == 4
+
+
+def test_02_timer_records_failed_stage():
+    """Une étape qui lève une exception est tout de même chronométrée."""
+    metrics = StageMetrics(("decode",))
+
+    with pytest.raises(ValueError), metrics.time("decode"):
+        raise ValueError("boom")
+
+    assert metrics.histograms["decode"].count == 1
+
+
+def test_03_render_prometheus_text():
+    """Le rendu suit le format texte de Prometheus pour un histogramme."""
+    metrics = StageMetrics(("validate", "compute"), buckets=(0.5,))
+    metrics.observe("compute", 0.25)
+    metrics.observe("compute", 2.0)
+
+    lines = metrics.render().splitlines()
+
+    assert lines[0].startswith(f"# HELP {STAGE_METRIC_NAME} ")
+    assert lines[1] == f"# TYPE {STAGE_METRIC_NAME} histogram"
+    assert f'{STAGE_METRIC_NAME}_bucket{{stage="validate",le="+Inf"}} 0' in lines
+    assert f'{STAGE_METRIC_NAME}_bucket{{stage="compute",le="0.5"}} 1' in lines
+    assert f'{STAGE_METRIC_NAME}_bucket{{stage="compute",le="+Inf"}} 2' in lines
+    assert f'{STAGE_METRIC_NAME}_sum{{stage="compute"}} 2.25' in lines
+    assert f'{STAGE_METRIC_NAME}_count{{stage="compute"}} 2' in lines
+
+
+def test_04_unknown_stage():
+    """Une étape non déclarée est refusée."""
+    with pytest.raises(KeyError):
+        StageMetrics(("decode",)).time("fetch")
+
+
+def test_05_render_counter():
+    """Un compteur étiqueté suit le format texte de Prometheus."""
+    lines = render_counter("calls_total", "Calls.", "kind", {"a": 3, "b": 0})
+
+    assert lines.splitlines() == [
+        "# HELP calls_total Calls.",
+        "# TYPE calls_total counter",
+        'calls_total{kind="a"} 3',
+        'calls_total{kind="b"} 0',
+    ]
@@ -0,0 +1,107 @@
+"""Tests unitaires de la localisation de points (marche et saut)."""
+
+import random
+
+import pytest
+
+from application.delaunay import delaunay_triangulate
+from application.incremental import _Triangulation, incremental_triangulate
+from application.point_location import (
+    IN_TRIANGLE,
+    LOCATION_STATS,
+    ON_EDGE,
+    ON_VERTEX,
+    LocationStats,
+)
+from application.spatial_order import NO_ORDER, SPATIAL_ORDERS
+
+
+def triangle_set(flat) -> set[tuple[int, int, int]]:
+    """Triangles sous forme canonique (rotation commençant au plus petit indice)."""
+    triangles = set()
+    for i in range(0, len(flat), 3):
+        a, b, c = flat[i:i + 3]
+        triangles.add(min((a, b, c), (b, c, a), (c, a, b)))
+    return triangles
+
+
+@pytest.fixture
+def square() -> _Triangulation:
+    """Carré unité triangulé, plus trois points de requête non insérés."""
+    xs = [0.0, 1.0, 1.0, 0.0, 0.25, 0.5, 1.0]
+    ys = [0.0, 0.0, 1.0, 1.0, 0.5, 0.0, 0.0]
+    triangulation = _Triangulation(xs, ys, list(range(len(xs))))
+    triangulation.mesh.first_triangle(0, 1, 2)
+    triangulation.insert(3)
+    return triangulation
+
+
+@pytest.mark.parametrize("start", range(6))
+def test_01_walk_from_any_triangle(square, start):
+    """Depuis n'importe quel triangle, on trouve triangle, arête ou sommet."""
+    locator = square.locator
+    vertex = square.mesh.vertex
+
+    kind, t = locator.walk(4, start)
+    assert kind == IN_TRIANGLE
+    assert set(vertex[3 * t:3 * t + 3]) == {0, 2, 3}
+
+    kind, h = locator.walk(5, start)
+    assert kind == ON_EDGE
+    assert {vertex[h], vertex[h - h % 3 + (h + 1) % 3]} == {0, 1}
+
+    assert locator.walk(6, start) == (ON_VERTEX, 1)
+
+
+@pytest.mark.parametrize("order", SPATIAL_ORDERS)
+def test_02_jump_gives_same_triangulation(order):
+    """Le saut ne change que le point de départ de la marche."""
+    rng = random.Random(3)
+    xs = [rng.random() for _ in range(500)]
+    ys = [rng.random() for _ in range(500)]
+
+    actual = triangle_set(incremental_triangulate(xs, ys, order, jump=True))
+
+    assert actual == triangle_set(delaunay_triangulate(xs, ys))
+
+
+def test_03_vertex_edge_stays_consistent():
+    """Après insertions et bascules, vertex_edge[v] est bien issue de v."""
+    rng = random.Random(4)
+    xs = [rng.random() for _ in range(300)]
+    ys = [rng.random() for _ in range(300)]
+    triangulation = _Triangulation(xs, ys, list(range(300)), jump=True)
+
+    mesh = triangulation.run()
+
+    edges = mesh.vertex_edge
+    assert all(mesh.vertex[edges[v]] == v for v in range(300))
+
+
+def test_04_jump_shortens_walks_without_spatial_order():
+    """Sans ordre spatial, le saut raccourcit les marches."""
+    rng = random.Random(5)
+    xs = [rng.random() for _ in range(2000)]
+    ys = [rng.random() for _ in range(2000)]
+    lengths = {}
+    for jump in (False, True):
+        LOCATION_STATS.reset()
+        incremental_triangulate(xs, ys, NO_ORDER, jump=jump)
+        lengths[jump] = LOCATION_STATS.snapshot()['average_walk_length']
+
+    assert lengths[True] < lengths[False]
+
+
+def test_05_location_stats():
+    """Les compteurs s'additionnent et donnent la longueur moyenne de marche."""
+    stats = LocationStats()
+    assert stats.snapshot()['average_walk_length'] == 0.0
+
+    stats.record(insertions=4, steps=10, jumps=0)
+    stats.record(insertions=6, steps=20, jumps=6)
+
+    assert stats.snapshot() == {
+        'insertions': 10, 'steps': 30, 'jumps': 6, 'average_walk_length': 3.0,
+    }
+    stats.reset()
+    assert stats.snapshot()['insertions'] == 0
@@ -0,0 +1,54 @@
+"""Tests unitaires pour la détection des PointSets dégénérés (point_set_degeneracy)."""
+
+import struct
+from unittest.mock import Mock, patch
+
+import pytest
+from werkzeug.exceptions import InternalServerError
+
+from application.delaunay import COLLINEAR_POINTS, EMPTY_INPUT, NOT_ENOUGH_POINTS
+from application.triangulator_app import (
+    DEGENERATE_EMPTY,
+    point_set_degeneracy,
+    triangulation_pipeline,
+)
+
+
+@pytest.mark.parametrize("points, expected", [
+    ([], EMPTY_INPUT),
+    ([(1, 2)], NOT_ENOUGH_POINTS),
+    ([(1, 2), (1, 2), (1, 2)], NOT_ENOUGH_POINTS),
+    ([(0, 0), (1, 1), (0, 0), (1, 1)], NOT_ENOUGH_POINTS),
+    ([(0, 0), (0, 0), (1, 1), (3, 3), (-2, -2)], COLLINEAR_POINTS),
+    ([(0.5, 0.1), (0.5, 0.7), (0.5, -3.0)], COLLINEAR_POINTS),
+    ([(0, 0), (1, 1), (2, 2), (3, 3.0000001)], None),
+    ([(0, 0), (1, 0), (0, 1)], None),
+])
+def test_01_point_set_degeneracy(points, expected):
+    """Moins de 3 points distincts, points alignés ou triangulation possible."""
+    xs = [float(x) for x, _ in points]
+    ys = [float(y) for _, y in points]
+
+    assert point_set_degeneracy(xs, ys) == expected
+
+
+@patch('application.triangulator_app.triangulation_compute')
+def test_02_pipeline_fails_before_compute(mock_triangulation_compute: Mock):
+    """PointSet aligné : erreur 500 sans lancer le moteur de triangulation."""
+    pointSet = struct.pack('I', 3) + struct.pack('6f', 0, 0, 1, 2, 2, 4)
+
+    with pytest.raises(InternalServerError) as excinfo:
+        triangulation_pipeline(pointSet)
+
+    assert COLLINEAR_POINTS in str(excinfo.value)
+    mock_triangulation_compute.assert_not_called()
+
+
+@patch('application.triangulator_app.DEGENERATE_POINT_SETS', DEGENERATE_EMPTY)
+def test_03_pipeline_empty_triangles():
+    """Mode DEGENERATE_EMPTY : les sommets, et aucun triangle."""
+    pointSet = struct.pack('I', 2) + struct.pack('4f', 0, 0, 1, 2)
+
+    result = triangulation_pipeline(pointSet)
+
+    assert result == pointSet + struct.pack('I', 0)
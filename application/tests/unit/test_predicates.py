@@ -0,0 +1,132 @@
+"""Tests unitaires des prédicats géométriques robustes."""
+
+import math
+import random
+from fractions import Fraction
+
+import pytest
+
+from application.engines import ENGINES, triangulate
+from application.predicates import (
+    INCIRCLE,
+    ORIENT2D,
+    IndexedPredicates,
+    PredicateStats,
+    incircle,
+    line_orientation,
+    orient2d,
+)
+
+
+def sign(value) -> int:
+    """Signe d'un nombre : -1, 0 ou 1."""
+    return (value > 0) - (value < 0)
+
+
+def exact_orient2d(ax, ay, bx, by, cx, cy) -> Fraction:
+    """Déterminant d'orientation en rationnels exacts."""
+    ax, ay, bx, by, cx, cy = map(Fraction, (ax, ay, bx, by, cx, cy))
+    return (ax - cx) * (by - cy) - (ay - cy) * (bx - cx)
+
+
+def exact_incircle(ax, ay, bx, by, cx, cy, dx, dy) -> Fraction:
+    """Déterminant du cercle circonscrit en rationnels exacts."""
+    ax, ay, bx, by, cx, cy, dx, dy = map(Fraction, (ax, ay, bx, by, cx, cy, dx, dy))
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+    return ((adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+            + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+            + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady))
+
+
+def test_01_orient2d_near_collinear():
+    """Points presque alignés : le signe est celui du calcul exact."""
+    rng = random.Random(0)
+    for _ in range(2000):
+        ax, ay = rng.random(), rng.random()
+        bx, by = ax + rng.random(), ay + rng.random()
+        t = rng.uniform(-1.0, 2.0)
+        cx, cy = ax + t * (bx - ax), ay + t * (by - ay)
+
+        actual = orient2d(ax, ay, bx, by, cx, cy)
+
+        assert sign(actual) == sign(exact_orient2d(ax, ay, bx, by, cx, cy))
+
+
+def test_02_orient2d_exact_zero():
+    """Points exactement alignés : 0, même si le calcul flottant se trompe."""
+    assert orient2d(0.0, 0.0, 1.0, 1.0, 3.0, 3.0) == 0
+    assert orient2d(0.5, 0.5, 12.0, 12.0, 24.0, 24.0) == 0
+    assert orient2d(0.0, 0.0, 1.0, 0.0, 0.0, 1.0) > 0
+    assert orient2d(0.0, 0.0, 0.0, 1.0, 1.0, 0.0) < 0
+
+
+def test_03_incircle_near_cocircular():
+    """Points presque cocirculaires : le signe est celui du calcul exact."""
+    rng = random.Random(1)
+    for _ in range(2000):
+        angles = sorted(rng.uniform(0.0, 2 * math.pi) for _ in range(3))
+        a, b, c = ((math.cos(angle), math.sin(angle)) for angle in angles)
+        angle = rng.uniform(0.0, 2 * math.pi)
+        d = (math.cos(angle), math.sin(angle))
+
+        actual = incircle(*a, *b, *c, *d)
+
+        assert sign(actual) == sign(exact_incircle(*a, *b, *c, *d))
+
+
+def test_04_incircle_cocircular_and_coincident():
+    """Sommets d'un carré : d sur le cercle ; d confondu avec un sommet : 0."""
+    assert incircle(0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0) == 0
+    assert incircle(0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 1.0, 0.0) == 0
+    assert incircle(0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.5, 0.5) > 0
+    assert incircle(0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 2.0, 2.0) < 0
+
+
+def test_05_indexed_predicates_count_exact_fallbacks():
+    """Les appels et recours au calcul exact sont reportés dans les compteurs."""
+    px = [0.0, 1.0, 1.0, 0.0, 0.25]
+    py = [0.0, 0.0, 1.0, 1.0, 0.5]
+    predicates = IndexedPredicates(px, py)
+    stats = PredicateStats()
+
+    assert predicates.orient(0, 1, 2) > 0
+    assert predicates.incircle(0, 1, 2, 4) > 0
+    assert predicates.incircle(0, 1, 2, 3) == 0
+    predicates.record(stats)
+
+    snapshot = stats.snapshot()
+    assert snapshot[ORIENT2D] == {'calls': 1, 'exact': 0, 'filter_hit_rate': 1.0}
+    assert snapshot[INCIRCLE] == {'calls': 2, 'exact': 1, 'filter_hit_rate': 0.5}
+    stats.reset()
+    assert stats.snapshot()[INCIRCLE]['calls'] == 0
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_06_cocircular_points(engine):
+    """Points cocirculaires : un éventail de n - 2 triangles directs."""
+    n = 64
+    xs = [math.cos(2 * math.pi * i / n) for i in range(n)]
+    ys = [math.sin(2 * math.pi * i / n) for i in range(n)]
+
+    flat = triangulate(xs, ys, engine)
+
+    assert len(flat) // 3 == n - 2
+    for i in range(0, len(flat), 3):
+        assert orient2d(xs[flat[i]], ys[flat[i]], xs[flat[i + 1]],
+                        ys[flat[i + 1]], xs[flat[i + 2]], ys[flat[i + 2]]) > 0
+
+
+def test_07_line_orientation():
+    """Même signe que orient2d, a et b fixés ; 0 sur les points alignés."""
+    rng = random.Random(2)
+    ax, ay, bx, by = 0.1, 0.7, 2.5, -1.3
+    orient = line_orientation(ax, ay, bx, by)
+    for _ in range(500):
+        t = rng.uniform(-2.0, 3.0)
+        cx, cy = ax + t * (bx - ax), ay + t * (by - ay)
+
+        assert sign(orient(cx, cy)) == sign(exact_orient2d(ax, ay, bx, by, cx, cy))
+    assert orient(ax, ay) == orient(bx, by) == 0
+    assert line_orientation(0.0, 0.0, 1.0, 0.0)(0.5, 2.0 ** -60) > 0
@@ -1,16 +1,27 @@
 """Tests unitaires pour la fonction psm client fetch data."""
-import json
+import http.client
+from unittest.mock import Mock, patch
+
+import pytest
+from werkzeug.exceptions import BadRequest, NotFound, ServiceUnavailable
 
 from application.triangulator_app import psm_client_fetch_data
 
 # Cas 0 - Succes
-# Cas 1 - Not Found
-# Cas 2 - Service unavailable
+# Cas 1 - Bad Request
+# Cas 2 - Not Found
+# Cas 3 - Service unavailable
 
-# mock of /triangulation/{pointSetId} served by PSM
+# mock of /pointset/{pointSetId} served by PSM
 
 TEST_POINT_SET_ID = "a1b2c3d4-e5f6-7890-1234-567890abcdef"
 
+EXPECTED_EXCEPTIONS = {
+    400: BadRequest,
+    404: NotFound,
+    503: ServiceUnavailable,
+}
+
 def test_01_psm_client_fetch_data(mock_psm_connection):
     """Tests psm_client_fetch_data across all API scenarios (200, 4xx, 5xx, ... )."""
     uuid = TEST_POINT_SET_ID
@@ -18,24 +29,40 @@ def test_01_psm_client_fetch_data(mock_psm_connection):
     expected_status = mock_instance.status_code
     expected_body = mock_instance.body
 
-    response = psm_client_fetch_data(uuid)
-
-    assert response.status == expected_status
-
     if expected_status == 200: #Succes
-        assert dict(response.getheaders())['Content-Type'] == 'application/octet-stream'
-        
-        body = response.read()
+        body = psm_client_fetch_data(uuid)
         assert body == expected_body
         assert isinstance(body, bytes)
     else: #Failure
-        assert dict(response.getheaders())['Content-Type'] == 'application/json'
-        
-        body_bytes = response.read()
-        assert body_bytes == expected_body
-
-        expected_json = json.loads(expected_body.decode('utf-8'))
-        response_json = json.loads(body_bytes.decode('utf-8'))
-        
-        assert 'error' in response_json
-        assert response_json['error'] == expected_json['error']
+        with pytest.raises(EXPECTED_EXCEPTIONS[expected_status]):
+            psm_client_fetch_data(uuid)
+
+    mock_instance.request.assert_called_once_with("GET", f"/pointset/{uuid}")
+
+def test_02_psm_client_fetch_data_reuses_connection():
+    """Des requêtes successives réutilisent la même connexion du pool."""
+    with patch('http.client.HTTPConnection') as mock_connection_class:
+        mock_instance = mock_connection_class.return_value
+        mock_response = Mock(spec=http.client.HTTPResponse)
+        mock_response.status = 200
+        mock_response.read.return_value = b'ok'
+        mock_instance.getresponse.return_value = mock_response
+
+        for _ in range(3):
+            assert psm_client_fetch_data(TEST_POINT_SET_ID) == b'ok'
+
+    mock_connection_class.assert_called_once()
+    assert mock_instance.request.call_count == 3
+
+@pytest.mark.parametrize("error", [
+    ConnectionRefusedError(),
+    TimeoutError(),
+    http.client.RemoteDisconnected(),
+])
+def test_03_psm_client_fetch_data_unreachable(error):
+    """Une erreur réseau vers le PSM est traduite en 503."""
+    with patch('http.client.HTTPConnection') as mock_connection_class:
+        mock_connection_class.return_value.request.side_effect = error
+
+        with pytest.raises(ServiceUnavailable):
+            psm_client_fetch_data(TEST_POINT_SET_ID)
@@ -0,0 +1,104 @@
+"""Tests unitaires du pool de connexions persistantes vers le PSM.
+
+Le PSM est simulé par un serveur HTTP/1.1 local (keep-alive).
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from application.psm_pool import PoolTimeout, PSMConnectionPool
+
+
+class _PSMStandIn(BaseHTTPRequestHandler):
+    """Répond 200 à GET /pointset/{id} en gardant la connexion ouverte."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # noqa: N802
+        """Renvoie l'identifiant demandé comme corps de réponse."""
+        body = self.path.rsplit("/", 1)[-1].encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        """Pas de journal sur la sortie d'erreur pendant les tests."""
+
+
+@pytest.fixture
+def psm_server():
+    """Démarre le PSM local dans un thread ; retourne (hôte, port)."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PSMStandIn)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,),
+                              daemon=True)
+    thread.start()
+    yield server.server_address
+    server.shutdown()
+    server.server_close()
+
+
+def test_01_pool_reuses_connection(psm_server):
+    """Les requêtes successives passent par une seule connexion TCP."""
+    pool = PSMConnectionPool(*psm_server, max_size=2)
+    for i in range(5):
+        assert pool.request("GET", f"/pointset/{i}") == (200, str(i).encode())
+    stats = pool.stats()
+    assert stats['created'] == 1
+    assert stats['reused'] == 4
+    assert stats['idle'] == 1
+    pool.close()
+
+
+def test_02_pool_discards_idle_connection(psm_server):
+    """Une connexion restée au repos plus de idle_timeout n'est pas réutilisée."""
+    pool = PSMConnectionPool(*psm_server, idle_timeout=0.0)
+    pool.request("GET", "/pointset/a")
+    pool.request("GET", "/pointset/b")
+    assert pool.stats()['created'] == 2
+    assert pool.stats()['discarded'] == 1
+    pool.close()
+
+
+def test_03_pool_detects_connection_closed_by_server(psm_server):
+    """Une connexion fermée côté PSM est écartée avant réutilisation."""
+    pool = PSMConnectionPool(*psm_server)
+    pool.request("GET", "/pointset/a")
+    conn, _ = pool._idle[0]
+    conn.sock.shutdown(1)  # simule la fermeture : le serveur voit EOF et ferme
+    conn.sock.recv(1)  # attend la fermeture effective côté serveur
+    assert pool.request("GET", "/pointset/b") == (200, b"b")
+    assert pool.stats()['created'] == 2
+    pool.close()
+
+
+def test_04_pool_is_bounded():
+    """Au-delà de max_size connexions empruntées, acquire échoue après le délai."""
+    pool = PSMConnectionPool("127.0.0.1", 9, max_size=2, acquire_timeout=0.01)
+    first, _ = pool.acquire()
+    second, _ = pool.acquire()
+    with pytest.raises(PoolTimeout):
+        pool.acquire()
+    pool.release(first)
+    third, reused = pool.acquire()
+    assert third is first and reused
+    pool.release(second)
+    pool.release(third)
+
+
+def test_05_pool_warm(psm_server):
+    """Le préchauffage ouvre les connexions à l'avance ; 0 si le PSM est injoignable."""
+    pool = PSMConnectionPool(*psm_server, max_size=4)
+    assert pool.warm(3) == 3
+    assert pool.stats()['idle'] == 3
+    pool.request("GET", "/pointset/a")
+    assert pool.stats()['created'] == 3
+    pool.close()
+
+    unreachable = PSMConnectionPool("127.0.0.1", 9, timeout=0.5)
+    assert unreachable.warm(2) == 0
@@ -0,0 +1,78 @@
+"""Tests unitaires pour le cache des triangulations (ResultCache).
+
+Vérifie le budget en octets, l'éviction LRU et les compteurs.
+"""
+
+import threading
+
+from application.result_cache import DIGEST_SIZE, ResultCache, point_set_digest
+
+
+def test_01_point_set_digest():
+    """L'empreinte dépend du contenu et non de l'objet."""
+    assert point_set_digest(b'abc') == point_set_digest(bytearray(b'abc'))
+    assert point_set_digest(b'abc') != point_set_digest(b'abd')
+    assert len(point_set_digest(b'')) == DIGEST_SIZE
+
+
+def test_02_result_cache_hit_miss():
+    """Un get sur une clé absente est un miss, sur une clé présente un hit."""
+    cache = ResultCache(max_bytes=100)
+
+    assert cache.get(b'k') is None
+    cache.put(b'k', b'value')
+
+    assert cache.get(b'k') == b'value'
+    assert cache.stats() == {
+        'entries': 1, 'bytes': 6, 'max_bytes': 100,
+        'hits': 1, 'misses': 1, 'evictions': 0,
+    }
+
+
+def test_03_result_cache_lru_eviction():
+    """Le budget est respecté en évinçant l'entrée la moins récemment lue."""
+    cache = ResultCache(max_bytes=30)
+    cache.put(b'a', b'x' * 9)
+    cache.put(b'b', b'x' * 9)
+    cache.put(b'c', b'x' * 9)
+    cache.get(b'a')                 # 'b' devient la moins récente
+
+    cache.put(b'd', b'x' * 9)
+
+    assert b'b' not in cache
+    assert all(key in cache for key in (b'a', b'c', b'd'))
+    assert cache.current_bytes == 30
+    assert cache.evictions == 1
+
+
+def test_04_result_cache_oversized_value_and_replace():
+    """Une valeur plus grosse que le budget n'est pas gardée ; put remplace."""
+    cache = ResultCache(max_bytes=10)
+    cache.put(b'big', b'x' * 20)
+    cache.put(b'k', b'1234')
+    cache.put(b'k', b'12')
+
+    assert b'big' not in cache
+    assert cache.get(b'k') == b'12'
+    assert cache.current_bytes == 3
+
+
+def test_05_result_cache_concurrent_access():
+    """Des accès concurrents laissent le cache cohérent avec son budget."""
+    cache = ResultCache(max_bytes=1000)
+
+    def worker(offset: int) -> None:
+        for i in range(500):
+            key = bytes([offset, i % 50])
+            if cache.get(key) is None:
+                cache.put(key, b'x' * 40)
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert stats['hits'] + stats['misses'] == 8 * 500
+    assert stats['bytes'] == 42 * stats['entries'] <= 1000
@@ -0,0 +1,122 @@
+"""Tests unitaires du regroupement des requêtes concurrentes (SingleFlight)."""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+from werkzeug.exceptions import NotFound
+
+from application.single_flight import SingleFlight
+from application.triangulator_app import (
+    IN_FLIGHT,
+    IN_FLIGHT_STREAM,
+    getTriangulation,
+    getTriangulation_stream,
+)
+
+WAITERS = 8
+VALID_UUID = str(uuid.uuid4())
+
+
+def wait_for(condition, timeout: float = 5.0) -> None:
+    """Attend que condition() soit vraie (échec du test au bout de timeout)."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            pytest.fail("condition not reached")
+        time.sleep(0.001)
+
+
+def run_concurrently(flight: SingleFlight, key, function, release: threading.Event):
+    """Lance WAITERS appels flight.do(key, function) et libère le meneur.
+
+    Returns :
+        Les résultats (ou exceptions) de chaque appel
+    """
+    def call():
+        try:
+            return flight.do(key, function)
+        except Exception as error:
+            return error
+
+    with ThreadPoolExecutor(WAITERS) as executor:
+        futures = [executor.submit(call) for _ in range(WAITERS)]
+        wait_for(lambda: flight.shared == WAITERS - 1)
+        release.set()
+        return [future.result() for future in futures]
+
+
+def test_01_concurrent_calls_share_the_result():
+    """Un seul appel de function, le même objet pour tous, table vidée."""
+    flight = SingleFlight()
+    release = threading.Event()
+    function = Mock(side_effect=lambda: release.wait() and object())
+
+    results = run_concurrently(flight, "id", function, release)
+
+    function.assert_called_once_with()
+    assert all(result is results[0] for result in results)
+    assert len(flight) == 0
+    assert flight.stats() == {'inflight': 0, 'leaders': 1, 'shared': WAITERS - 1}
+
+
+def test_02_errors_propagate_to_all_waiters():
+    """L'exception du meneur est levée pour chaque appel regroupé."""
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def failing():
+        release.wait()
+        raise NotFound("missing")
+
+    results = run_concurrently(flight, "id", failing, release)
+
+    assert all(isinstance(result, NotFound) for result in results)
+    assert len(flight) == 0
+
+
+def test_03_sequential_and_distinct_keys_are_not_shared():
+    """Après la fin d'un appel, ou pour une autre clé, le travail est refait."""
+    flight = SingleFlight()
+    function = Mock(return_value=b"result")
+
+    assert flight.do("a", function) == b"result"
+    assert flight.do("a", function) == b"result"
+    assert flight.do("b", function) == b"result"
+    assert function.call_count == 3
+    assert flight.stats()['shared'] == 0
+
+
+def get_streamed(pointSetId: str) -> bytes:
+    """Triangles envoyés par getTriangulation_stream, mis bout à bout."""
+    return b"".join(getTriangulation_stream(pointSetId)[2])
+
+
+@pytest.mark.parametrize("flight, get", [
+    (IN_FLIGHT, getTriangulation),
+    (IN_FLIGHT_STREAM, get_streamed),
+])
+@patch('application.triangulator_app.psm_client_fetch_data')
+def test_04_getTriangulation_fetches_once(
+        mock_fetch_data: Mock, flight, get, square_point_set):
+    """Requêtes concurrentes sur un même PointSetId : un seul appel au PSM."""
+    release = threading.Event()
+    mock_fetch_data.side_effect = lambda _: release.wait() and square_point_set
+    shared = flight.shared
+
+    def call():
+        return get(VALID_UUID)
+
+    with ThreadPoolExecutor(WAITERS) as executor:
+        futures = [executor.submit(call) for _ in range(WAITERS)]
+        wait_for(lambda: flight.shared - shared == WAITERS - 1)
+        release.set()
+        results = [future.result() for future in futures]
+
+    mock_fetch_data.assert_called_once_with(VALID_UUID)
+    assert results[0].startswith(square_point_set)
+    assert all(result == results[0] for result in results)
+    assert len(flight) == 0
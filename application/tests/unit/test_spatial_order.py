@@ -0,0 +1,74 @@
+"""Tests unitaires des ordres d'insertion spatiaux (Hilbert, BRIO)."""
+
+import random
+
+import pytest
+
+from application.spatial_order import (
+    BRIO,
+    HILBERT,
+    HILBERT_BITS,
+    NO_ORDER,
+    brio_order,
+    hilbert_keys,
+    hilbert_order,
+    spatial_order,
+)
+
+
+def test_01_hilbert_order_is_continuous_on_a_grid():
+    """Sur une grille 2^k x 2^k, deux points consécutifs sont voisins."""
+    side = 32
+    step = ((1 << HILBERT_BITS) - 1) // (side - 1)
+    xs = [float((i % side) * step) for i in range(side * side)]
+    ys = [float((i // side) * step) for i in range(side * side)]
+
+    order = hilbert_order(xs, ys)
+
+    assert sorted(order) == list(range(side * side))
+    for a, b in zip(order, order[1:], strict=False):
+        assert abs(xs[a] - xs[b]) + abs(ys[a] - ys[b]) == step
+
+
+def test_02_hilbert_keys_degenerate_inputs():
+    """Ensemble vide ou points confondus : clés définies, sans erreur."""
+    assert hilbert_keys([], []) == []
+    assert hilbert_keys([1.5] * 3, [2.0] * 3) == [0, 0, 0]
+
+
+def test_03_brio_order_is_a_reproducible_permutation():
+    """BRIO retourne une permutation, identique d'un appel à l'autre."""
+    rng = random.Random(0)
+    xs = [rng.random() for _ in range(1000)]
+    ys = [rng.random() for _ in range(1000)]
+
+    order = brio_order(xs, ys)
+
+    assert sorted(order) == list(range(1000))
+    assert order == brio_order(xs, ys)
+    assert order != hilbert_order(xs, ys)
+
+
+@pytest.mark.parametrize("method", [NO_ORDER, HILBERT, BRIO])
+def test_04_spatial_order_methods(method):
+    """Chaque méthode retourne une permutation des indices."""
+    xs = [0.0, 1.0, 0.5, 0.2]
+    ys = [0.0, 0.0, 1.0, 0.7]
+    assert sorted(spatial_order(xs, ys, method)) == [0, 1, 2, 3]
+
+
+def test_05_spatial_order_unknown_method():
+    """Une méthode inconnue est refusée."""
+    with pytest.raises(ValueError):
+        spatial_order([0.0], [0.0], "morton")
+
+
+@pytest.mark.parametrize("method", [HILBERT, BRIO])
+def test_06_known_bounds(method):
+    """Une boîte englobante fournie donne le même ordre que celle calculée."""
+    rng = random.Random(1)
+    xs = [rng.uniform(-3.0, 5.0) for _ in range(200)]
+    ys = [rng.uniform(1.0, 2.0) for _ in range(200)]
+    bounds = (min(xs), min(ys), max(xs), max(ys))
+
+    assert spatial_order(xs, ys, method, bounds) == spatial_order(xs, ys, method)
@@ -0,0 +1,155 @@
+"""Tests unitaires de l'envoi des gros Triangles depuis un fichier (send_file).
+
+Le PSM est remplacé par un mock de psm_client_fetch_data ; SPILL_CACHE
+est un DiskCache dans un répertoire temporaire, avec un seuil abaissé.
+"""
+
+import io
+import os
+import random
+import struct
+import uuid
+from unittest.mock import Mock, patch
+
+import pytest
+
+from application.disk_cache import DiskCache
+from application.result_cache import ResultCache, point_set_digest
+from application.triangulator_app import (
+    _triangulate_point_set,
+    point_set_etag,
+    triangulation_get,
+    triangulation_pipeline,
+    triangulator_app,
+)
+
+SPILL_MIN_BYTES = 1024
+N = 200
+
+
+def random_point_set(n: int, seed: int = 0) -> bytes:
+    """PointSet binaire de n points aléatoires."""
+    rng = random.Random(seed)
+    return struct.pack('I', n) + struct.pack(
+        f'{2 * n}f', *(rng.random() for _ in range(2 * n))
+    )
+
+
+LARGE_POINT_SET = random_point_set(N)
+SMALL_POINT_SET = struct.pack('I', 3) + struct.pack('6f', 0, 0, 1, 0, 0, 1)
+
+
+@pytest.fixture
+def spill_cache(tmp_path):
+    """SPILL_CACHE dans tmp_path, seuil SPILL_MIN_BYTES, caches mémoire vides."""
+    cache = DiskCache(str(tmp_path), max_bytes=1 << 20)
+    with patch('application.triangulator_app.SPILL_CACHE', cache), \
+         patch('application.triangulator_app.SPILL_MIN_BYTES', SPILL_MIN_BYTES), \
+         patch('application.triangulator_app.RESULT_CACHE', ResultCache(1 << 20)):
+        yield cache
+
+
+@pytest.fixture
+def mock_triangulate():
+    """Espion sur le calcul (_triangulate_point_set)."""
+    with patch('application.triangulator_app._triangulate_point_set',
+               wraps=_triangulate_point_set) as mock:
+        yield mock
+
+
+def get(point_set: bytes, pointSetId: str):
+    """Appelle la vue GET /triangulation, le PSM renvoyant point_set."""
+    with patch('application.triangulator_app.psm_client_fetch_data',
+               return_value=point_set), \
+         triangulator_app.test_request_context(f"/triangulation/{pointSetId}"):
+        return triangulation_get(pointSetId)
+
+
+def reference(point_set: bytes) -> bytes:
+    """Triangles attendus, calculés sans SPILL_CACHE ni cache mémoire partagé."""
+    with patch('application.triangulator_app.SPILL_CACHE', None), \
+         patch('application.triangulator_app.RESULT_CACHE', ResultCache(1 << 20)):
+        return triangulation_pipeline(point_set)
+
+
+def body(response) -> bytes:
+    """Corps complet d'une réponse (fichier ou morceaux), puis fermeture."""
+    try:
+        return b"".join(response.response)
+    finally:
+        response.close()
+
+
+def test_01_large_result_is_sent_from_a_file(spill_cache, mock_triangulate):
+    """Au-delà du seuil : fichier écrit puis envoyé par send_file."""
+    expected = reference(LARGE_POINT_SET)
+    assert len(expected) > SPILL_MIN_BYTES
+    mock_triangulate.reset_mock()
+
+    response = get(LARGE_POINT_SET, str(uuid.uuid4()))
+
+    assert response.status_code == 200
+    assert response.direct_passthrough
+    assert response.content_length == len(expected)
+    key = point_set_digest(LARGE_POINT_SET)
+    assert response.headers["ETag"] == f'"{point_set_etag(key)}"'
+    assert body(response) == expected
+    assert spill_cache.locate(key)[1] == len(expected)
+    mock_triangulate.assert_called_once()
+
+
+def test_02_spilled_file_is_reused(spill_cache, mock_triangulate):
+    """Requête suivante : envoyée depuis le fichier, sans recalcul."""
+    first = body(get(LARGE_POINT_SET, str(uuid.uuid4())))
+
+    response = get(LARGE_POINT_SET, str(uuid.uuid4()))
+
+    assert response.direct_passthrough
+    assert body(response) == first
+    mock_triangulate.assert_called_once()
+
+
+def test_03_evicted_file_is_written_again(spill_cache, mock_triangulate):
+    """Fichier évincé entre deux requêtes : résultat recalculé et réécrit."""
+    first = body(get(LARGE_POINT_SET, str(uuid.uuid4())))
+    spill_cache.clear()
+
+    assert body(get(LARGE_POINT_SET, str(uuid.uuid4()))) == first
+    assert mock_triangulate.call_count == 2
+    assert len(spill_cache) == 1
+
+
+def test_04_small_result_is_not_spilled(spill_cache):
+    """En deçà du seuil : réponse en mémoire, aucun fichier."""
+    response = get(SMALL_POINT_SET, str(uuid.uuid4()))
+
+    assert not response.direct_passthrough
+    assert body(response) == reference(SMALL_POINT_SET)
+    assert len(spill_cache) == 0
+
+
+def test_05_write_error_falls_back_to_streaming(spill_cache):
+    """Fichier impossible à écrire : réponse envoyée par morceaux.
+
+    L'envoi tente à nouveau d'écrire le fichier (tee_chunks), sans échec.
+    """
+    with patch('application.disk_cache.os.replace', side_effect=OSError):
+        response = get(LARGE_POINT_SET, str(uuid.uuid4()))
+        assert not isinstance(response.response, io.BufferedIOBase)
+        assert body(response) == reference(LARGE_POINT_SET)
+
+    assert spill_cache.errors == 2
+    assert os.listdir(spill_cache.directory) == []
+
+
+@patch('application.triangulator_app.psm_client_fetch_data')
+def test_06_route_through_test_client(mock_fetch_data: Mock, spill_cache):
+    """Par le client de test Flask : mêmes octets, Content-Length exact."""
+    mock_fetch_data.return_value = LARGE_POINT_SET
+
+    response = triangulator_app.test_client().get(f"/triangulation/{uuid.uuid4()}")
+
+    expected = reference(LARGE_POINT_SET)
+    assert response.status_code == 200
+    assert response.get_data() == expected
+    assert response.headers["Content-Length"] == str(len(expected))
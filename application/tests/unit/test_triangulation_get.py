@@ -0,0 +1,162 @@
+"""Tests unitaires pour la route GET /triangulation/{pointSetId}.
+
+Le PSM est remplacé par un mock de psm_client_fetch_data ; la route est
+appelée par le client de test Flask.
+"""
+
+import os
+import struct
+import uuid
+from unittest.mock import Mock, patch
+
+import pytest
+from werkzeug.exceptions import NotFound, ServiceUnavailable
+
+from application.disk_cache import DiskCache
+from application.metrics import PREDICATE_CALLS_METRIC_NAME, STAGE_METRIC_NAME
+from application.result_cache import point_set_digest
+from application.triangulator_app import (
+    RESULT_CACHE,
+    STAGES,
+    _triangulate_point_set,
+    encode_triangulation_result_to_binary,
+    triangulation_pipeline,
+)
+
+VALID_UUID = str(uuid.uuid4())
+
+collinear_PointSet = struct.pack('I', 3) + struct.pack('f' * 6, 0, 0, 1, 1, 2, 2)
+
+
+@patch('application.triangulator_app.psm_client_fetch_data')
+def test_01_triangulation_get_success(
+    mock_fetch_data: Mock, client, square_point_set
+):
+    """200 : le corps est la représentation binaire Triangles."""
+    mock_fetch_data.return_value = square_point_set
+
+    response = client.get(f"/triangulation/{VALID_UUID}")
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/octet-stream"
+    assert response.data == triangulation_pipeline(square_point_set)
+    assert response.content_length == len(response.data)
+    mock_fetch_data.assert_called_once_with(VALID_UUID)
+
+
+@patch('application.triangulator_app.STREAM_CHUNK_SIZE', 12)
+@patch('application.triangulator_app.STREAM_MIN_BYTES', 0)
+@patch('application.triangulator_app.psm_client_fetch_data')
+def test_02_triangulation_get_streamed(
+    mock_fetch_data: Mock, client, square_point_set
+):
+    """Au-delà du seuil, la réponse est envoyée par morceaux."""
+    mock_fetch_data.return_value = square_point_set
+
+    response = client.get(f"/triangulation/{VALID_UUID}", buffered=False)
+
+    assert response.is_streamed
+    chunks = list(response.response)
+    assert len(chunks) > 3
+    body = b''.join(chunks)
+    assert response.content_length == len(body)
+    assert body == encode_triangulation_result_to_binary(
+        _triangulate_point_set(square_point_set)
+    )
+
+
+@pytest.mark.parametrize("case_id, fetch_effect, status, code", [
+    ("Fail_400", None, 400, "INVALID_POINT_SET_ID"),
+    ("Fail_404", NotFound, 404, "POINT_SET_NOT_FOUND"),
+    ("Fail_500", collinear_PointSet, 500, "TRIANGULATION_FAILED"),
+    ("Fail_503", ServiceUnavailable, 503, "POINT_SET_MANAGER_UNAVAILABLE"),
+])
+@patch('application.triangulator_app.psm_client_fetch_data')
+def test_03_triangulation_get_errors(
+    mock_fetch_data: Mock, client, case_id, fetch_effect, status, code
+):
+    """Chaque erreur est renvoyée au format Error {code, message}."""
+    point_set_id = VALID_UUID
+    if fetch_effect is None:
+        point_set_id = "not_a_uuid"
+    elif isinstance(fetch_effect, bytes):
+        mock_fetch_data.return_value = fetch_effect
+    else:
+        mock_fetch_data.side_effect = fetch_effect
+
+    response = client.get(f"/triangulation/{point_set_id}")
+
+    assert response.status_code == status
+    assert response.mimetype == "application/json"
+    assert response.json['code'] == code
+    assert response.json['message']
+
+
+@patch('application.triangulator_app.psm_client_fetch_data')
+def test_04_metrics_count_each_stage(
+    mock_fetch_data: Mock, client, square_point_set
+):
+    """/metrics expose un histogramme par étape, alimenté par chaque requête."""
+    mock_fetch_data.return_value = square_point_set
+    client.get(f"/triangulation/{VALID_UUID}")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    lines = response.get_data(as_text=True).splitlines()
+    for stage in STAGES:
+        assert f'{STAGE_METRIC_NAME}_count{{stage="{stage}"}} 1' in lines
+
+
+@patch('application.triangulator_app.psm_client_fetch_data')
+def test_05_metrics_count_predicates(
+    mock_fetch_data: Mock, client, square_point_set
+):
+    """/metrics expose le nombre d'appels des prédicats géométriques."""
+    mock_fetch_data.return_value = square_point_set
+    client.get(f"/triangulation/{VALID_UUID}")
+
+    text = client.get("/metrics").get_data(as_text=True)
+
+    for line in text.splitlines():
+        if line.startswith(f'{PREDICATE_CALLS_METRIC_NAME}{{predicate="orient2d"}}'):
+            assert int(line.split()[-1]) > 0
+            break
+    else:
+        pytest.fail("orient2d counter missing")
+
+
+@patch('application.triangulator_app._triangulate_point_set',
+       wraps=_triangulate_point_set)
+@patch('application.triangulator_app.STREAM_CHUNK_SIZE', 12)
+@patch('application.triangulator_app.STREAM_MIN_BYTES', 0)
+@patch('application.triangulator_app.psm_client_fetch_data')
+def test_06_streamed_result_is_cached_on_disk(
+    mock_fetch_data: Mock, mock_triangulate: Mock, client, tmp_path, square_point_set
+):
+    """Une réponse envoyée par morceaux est écrite dans DISK_CACHE, pas en mémoire."""
+    mock_fetch_data.return_value = square_point_set
+    key = point_set_digest(square_point_set)
+    url = f"/triangulation/{uuid.uuid4()}"
+
+    # Sans cache disque : envoyée, mais gardée nulle part.
+    assert client.get(url).data == triangulation_pipeline(square_point_set)
+    RESULT_CACHE.clear()
+    assert mock_triangulate.call_count == 2
+
+    with patch('application.triangulator_app.DISK_CACHE',
+               DiskCache(str(tmp_path), 1 << 20)) as disk_cache:
+        # Envoi interrompu (client déconnecté) : rien n'est mis en cache.
+        response = client.get(url, buffered=False)
+        next(iter(response.response))
+        response.close()
+        assert key not in disk_cache
+        assert os.listdir(tmp_path) == []
+
+        bodies = [client.get(url).data for _ in range(3)]
+
+        assert bodies[0] == bodies[1] == bodies[2]
+        assert disk_cache.get(key) == bodies[0]
+    assert key not in RESULT_CACHE
+    assert mock_triangulate.call_count == 4
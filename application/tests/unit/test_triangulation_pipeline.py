@@ -10,7 +10,11 @@ from werkzeug.exceptions import (
     InternalServerError,
 )
 
-from application.triangulator_app import triangulation_pipeline
+from application.triangulator_app import (
+    RESULT_CACHE,
+    triangulation_compute,
+    triangulation_pipeline,
+)
 from application.types import PointSet_Geom, Triangles_Geom
 
 VALID_UUID = str(uuid.uuid4())
@@ -35,6 +39,8 @@ valid_pointSet_Geom = cast (PointSet_Geom, [
     {'x': 1.9, 'y': 2.0}
 ])
 
+MOCK_BOUNDS = (0.1, 0.2, 1.9, 2.0)
+
 mock_triangles_Geom = cast(Triangles_Geom, [
     {'v1': 1, 'v2': 2, 'v3': 3},
     {'v1': 0, 'v2': 1, 'v3': 3},
@@ -55,84 +61,85 @@ Mock_Triangulation_Bytes = (
 )
 
 # ------------Test up to validate point set------------
-# -> validate point set - Fail Cases (Succes implicit au test suivant. 
-#                       Est-ce que je dois le faire aussi ici ?)
-# -> decode_binary_to_geometric - Not Executed
+# -> validate_and_decode_point_set - Fail
+# -> deduplicate_point_set - Not executed
 # -> triangulation_compute - Not executed
 # -> encode_geometric_to_binary - Not executed
-@patch('triangulation_pipeline.validate_point_set')
-def test_01_triangulation_pipeline_validate_point_set_fail(
-    mock_validate_point_set: Mock):
-    """Test unitaire pipeline - Echec sur validate_point_set."""
+@patch('application.triangulator_app.deduplicate_point_set')
+@patch('application.triangulator_app.validate_and_decode_point_set')
+def test_01_triangulation_pipeline_validate_and_decode_fail(
+    mock_validate_and_decode: Mock,
+    mock_deduplicate_point_set: Mock,
+    ):
+    """Test unitaire pipeline - Echec sur validate_and_decode_point_set."""
     MOCK_ERROR_MESSAGE = "Validate_point_set FAIL - PointSet Not valid - REASON"
     error = InternalServerError(MOCK_ERROR_MESSAGE)
     
-    mock_validate_point_set.side_effect = error
+    mock_validate_and_decode.side_effect = error
     
     with pytest.raises(InternalServerError) as excinfo:
         triangulation_pipeline(valid_PointSet)
     
-    mock_validate_point_set.assert_called_once_with(valid_PointSet)
+    mock_validate_and_decode.assert_called_once_with(valid_PointSet)
+    mock_deduplicate_point_set.assert_not_called()
     assert MOCK_ERROR_MESSAGE in str(excinfo.value)
 
 
-# ------------Test up to validate point set------------
-# -> validate point set - Succes
-# -> decode_binary_to_geometric - Fail
+# ------------Test up to deduplicate point set------------
+# -> validate_and_decode_point_set - Succes
+# -> deduplicate_point_set - Fail
 # -> triangulation_compute - Not executed
 # -> encode_geometric_to_binary - Not executed
-@patch('triangulator_app.decode_binary_to_geometric')
-@patch('triangulator_app.validate_point_set')
-def test_01_triangulation_pipeline_decode_binary_to_geometric_fail(
-    mock_validate_point_set: Mock,
-    mock_decode_binary_to_geometric: Mock,
+@patch('application.triangulator_app.triangulation_compute')
+@patch('application.triangulator_app.deduplicate_point_set')
+@patch('application.triangulator_app.validate_and_decode_point_set')
+def test_01_triangulation_pipeline_deduplicate_fail(
+    mock_validate_and_decode: Mock,
+    mock_deduplicate_point_set: Mock,
+    mock_triangulation_compute: Mock,
     ):
-    """Test unitaire pipeline - Echec sur validate_point_set."""
-    MOCK_ERROR_MESSAGE = "decode_binary_to_geometric FAIL - REASON"
-    error = InternalServerError(MOCK_ERROR_MESSAGE)
+    """Test unitaire pipeline - Echec sur deduplicate_point_set."""
+    MOCK_ERROR_MESSAGE = "deduplicate_point_set FAIL - REASON"
     
-    mock_validate_point_set.return_value = None #Succes case
-    mock_decode_binary_to_geometric.side_effect = error
+    mock_validate_and_decode.return_value = (valid_pointSet_Geom, MOCK_BOUNDS)
+    mock_deduplicate_point_set.side_effect = ValueError(MOCK_ERROR_MESSAGE)
 
     with pytest.raises(InternalServerError) as excinfo:
         triangulation_pipeline(valid_PointSet)
     
-    mock_validate_point_set.assert_called_once_with(valid_PointSet)
-    mock_decode_binary_to_geometric.assert_called_once_with(valid_PointSet)
+    mock_validate_and_decode.assert_called_once_with(valid_PointSet)
+    mock_deduplicate_point_set.assert_called_once_with(valid_PointSet)
+    mock_triangulation_compute.assert_not_called()
     assert MOCK_ERROR_MESSAGE in str(excinfo.value)
 
-# ------------Test up to validate point set------------
-# -> validate point set - Succes
-# -> decode_binary_to_geometric - Succes
+# ------------Test up to triangulation compute------------
+# -> validate_and_decode_point_set - Succes
 # -> triangulation_compute - Fail
 # -> encode_geometric_to_binary - Not executed
-@patch('triangulator_app.triangulation_compute')
-@patch('triangulator_app.decode_binary_to_geometric')
-@patch('triangulator_app.validate_point_set')
+@patch('application.triangulator_app.triangulation_compute')
+@patch('application.triangulator_app.validate_and_decode_point_set')
 def test_01_triangulation_pipeline_triangulation_compute_fail(
-    mock_validate_point_set: Mock,
-    mock_decode_binary_to_geometric: Mock,
+    mock_validate_and_decode: Mock,
     mock_triangulation_compute: Mock
     ):
     """Test unitaire pipeline - Echec sur triangulation compute."""
     MOCK_ERROR_MESSAGE = "Triangulation Compute Fail - REASON"
     error = InternalServerError(MOCK_ERROR_MESSAGE)
     
-    mock_validate_point_set.return_value = None #Succes case
-    mock_decode_binary_to_geometric.return_value = valid_pointSet_Geom
+    mock_validate_and_decode.return_value = (valid_pointSet_Geom, MOCK_BOUNDS)
     mock_triangulation_compute.side_effect = error
 
     with pytest.raises(InternalServerError) as excinfo:
         triangulation_pipeline(valid_PointSet)
     
-    mock_validate_point_set.assert_called_once_with(valid_PointSet)
-    mock_decode_binary_to_geometric.assert_called_once_with(valid_PointSet)
-    mock_triangulation_compute.assert_called_once_with(valid_pointSet_Geom)
+    mock_validate_and_decode.assert_called_once_with(valid_PointSet)
+    mock_triangulation_compute.assert_called_once_with(
+        valid_pointSet_Geom, MOCK_BOUNDS
+    )
     assert MOCK_ERROR_MESSAGE in str(excinfo.value)
 
-# ------------Test up to validate point set------------
-# -> validate point set - Succes
-# -> decode_binary_to_geometric - Succes
+# ------------Test up to encode------------
+# -> validate_and_decode_point_set - Succes
 # -> triangulation_compute - Succes
 # -> encode_geometric_to_binary - Succes and Fail
 @pytest.mark.parametrize("case_id, http_exception_type, result, message", [
@@ -141,13 +148,11 @@ def test_01_triangulation_pipeline_triangulation_compute_fail(
     #Cas 500 - Internal Server Error
     ("Fail 500", InternalServerError, None, "encode_geometric_to_binary Fail - Reason"),
 ])
-@patch('triangulator_app.encode_geometric_to_binary')
-@patch('triangulator_app.triangulation_compute')
-@patch('triangulator_app.decode_binary_to_geometric')
-@patch('triangulator_app.validate_point_set')
+@patch('application.triangulator_app.encode_triangulation_result_to_binary')
+@patch('application.triangulator_app.triangulation_compute')
+@patch('application.triangulator_app.validate_and_decode_point_set')
 def test_01_triangulation_pipeline_(
-    mock_validate_point_set: Mock,
-    mock_decode_binary_to_geometric: Mock,
+    mock_validate_and_decode: Mock,
     mock_triangulation_compute: Mock,
     mock_encode_geometric_to_binary: Mock,
     case_id,
@@ -156,11 +161,10 @@ def test_01_triangulation_pipeline_(
     message
     ):
     """Test unitaire pipeline - Succes OU Echec sur encode_geometric_to_binary."""  
-    mock_validate_point_set.return_value = None #Succes case
-    mock_decode_binary_to_geometric.return_value = valid_pointSet_Geom #Succes case
+    mock_validate_and_decode.return_value = (valid_pointSet_Geom, MOCK_BOUNDS)
     mock_triangulation_compute.return_value =  mock_triangles_Geom#Succe case
 
-    if case_id == "Success_200":
+    if case_id == "Succes_200":
         mock_encode_geometric_to_binary.return_value = result
         
         actual_result = triangulation_pipeline(valid_PointSet)
@@ -173,8 +177,38 @@ def test_01_triangulation_pipeline_(
             triangulation_pipeline(valid_PointSet)
         assert message in str(excinfo.value)
 
-    mock_validate_point_set.assert_called_once_with(valid_PointSet)
-    mock_decode_binary_to_geometric.assert_called_once_with(valid_PointSet)
-    mock_triangulation_compute.assert_called_once_with(valid_pointSet_Geom)
+    mock_validate_and_decode.assert_called_once_with(valid_PointSet)
+    mock_triangulation_compute.assert_called_once_with(
+        valid_pointSet_Geom, MOCK_BOUNDS
+    )
     mock_encode_geometric_to_binary.assert_called_once_with(mock_triangles_Geom)
-    
\ No newline at end of file
+    
+
+# ------------Test du cache des résultats------------
+# -> premier appel - calcul complet, résultat mis en cache
+# -> second appel, même PointSet - résultat servi par le cache
+@patch('application.triangulator_app.triangulation_compute',
+       wraps=triangulation_compute)
+def test_02_triangulation_pipeline_cache_hit(mock_triangulation_compute: Mock):
+    """Test unitaire pipeline - Un PointSet déjà vu n'est pas recalculé."""
+    point_set = struct.pack('I', 3) + struct.pack('ffffff', 0, 0, 1, 0, 0, 1)
+
+    first = triangulation_pipeline(point_set)
+    second = triangulation_pipeline(bytes(point_set))
+
+    assert second is first
+    assert first[:len(point_set)] == point_set
+    assert struct.unpack_from('I', first, len(point_set)) == (1,)
+    assert sorted(struct.unpack_from('III', first, len(point_set) + 4)) == [0, 1, 2]
+    mock_triangulation_compute.assert_called_once()
+    assert RESULT_CACHE.stats()['hits'] == 1
+    assert RESULT_CACHE.stats()['misses'] == 1
+
+
+def test_03_triangulation_pipeline_invalid_point_set():
+    """Test unitaire pipeline - Un PointSet incohérent donne une erreur 500."""
+    with pytest.raises(InternalServerError) as excinfo:
+        triangulation_pipeline(struct.pack('I', 2) + struct.pack('ff', 0, 0))
+
+    assert "mismatch" in str(excinfo.value)
+    assert len(RESULT_CACHE) == 0
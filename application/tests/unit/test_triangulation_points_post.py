@@ -0,0 +1,209 @@
+"""Tests unitaires pour la route POST /triangulation/{pointSetId}/points.
+
+Le PSM est remplacé par un mock de psm_client_fetch_data ; la route est
+appelée par le client de test Flask. Chaque test a ses propres PointSetId :
+les empreintes retenues (POINT_SET_DIGESTS) ne relient pas les tests.
+"""
+
+import mmap
+import random
+import struct
+import uuid
+from collections.abc import Sequence
+from unittest.mock import Mock, patch
+
+import pytest
+from werkzeug.exceptions import NotFound
+
+from application.delaunay import COLLINEAR_POINTS, delaunay_triangulate
+from application.disk_cache import DiskCache
+from application.incremental import IncrementalMesh
+from application.result_cache import ResultCache, point_set_digest
+from application.triangulator_app import (
+    DEGENERATE_EMPTY,
+    DUPLICATES_REJECT,
+    NO_MESH,
+    POINT_SET_CORRUPTED,
+    POINT_SET_DUPLICATE_POINTS,
+    POINT_SET_ID_NOT_UUID,
+    POINT_SET_LENGTH_MISMATCH,
+    PSM_NOT_FOUND,
+    RESULT_CACHE,
+    _triangulate_point_set,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_mesh_cache():
+    """Cache des maillages propre à chaque test."""
+    with patch('application.triangulator_app.MESH_CACHE',
+               ResultCache(1 << 30, sizeof=lambda mesh: mesh.nbytes)) as cache:
+        yield cache
+
+
+def pack_points(coords: list[float]) -> bytes:
+    """PointSet binaire des coordonnées (x0, y0, x1, y1, ...)."""
+    return struct.pack('I', len(coords) // 2) + struct.pack(f'{len(coords)}f', *coords)
+
+
+def triangle_set(triangles: bytes | Sequence[int]) -> set[tuple[int, int, int]]:
+    """Triangles (Triangles binaire ou tableau plat), sous forme canonique."""
+    flat = triangles
+    if isinstance(triangles, bytes):
+        (n,) = struct.unpack_from('I', triangles, 0)
+        (t,) = struct.unpack_from('I', triangles, 4 + 8 * n)
+        flat = struct.unpack_from(f'{3 * t}I', triangles, 8 + 8 * n)
+    return {
+        min((a, b, c), (b, c, a), (c, a, b))
+        for a, b, c in zip(flat[0::3], flat[1::3], flat[2::3], strict=True)
+    }
+
+
+@patch('application.triangulator_app.IncrementalMesh', wraps=IncrementalMesh)
+@patch('application.triangulator_app.psm_client_fetch_data')
+def test_01_inserted_points_match_the_union(
+        mock_fetch_data: Mock, mock_mesh: Mock, client):
+    """Triangles de l'union ; le maillage de base est construit une fois."""
+    rng = random.Random(0)
+    base = pack_points([rng.random() for _ in range(2 * 200)])
+    mock_fetch_data.return_value = base
+    url = f"/triangulation/{uuid.uuid4()}/points"
+
+    for seed in range(3):
+        rng = random.Random(seed + 1)
+        delta = pack_points([rng.random() for _ in range(2 * 5)])
+        union = struct.pack('I', 205) + base[4:] + delta[4:]
+        xy = struct.unpack(f'{2 * 205}f', union[4:])
+        expected = delaunay_triangulate(xy[0::2], xy[1::2])
+
+        response = client.post(url, data=delta)
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/octet-stream"
+        assert response.data[:len(union)] == union
+        assert triangle_set(response.data) == triangle_set(expected)
+        # Le résultat est en cache comme celui de l'union.
+        assert RESULT_CACHE.get(point_set_digest(union)) == response.data
+
+    # Après la première requête, ni le PSM ni la reconstruction.
+    mock_fetch_data.assert_called_once()
+    mock_mesh.assert_called_once()
+
+
+@patch('application.triangulator_app.psm_client_fetch_data')
+def test_02_degenerate_base_triangulates_the_union(mock_fetch_data: Mock, client):
+    """Base alignée (sans triangulation) : l'union est triangulée entièrement."""
+    mock_fetch_data.return_value = pack_points([0, 0, 1, 0, 2, 0])
+    url = f"/triangulation/{uuid.uuid4()}/points"
+
+    response = client.post(url, data=pack_points([1, 1]))
+
+    assert response.status_code == 200
+    assert triangle_set(response.data) == {(0, 1, 3), (1, 2, 3)}
+
+    # Sans point hors de la droite, l'erreur de l'union est retournée.
+    response = client.post(url, data=pack_points([3, 0]))
+    assert response.status_code == 500
+    assert response.get_json()['message'] == COLLINEAR_POINTS
+
+
+@pytest.mark.parametrize("point_set_id, delta, code, message", [
+    ("not_a_uuid", pack_points([0, 0]), "INVALID_POINT_SET_ID", POINT_SET_ID_NOT_UUID),
+    (None, struct.pack('I', 2) + struct.pack('2f', 0, 0), "INVALID_POINTS",
+     POINT_SET_LENGTH_MISMATCH),
+    (None, pack_points([float('nan'), 0]), "INVALID_POINTS", POINT_SET_CORRUPTED),
+])
+@patch('application.triangulator_app.psm_client_fetch_data')
+def test_03_bad_request(
+        mock_fetch_data: Mock, client, point_set_id, delta, code, message):
+    """PointSetId ou points à ajouter invalides : 400, sans interroger le PSM."""
+    point_set_id = point_set_id or str(uuid.uuid4())
+
+    response = client.post(f"/triangulation/{point_set_id}/points", data=delta)
+
+    assert response.status_code == 400
+    assert response.get_json() == {'code': code, 'message': message}
+    mock_fetch_data.assert_not_called()
+
+
+@patch('application.triangulator_app.psm_client_fetch_data', side_effect=NotFound())
+def test_04_unknown_point_set(mock_fetch_data: Mock, client):
+    """PointSetId inconnu du PSM : 404, comme GET /triangulation."""
+    response = client.post(f"/triangulation/{uuid.uuid4()}/points",
+                           data=pack_points([0, 0]))
+
+    assert response.status_code == 404
+    assert response.get_json() == {
+        'code': "POINT_SET_NOT_FOUND", 'message': PSM_NOT_FOUND,
+    }
+
+
+@patch('application.triangulator_app.psm_client_fetch_data')
+def test_05_duplicates(mock_fetch_data: Mock, client):
+    """Point ajouté en double : ignoré (fusion), ou refusé (DUPLICATES_REJECT)."""
+    mock_fetch_data.return_value = pack_points([0, 0, 1, 0, 0, 1])
+    url = f"/triangulation/{uuid.uuid4()}/points"
+
+    response = client.post(url, data=pack_points([1, 0, 1, 2]))
+    assert response.status_code == 200
+    assert triangle_set(response.data) == {(0, 1, 2), (1, 4, 2)}
+
+    with patch('application.triangulator_app.DUPLICATE_POINTS', DUPLICATES_REJECT):
+        response = client.post(url, data=pack_points([1, 0]))
+    assert response.status_code == 400
+    assert response.get_json() == {
+        'code': "INVALID_POINTS", 'message': POINT_SET_DUPLICATE_POINTS,
+    }
+
+
+@patch('application.triangulator_app.mmap.mmap', wraps=mmap.mmap)
+@patch('application.triangulator_app.psm_client_fetch_data')
+def test_06_spilled_base_is_mapped(
+        mock_fetch_data: Mock, mock_mmap: Mock, client, tmp_path):
+    """Triangles de base dans SPILL_CACHE : projetés (mmap), sans le PSM."""
+    rng = random.Random(0)
+    base = pack_points([rng.random() for _ in range(2 * 200)])
+    delta = pack_points([rng.random() for _ in range(2 * 5)])
+    mock_fetch_data.return_value = base
+    point_set_id = str(uuid.uuid4())
+
+    with patch('application.triangulator_app.SPILL_CACHE',
+               DiskCache(str(tmp_path), 1 << 20)) as spill_cache, \
+         patch('application.triangulator_app.SPILL_MIN_BYTES', 1024), \
+         patch('application.triangulator_app.RESULT_CACHE', ResultCache(1 << 20)):
+        assert client.get(f"/triangulation/{point_set_id}").status_code == 200
+        assert point_set_digest(base) in spill_cache
+
+        response = client.post(f"/triangulation/{point_set_id}/points", data=delta)
+
+    union = struct.pack('I', 205) + base[4:] + delta[4:]
+    xy = struct.unpack(f'{2 * 205}f', union[4:])
+    assert response.status_code == 200
+    assert triangle_set(response.data) == triangle_set(
+        delaunay_triangulate(xy[0::2], xy[1::2])
+    )
+    mock_fetch_data.assert_called_once()
+    mock_mmap.assert_called_once()
+
+
+@pytest.mark.parametrize("degenerate", ["fail", DEGENERATE_EMPTY])
+@patch('application.triangulator_app.IncrementalMesh', wraps=IncrementalMesh)
+@patch('application.triangulator_app._triangulate_point_set',
+       wraps=_triangulate_point_set)
+@patch('application.triangulator_app.psm_client_fetch_data')
+def test_07_degenerate_base_is_decided_once(
+        mock_fetch_data: Mock, mock_triangulate: Mock, mock_mesh: Mock,
+        client, empty_mesh_cache, degenerate):
+    """Base sans maillage : gardée (NO_MESH), ni recalculée ni reconstruite."""
+    base = pack_points([0, 0, 1, 0, 2, 0])
+    mock_fetch_data.return_value = base
+    url = f"/triangulation/{uuid.uuid4()}/points"
+
+    with patch('application.triangulator_app.DEGENERATE_POINT_SETS', degenerate):
+        for x in range(3):
+            assert client.post(url, data=pack_points([x, 1])).status_code == 200
+
+    assert empty_mesh_cache.get(point_set_digest(base)) is NO_MESH
+    # Base une fois, puis chaque union.
+    assert mock_triangulate.call_count == 1 + 3
+    assert mock_mesh.call_count == (degenerate == DEGENERATE_EMPTY)
@@ -0,0 +1,155 @@
+"""Tests unitaires pour la route POST /triangulations.
+
+Le PSM est remplacé par un mock de psm_client_fetch_data_async ; la route
+est appelée par le client de test Flask.
+"""
+
+import asyncio
+import json
+import struct
+import uuid
+from unittest.mock import Mock, patch
+
+import pytest
+from werkzeug.exceptions import NotFound, ServiceUnavailable
+
+from application.triangulator_app import (
+    BATCH_NOT_A_LIST,
+    BATCH_RESPONSE_TOO_LARGE,
+    BATCH_TOO_LARGE,
+    POINT_SET_ID_NOT_UUID,
+    PSM_NOT_FOUND,
+    PSM_UNAVAILABLE,
+    _triangulate_point_set,
+    triangles_binary_size,
+    triangulation_pipeline,
+)
+
+SQUARE_ID, MISSING_ID, DOWN_ID = (str(uuid.uuid4()) for _ in range(3))
+
+
+def decode_records(body: bytes) -> list[tuple[int, bytes]]:
+    """Décode la réponse de POST /triangulations en (statut, contenu)."""
+    (count,) = struct.unpack_from('I', body, 0)
+    offset, records = 4, []
+    for _ in range(count):
+        status, length = struct.unpack_from('II', body, offset)
+        offset += 8
+        records.append((status, body[offset:offset + length]))
+        offset += length
+    assert offset == len(body)
+    return records
+
+
+@pytest.fixture
+def fake_psm(square_point_set):
+    """PSM simulé : un PointSet, un PointSetId inconnu, un PSM injoignable."""
+    def fetch(pointSetId: str) -> bytes:
+        if pointSetId == MISSING_ID:
+            raise NotFound()
+        if pointSetId == DOWN_ID:
+            raise ServiceUnavailable()
+        return square_point_set
+    return fetch
+
+
+@patch('application.triangulator_app.psm_client_fetch_data_async')
+def test_01_records_follow_the_request_order(
+        mock_fetch_data: Mock, client, fake_psm, square_point_set):
+    """Un enregistrement par PointSetId, avec son statut, dans l'ordre demandé."""
+    mock_fetch_data.side_effect = fake_psm
+    ids = [SQUARE_ID, MISSING_ID, "not-a-uuid", DOWN_ID, SQUARE_ID]
+
+    response = client.post("/triangulations", json=ids)
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/octet-stream"
+    records = decode_records(response.get_data())
+    assert [status for status, _ in records] == [200, 404, 400, 503, 200]
+    assert records[0][1] == records[4][1] == triangulation_pipeline(square_point_set)
+    errors = [json.loads(payload) for _, payload in records[1:4]]
+    assert errors == [
+        {'code': "POINT_SET_NOT_FOUND", 'message': PSM_NOT_FOUND},
+        {'code': "INVALID_POINT_SET_ID", 'message': POINT_SET_ID_NOT_UUID},
+        {'code': "POINT_SET_MANAGER_UNAVAILABLE", 'message': PSM_UNAVAILABLE},
+    ]
+    # PointSetId répété : une seule récupération ; PointSetId invalide : aucune.
+    assert mock_fetch_data.call_count == 3
+
+
+@patch('application.triangulator_app.psm_client_fetch_data_async')
+def test_02_empty_list(mock_fetch_data: Mock, client):
+    """Liste vide : réponse sans enregistrement, aucun appel au PSM."""
+    response = client.post("/triangulations", json=[])
+
+    assert response.status_code == 200
+    assert response.get_data() == struct.pack('I', 0)
+    mock_fetch_data.assert_not_called()
+
+
+@pytest.mark.parametrize("kwargs, message", [
+    ({'json': {"ids": [SQUARE_ID]}}, BATCH_NOT_A_LIST),
+    ({'json': [SQUARE_ID, 42]}, BATCH_NOT_A_LIST),
+    ({'data': b"[not json", 'content_type': "application/json"}, BATCH_NOT_A_LIST),
+    ({'data': json.dumps([SQUARE_ID])}, BATCH_NOT_A_LIST),
+    ({'json': [SQUARE_ID] * 3}, BATCH_TOO_LARGE),
+])
+@patch('application.triangulator_app.BATCH_MAX_IDS', 2)
+@patch('application.triangulator_app.psm_client_fetch_data_async')
+def test_03_invalid_batch(mock_fetch_data: Mock, client, kwargs, message):
+    """Corps qui n'est pas une liste JSON de strings, ou trop long : 400."""
+    response = client.post("/triangulations", **kwargs)
+
+    assert response.status_code == 400
+    assert response.json == {'code': "INVALID_BATCH_REQUEST", 'message': message}
+    mock_fetch_data.assert_not_called()
+
+
+@patch('application.triangulator_app.psm_client_fetch_data_async')
+def test_04_point_sets_are_fetched_together(
+        mock_fetch_data: Mock, client, square_point_set):
+    """Les PointSet du lot sont tous en cours de récupération en même temps."""
+    ids = [str(uuid.uuid4()) for _ in range(20)]
+    inflight = peak = 0
+
+    async def slow_psm(pointSetId: str) -> bytes:
+        nonlocal inflight, peak
+        inflight += 1
+        peak = max(peak, inflight)
+        await asyncio.sleep(0.01)
+        inflight -= 1
+        return square_point_set
+
+    mock_fetch_data.side_effect = slow_psm
+
+    response = client.post("/triangulations", json=ids)
+
+    assert response.status_code == 200
+    assert [status for status, _ in decode_records(response.get_data())] == [200] * 20
+    assert peak == len(ids)
+
+
+@patch('application.triangulator_app._triangulate_point_set',
+       wraps=_triangulate_point_set)
+@patch('application.triangulator_app.psm_client_fetch_data_async')
+def test_05_response_too_large(
+        mock_fetch_data: Mock, mock_triangulate: Mock, client, square_point_set):
+    """Réponse majorée au-delà de BATCH_MAX_BYTES : 400, sans aucun calcul."""
+    mock_fetch_data.return_value = square_point_set
+    # 4 points : au plus 3 triangles ; PointSetId répétés comptés à chaque fois.
+    record = 8 + triangles_binary_size(4, 3)
+
+    with patch('application.triangulator_app.BATCH_MAX_BYTES', 4 + 2 * record):
+        response = client.post("/triangulations", json=[SQUARE_ID, SQUARE_ID])
+        assert response.status_code == 200
+        assert [status for status, _ in decode_records(response.data)] == [200] * 2
+        mock_triangulate.assert_called_once()
+        mock_triangulate.reset_mock()
+
+        response = client.post("/triangulations", json=[SQUARE_ID] * 3)
+
+    assert response.status_code == 400
+    assert response.json == {
+        'code': "INVALID_BATCH_REQUEST", 'message': BATCH_RESPONSE_TOO_LARGE,
+    }
+    mock_triangulate.assert_not_called()
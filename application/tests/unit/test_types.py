@@ -0,0 +1,53 @@
+"""Tests unitaires pour les conteneurs compacts PointSet_Array et Triangles_Array.
+
+Vérifie qu'ils offrent les mêmes vues que les listes de dictionnaires
+et qu'ils restent compacts en mémoire.
+"""
+
+from array import array
+
+from application.types import PointSet_Array, Triangles_Array
+
+POINTS_GEOM = [{'x': 0.0, 'y': 0.0}, {'x': 1.5, 'y': 0.0}, {'x': 0.0, 'y': 2.5}]
+TRIANGLES_GEOM = [{'v1': 0, 'v2': 1, 'v3': 2}]
+
+
+def test_01_point_set_array_views():
+    """Les points se lisent comme des dictionnaires {'x', 'y'}."""
+    points = PointSet_Array.from_geom(POINTS_GEOM)
+
+    assert len(points) == 3
+    assert points[1]['x'] == 1.5
+    assert points[-1]['y'] == 2.5
+    assert dict(points[2]) == {'x': 0.0, 'y': 2.5}
+    assert [dict(p) for p in points] == POINTS_GEOM
+    assert points == POINTS_GEOM
+    assert points.to_geom() == POINTS_GEOM
+
+
+def test_02_point_set_array_compares_at_storage_precision():
+    """12.3 n'est pas représentable en float 32 bits : l'égalité en tient compte."""
+    points = PointSet_Array(array('f', [12.3]), array('f', [5.5]))
+
+    assert points == [{'x': 12.3, 'y': 5.5}]
+    assert points != [{'x': 12.4, 'y': 5.5}]
+    assert points != [{'x': 12.3}]
+
+
+def test_03_triangles_array_views():
+    """Les triangles se lisent comme des dictionnaires {'v1', 'v2', 'v3'}."""
+    triangles = Triangles_Array.from_geom(TRIANGLES_GEOM)
+
+    assert len(triangles) == 1
+    assert sorted(triangles[0].values()) == [0, 1, 2]
+    assert triangles == TRIANGLES_GEOM
+    assert triangles.to_geom() == TRIANGLES_GEOM
+    assert triangles.indices.typecode == 'I'
+
+
+def test_04_point_set_array_memory_per_point():
+    """Moins de 20 octets par point pour 10^6 points."""
+    n = 10**6
+    points = PointSet_Array(array('f', bytes(4 * n)), array('f', bytes(4 * n)))
+
+    assert points.nbytes / n < 20
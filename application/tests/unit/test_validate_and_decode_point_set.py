@@ -0,0 +1,53 @@
+"""Tests unitaires pour la fonction validate_and_decode_point_set.
+
+Mêmes vérifications que validate_point_set, même décodage que
+decode_binary_point_set_to_geometric, plus la boîte englobante.
+"""
+
+import struct
+
+import pytest
+
+from application.triangulator_app import (
+    POINT_SET_CORRUPTED,
+    decode_binary_point_set_to_geometric,
+    validate_and_decode_point_set,
+)
+
+
+def test_01_validate_and_decode_point_set(pointSets):
+    """Mêmes PointSets que validate_point_set : mêmes erreurs."""
+    case_id = pointSets["case_id"]
+    PointSet = pointSets["PointSet"]
+    expected_message = pointSets["message"]
+
+    if case_id == "1_Valid PointSet":
+        points, _ = validate_and_decode_point_set(PointSet)
+        assert points == decode_binary_point_set_to_geometric(PointSet)
+    else:
+        with pytest.raises(ValueError) as excinfo:
+            validate_and_decode_point_set(PointSet)
+        assert expected_message in str(excinfo.value)
+
+
+def test_02_bounds():
+    """Boîte englobante (min_x, min_y, max_x, max_y), None sans point."""
+    pointSet = struct.pack('I', 3) + struct.pack('6f', 1, -2, -0.5, 4, 3, 0.25)
+
+    points, bounds = validate_and_decode_point_set(pointSet)
+
+    assert len(points) == 3
+    assert bounds == (-0.5, -2.0, 3.0, 4.0)
+    assert validate_and_decode_point_set(struct.pack('I', 0))[1] is None
+
+
+@pytest.mark.parametrize("position", range(6))
+@pytest.mark.parametrize("value", [float('nan'), float('inf'), -float('inf')])
+def test_03_non_finite_anywhere(position, value):
+    """NaN ou infini, à n'importe quelle position : PointSet corrompu."""
+    coords = [0.0, 0.0, 1.0, 0.0, 0.0, 1.0]
+    coords[position] = value
+    pointSet = struct.pack('I', 3) + struct.pack('6f', *coords)
+
+    with pytest.raises(ValueError, match=POINT_SET_CORRUPTED):
+        validate_and_decode_point_set(pointSet)
@@ -1 +1,62 @@
-"""Validate a triangle variable - Maybe not useful."""
\ No newline at end of file
+"""Tests unitaires pour la fonction validate_triangles."""
+
+import struct
+from unittest.mock import Mock, patch
+
+import pytest
+from werkzeug.exceptions import InternalServerError
+
+from application.triangulator_app import (
+    TRIANGLES_INDEX_OUT_OF_RANGE,
+    TRIANGLES_LENGTH_MISMATCH,
+    TRIANGLES_MISSING_HEADER,
+    triangulation_pipeline,
+    validate_triangles,
+)
+
+POINTS = struct.pack('I', 4) + struct.pack('8f', 0, 0, 1, 0, 1, 1, 0, 1)
+
+
+def triangles(*indices: int, count: int | None = None) -> bytes:
+    """Triangles binaire sur les 4 sommets de POINTS (en-tête T modifiable)."""
+    count = len(indices) // 3 if count is None else count
+    return POINTS + struct.pack('I', count) + struct.pack(f'{len(indices)}I', *indices)
+
+
+@pytest.mark.parametrize("binary", [
+    triangles(0, 1, 2, 0, 2, 3),
+    triangles(),
+    struct.pack('II', 0, 0),
+])
+def test_01_valid_triangles(binary):
+    """Triangles cohérents, éventuellement sans triangle ni sommet."""
+    assert validate_triangles(binary) is None
+
+
+@pytest.mark.parametrize("binary, message", [
+    (b'', TRIANGLES_MISSING_HEADER),
+    (POINTS, TRIANGLES_LENGTH_MISMATCH),
+    (POINTS[:-4] + struct.pack('I', 0), TRIANGLES_LENGTH_MISMATCH),
+    (triangles(0, 1, 2, count=2), TRIANGLES_LENGTH_MISMATCH),
+    (triangles(0, 1, 2, 0, 2, 3, count=1), TRIANGLES_LENGTH_MISMATCH),
+    (triangles(0, 1, 2)[:-1], TRIANGLES_LENGTH_MISMATCH),
+    (triangles(0, 1, 4), TRIANGLES_INDEX_OUT_OF_RANGE),
+    (triangles(0, 1, 2, 0xFFFFFFFF, 2, 3), TRIANGLES_INDEX_OUT_OF_RANGE),
+])
+def test_02_invalid_triangles(binary, message):
+    """En-têtes et longueur incohérents, ou sommet inexistant : ValueError."""
+    with pytest.raises(ValueError, match=message):
+        validate_triangles(binary)
+
+
+@patch('application.triangulator_app.encode_triangulation_result_to_binary')
+def test_03_pipeline_rejects_invalid_output(mock_encode: Mock):
+    """Le pipeline vérifie les Triangles encodés avant de les retourner."""
+    mock_encode.return_value = triangles(0, 1, 7)
+
+    point_set = struct.pack('I', 3) + struct.pack('6f', 0, 0, 1, 0, 0, 1)
+
+    with pytest.raises(InternalServerError) as excinfo:
+        triangulation_pipeline(point_set)
+
+    assert TRIANGLES_INDEX_OUT_OF_RANGE in str(excinfo.value)
@@ -1,17 +1,273 @@
 """A remplir."""
 
+import asyncio
+import io
+import json
+import logging
+import mmap
+import os
 import struct
+import tempfile
+from array import array
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from http.client import HTTPException as PSMHTTPException
+from math import isfinite
+from typing import BinaryIO
 from uuid import UUID
 
-from flask import Flask, Response, jsonify
+from flask import Flask, Response, jsonify, request, send_file
+from werkzeug.datastructures import ETags
 from werkzeug.exceptions import (
     BadRequest,
+    HTTPException,
     InternalServerError,
     NotFound,
     ServiceUnavailable,
 )
 
-from .types import PointSet_Geom, Triangulation_Result
+from .async_psm import AsyncPSMClient, EventLoopThread
+from .compute_pool import ComputePool
+from .delaunay import COLLINEAR_POINTS, EMPTY_INPUT, NOT_ENOUGH_POINTS
+from .disk_cache import DiskCache
+from .engines import INCREMENTAL, triangulate
+from .incremental import IncrementalMesh
+from .metrics import (
+    PREDICATE_CALLS_METRIC_HELP,
+    PREDICATE_CALLS_METRIC_NAME,
+    PREDICATE_EXACT_METRIC_HELP,
+    PREDICATE_EXACT_METRIC_NAME,
+    StageMetrics,
+    render_counter,
+)
+from .predicates import PREDICATE_STATS, line_orientation
+from .psm_pool import PoolTimeout, PSMConnectionPool
+from .result_cache import ResultCache, point_set_digest, settings_version
+from .single_flight import SingleFlight
+from .spatial_order import BRIO
+from .types import (
+    Bounds,
+    PointSet_Array,
+    PointSet_Geom,
+    Triangles_Array,
+    Triangulation_Result,
+)
+
+logger = logging.getLogger(__name__)
+
+#------------Configuration----------------------#
+# Au-delà, le nombre de triangles (jusqu'à 2N - 5) ne tient plus sur les
+# 4 octets de l'en-tête de la représentation Triangles.
+MAX_POINTS = (0xFFFFFFFF + 5) // 2
+
+# Moteur de triangulation (engines.ENGINES) et, pour le moteur incrémental,
+# ordre d'insertion des points (spatial_order.SPATIAL_ORDERS).
+TRIANGULATION_ENGINE = os.environ.get("TRIANGULATOR_ENGINE", INCREMENTAL)
+SPATIAL_ORDER = os.environ.get("TRIANGULATOR_SPATIAL_ORDER", BRIO)
+
+# Points en double (mêmes 8 octets x, y) : DUPLICATES_COLLAPSE les fusionne
+# avant le calcul, les triangles retournés désignant toujours les sommets
+# d'origine ; DUPLICATES_REJECT refuse le PointSet (500 TRIANGULATION_FAILED).
+DUPLICATES_COLLAPSE = "collapse"
+DUPLICATES_REJECT = "reject"
+DUPLICATE_POINTS = os.environ.get(
+    "TRIANGULATOR_DUPLICATE_POINTS", DUPLICATES_COLLAPSE
+)
+
+# PointSet sans triangulation (moins de 3 points distincts, points tous
+# alignés), détecté avant le calcul : DEGENERATE_FAIL le refuse (500
+# TRIANGULATION_FAILED), DEGENERATE_EMPTY retourne une liste de triangles vide.
+DEGENERATE_FAIL = "fail"
+DEGENERATE_EMPTY = "empty"
+DEGENERATE_POINT_SETS = os.environ.get(
+    "TRIANGULATOR_DEGENERATE_POINT_SETS", DEGENERATE_FAIL
+)
+
+# Version des résultats gardés d'un démarrage à l'autre (DiskCache) et de
+# l'ETag : elle change avec le format des Triangles, le moteur et les options
+# qui modifient le résultat. CACHE_FORMAT_VERSION est à incrémenter à chaque
+# changement de l'encodage ou d'un moteur.
+CACHE_FORMAT_VERSION = 1
+CACHE_VERSION = settings_version(
+    CACHE_FORMAT_VERSION,
+    TRIANGULATION_ENGINE,
+    SPATIAL_ORDER,
+    DUPLICATE_POINTS,
+    DEGENERATE_POINT_SETS,
+)
+
+# Budget mémoire du cache des triangulations encodées.
+RESULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+RESULT_CACHE = ResultCache(RESULT_CACHE_MAX_BYTES)
+
+# Cache disque, sous le cache mémoire : les résultats survivent aux
+# redémarrages. Désactivé si TRIANGULATOR_DISK_CACHE_DIR n'est pas défini.
+DISK_CACHE_DIR = os.environ.get("TRIANGULATOR_DISK_CACHE_DIR", "")
+DISK_CACHE_MAX_BYTES = int(
+    os.environ.get("TRIANGULATOR_DISK_CACHE_MAX_BYTES", str(4 * 1024**3))
+)
+DISK_CACHE = (
+    DiskCache(DISK_CACHE_DIR, DISK_CACHE_MAX_BYTES, CACHE_VERSION)
+    if DISK_CACHE_DIR else None
+)
+
+# Triangles de plus de SPILL_MIN_BYTES octets (0 : désactivé) : encodés
+# dans un fichier de SPILL_CACHE (DISK_CACHE, ou à défaut un cache dans
+# SPILL_DIR), puis envoyés par send_file (wsgi.file_wrapper / sendfile),
+# sans passer par la mémoire du worker. Le fichier sert les requêtes
+# suivantes.
+SPILL_MIN_BYTES = int(os.environ.get("TRIANGULATOR_SPILL_MIN_BYTES", "0"))
+SPILL_DIR = os.environ.get(
+    "TRIANGULATOR_SPILL_DIR",
+    os.path.join(tempfile.gettempdir(), "triangulator-spill"),
+)
+SPILL_MAX_BYTES = int(
+    os.environ.get("TRIANGULATOR_SPILL_MAX_BYTES", str(16 * 1024**3))
+)
+SPILL_CACHE = (
+    None if SPILL_MIN_BYTES <= 0
+    else DISK_CACHE if DISK_CACHE is not None
+    else DiskCache(SPILL_DIR, SPILL_MAX_BYTES, CACHE_VERSION)
+)
+
+# Les PointSet derrière un PointSetId sont immuables : l'empreinte de chaque
+# PointSet récupéré est gardée, indexée par PointSetId (LRU borné en octets),
+# pour répondre aux requêtes conditionnelles sans interroger le PSM. Avec
+# CACHE_VERSION, elle sert d'ETag fort à la réponse Triangles, qui peut être
+# gardée indéfiniment.
+POINT_SET_DIGESTS_MAX_BYTES = 8 * 1024 * 1024
+POINT_SET_DIGESTS = ResultCache(POINT_SET_DIGESTS_MAX_BYTES)
+TRIANGLES_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Ajout de points à une triangulation (POST /triangulation/<id>/points) : le
+# maillage reconstruit depuis les Triangles de base (IncrementalMesh) est
+# gardé, indexé par l'empreinte du PointSet de base (LRU borné en octets),
+# et n'est construit qu'une fois pour des requêtes concurrentes (IN_FLIGHT_MESH).
+# Une base sans maillage (PointSet dégénéré) y est gardée comme NO_MESH : le
+# repli sur le calcul complet de l'union est décidé une fois par empreinte.
+MESH_CACHE_MAX_BYTES = int(
+    os.environ.get("TRIANGULATOR_MESH_CACHE_MAX_BYTES", str(256 * 1024 * 1024))
+)
+MESH_CACHE = ResultCache(MESH_CACHE_MAX_BYTES, sizeof=lambda mesh: mesh.nbytes)
+
+
+class _NoMesh:
+    """Absence de maillage de base, gardée dans MESH_CACHE (taille nulle)."""
+
+    nbytes = 0
+
+
+NO_MESH = _NoMesh()
+
+# Vérification des Triangles produits (validate_triangles) avant l'envoi.
+VALIDATE_TRIANGLES = os.environ.get("TRIANGULATOR_VALIDATE_TRIANGLES", "1") != "0"
+
+# Mode d'exécution du calcul : 0 pour calculer dans le processus du serveur,
+# sinon nombre de processus du pool de calcul (contourne le GIL).
+COMPUTE_WORKERS = int(os.environ.get("TRIANGULATOR_COMPUTE_WORKERS", "0"))
+COMPUTE_POOL = ComputePool(COMPUTE_WORKERS) if COMPUTE_WORKERS > 0 else None
+
+# Requêtes concurrentes pour un même PointSetId : une seule récupération
+# auprès du PSM et un seul calcul, dont le résultat (ou l'erreur) est
+# partagé par toutes.
+IN_FLIGHT = SingleFlight()
+IN_FLIGHT_STREAM = SingleFlight()
+IN_FLIGHT_MESH = SingleFlight()
+
+# Histogrammes de latence par étape, exposés sur /metrics.
+STAGES = (
+    "uuid_check", "psm_fetch", "validate_decode", "deduplicate",
+    "degeneracy_check", "compute", "encode", "validate_triangles",
+)
+STAGE_METRICS = StageMetrics(STAGES)
+
+# PointSetManager : adresse et pool de connexions persistantes.
+PSM_HOST = os.environ.get("PSM_HOST", "localhost")
+PSM_PORT = int(os.environ.get("PSM_PORT", "5001"))
+PSM_TIMEOUT = 5.0
+PSM_POOL_MAX_SIZE = 8
+PSM_POOL_IDLE_TIMEOUT = 30.0
+PSM_POOL_WARM_SIZE = 2
+PSM_POOL = PSMConnectionPool(
+    PSM_HOST, PSM_PORT,
+    max_size=PSM_POOL_MAX_SIZE,
+    idle_timeout=PSM_POOL_IDLE_TIMEOUT,
+    timeout=PSM_TIMEOUT,
+)
+
+# Client asyncio du PSM (psm_client_fetch_data_async), dans une boucle
+# dédiée, démarrée au premier appel : les récupérations en attente du PSM
+# n'occupent pas de thread. POST /triangulations récupère ainsi tous les
+# PointSet d'un lot en même temps (asyncio.gather).
+PSM_ASYNC_MAX_SIZE = 256
+ASYNC_LOOP = EventLoopThread("psm-async")
+ASYNC_PSM_CLIENT = AsyncPSMClient(
+    PSM_HOST, PSM_PORT,
+    max_size=PSM_ASYNC_MAX_SIZE,
+    idle_timeout=PSM_POOL_IDLE_TIMEOUT,
+    timeout=PSM_TIMEOUT,
+)
+
+# Route POST /triangulations : nombre maximal de PointSetId par requête,
+# taille maximale de la réponse (construite en mémoire), et threads qui
+# calculent les triangulations en parallèle, une fois les PointSet récupérés
+# par ASYNC_PSM_CLIENT.
+BATCH_MAX_IDS = 1000
+BATCH_MAX_BYTES = int(
+    os.environ.get("TRIANGULATOR_BATCH_MAX_BYTES", str(256 * 1024 * 1024))
+)
+BATCH_WORKERS = int(
+    os.environ.get("TRIANGULATOR_BATCH_WORKERS", str(os.cpu_count() or 1))
+)
+BATCH_EXECUTOR = ThreadPoolExecutor(BATCH_WORKERS, thread_name_prefix="batch")
+
+# Réponse Triangles : au-delà de STREAM_MIN_BYTES, elle est envoyée par
+# morceaux de STREAM_CHUNK_SIZE octets au lieu d'être construite en mémoire.
+STREAM_MIN_BYTES = 1024 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+
+POINT_SET_ID_NOT_UUID = "Not-valid PointSetId - Expected UUID format"
+PSM_BAD_REQUEST = "PSM : uuid format not valid"
+PSM_NOT_FOUND = "PSM : Coudn't find the requested PointSet"
+PSM_UNAVAILABLE = "PSM is not responding"
+
+POINT_SET_MISSING_HEADER = "Not-valid PointSet - Missing header"
+POINT_SET_LENGTH_MISMATCH = (
+    "Not-valid PointSet - Point amount mismatch Announced amount"
+)
+POINT_SET_TOO_LARGE = (
+    "Warning - Number of points close to maximum storageble amount"
+)
+POINT_SET_CORRUPTED = "Not-valid PointSet - Corrupted content"
+POINT_SET_DUPLICATE_POINTS = "Not-valid PointSet - Duplicate points"
+
+BATCH_NOT_A_LIST = "Not-valid batch - Expected a JSON list of PointSetIds"
+BATCH_TOO_LARGE = "Not-valid batch - Too many PointSetIds"
+BATCH_RESPONSE_TOO_LARGE = (
+    "Not-valid batch - Triangulations too large for one response"
+)
+
+SPILL_FILE_EVICTED = "Triangles file evicted before it could be sent"
+
+
+class InvalidBatchRequest(BadRequest):
+    """400 : le corps de POST /triangulations n'est pas une liste valide."""
+
+    error_code = "INVALID_BATCH_REQUEST"
+
+
+class InvalidPoints(BadRequest):
+    """400 : les points à ajouter (POST /triangulation/<id>/points) sont invalides."""
+
+    error_code = "INVALID_POINTS"
+
+
+TRIANGLES_MISSING_HEADER = "Not-valid Triangles - Missing header"
+TRIANGLES_LENGTH_MISMATCH = (
+    "Not-valid Triangles - Length mismatch with announced amounts"
+)
+TRIANGLES_INDEX_OUT_OF_RANGE = "Not-valid Triangles - Vertex index out of range"
 
 
 #------------Fonctions utilitaires--------------#
@@ -32,7 +288,14 @@ def check_valid_uuid(uuid_str: str) -> None:
         ValueError: Levée si la chaîne n'a pas le format UUID standard.
     
     """
-    raise NotImplementedError("check_valid_uuid non implemented yet")
+    # Seule la forme canonique 8-4-4-4-12 est acceptée (pas d'accolades,
+    # de préfixe urn:uuid: ni d'espaces, que UUID() tolère en partie).
+    try:
+        canonical = str(UUID(uuid_str))
+    except (ValueError, TypeError, AttributeError) as error:
+        raise ValueError(POINT_SET_ID_NOT_UUID) from error
+    if canonical != uuid_str.lower():
+        raise ValueError(POINT_SET_ID_NOT_UUID)
         
 def validate_point_set(pointSet: bytes) -> None:
     """Fonction utilitaire. Vérifie l'intégrite d'un point set au format binaire.
@@ -52,13 +315,111 @@ def validate_point_set(pointSet: bytes) -> None:
         - None : Ne retourne rien si le PointSet est intègre
 
     Raises :
-        - 500 Internal Server Error : Si le PointSet n'est pas cohérent 
-        (ex. On annonce 10 points, mais sa longueuer en stocke un nombre différent)
+        - ValueError : Si le PointSet n'est pas cohérent 
+        (ex. On annonce 10 points, mais sa longueuer en stocke un nombre différent),
+        s'il annonce plus de MAX_POINTS points ou si une coordonnée n'est pas
+        un nombre fini (NaN, inf). Traduite en 500 Internal Server Error par la
+        couche logique.
+
+    """
+    buffer = memoryview(pointSet)
+    if buffer.nbytes < 4:
+        raise ValueError(POINT_SET_MISSING_HEADER)
+    (n,) = struct.unpack_from('I', buffer, 0)
+    if n > MAX_POINTS:
+        raise ValueError(POINT_SET_TOO_LARGE)
+    if buffer.nbytes != 4 + 8 * n:
+        raise ValueError(POINT_SET_LENGTH_MISMATCH)
+    # La somme est NaN ou infinie si et seulement si une coordonnée l'est :
+    # une somme de floats 32 bits ne peut pas déborder d'un double.
+    if not isfinite(sum(buffer[4:].cast('f'))):
+        raise ValueError(POINT_SET_CORRUPTED)
+
+def deduplicate_point_set(pointSet: bytes) -> array | None:
+    """Fonction utilitaire. Détecte les points en double d'un PointSet valide.
+
+    Les points ne sont pas décodés : chaque enregistrement (x, y) de 8 octets
+    est lu comme un entier de 64 bits (`memoryview.cast('Q')`), qui sert
+    directement de clé de hachage. Une seule passe, en C, sur le tampon :
+    le dictionnaire construit garde, pour chaque point, l'indice de son
+    premier exemplaire. La comparaison est bit à bit : 0.0 et -0.0 restent
+    distincts (les moteurs de triangulation les fusionnent ensuite).
+
+    Args :
+        - pointSet : PointSet binaire, déjà vérifié par validate_point_set
+
+    Returns :
+        - None : Si tous les points sont distincts (cas courant)
+        - keep : Sinon, table de correspondance array('I') : keep[i] est
+          l'indice d'origine du i-ème point conservé (premiers exemplaires,
+          dans l'ordre du PointSet)
+
+    Raises :
+        - ValueError : Si le PointSet contient des points en double et que
+        DUPLICATE_POINTS vaut DUPLICATES_REJECT. Traduite en 500 Internal
+        Server Error par la couche logique.
+    """
+    records = memoryview(pointSet)[4:].cast('Q')
+    n = len(records)
+    # Parcours à rebours : pour un point en double, le premier exemplaire
+    # est écrit en dernier.
+    first = dict(zip(reversed(records), range(n - 1, -1, -1), strict=True))
+    if len(first) == n:
+        return None
+    if DUPLICATE_POINTS == DUPLICATES_REJECT:
+        raise ValueError(POINT_SET_DUPLICATE_POINTS)
+    return array('I', sorted(first.values()))
+
+def compact_point_set(pointSet: bytes, keep: array) -> PointSet_Array:
+    """Retourne les points d'indices keep, copiés depuis le PointSet binaire.
+
+    Les enregistrements de 8 octets sont recopiés tels quels, sans décodage.
+    """
+    records = memoryview(pointSet)[4:].cast('Q')
+    xy = memoryview(array('Q', map(records.__getitem__, keep))).cast('B').cast('f')
+    return PointSet_Array(xy[0::2], xy[1::2])
+
+def point_set_degeneracy(xs: Sequence[float], ys: Sequence[float]) -> str | None:
+    """Fonction utilitaire. Détecte un ensemble de points sans triangulation.
 
+    Une passe au plus, avant le calcul : on cherche deux points distincts
+    a et b, puis un point hors de la droite (a, b), avec le prédicat exact
+    line_orientation. Sur une entrée non dégénérée, le troisième point convient
+    presque toujours : la réponse est immédiate. Une entrée dégénérée est
+    parcourue une fois, sans lancer le moteur de triangulation.
+
+    Args :
+        - xs, ys : coordonnées des points
+
+    Returns :
+        - None : Si au moins trois points ne sont pas alignés
+        - La raison de l'échec sinon : EMPTY_INPUT, NOT_ENOUGH_POINTS (moins de
+          3 points distincts) ou COLLINEAR_POINTS, comme les moteurs
     """
-    raise NotImplementedError("validate_point_set pas encore codé")
+    n = len(xs)
+    if n == 0:
+        return EMPTY_INPUT
+    ax = xs[0]
+    ay = ys[0]
+    b = 1
+    while b < n and xs[b] == ax and ys[b] == ay:
+        b += 1
+    if b == n:
+        return NOT_ENOUGH_POINTS
+    bx = xs[b]
+    by = ys[b]
+    if any(map(line_orientation(ax, ay, bx, by), xs[b + 1:], ys[b + 1:])):
+        return None
+    # Tous alignés : reste-t-il un troisième point distinct ?
+    ends = ((ax, ay), (bx, by))
+    if any(point not in ends for point in zip(xs[b + 1:], ys[b + 1:], strict=True)):
+        return COLLINEAR_POINTS
+    return NOT_ENOUGH_POINTS
+
+def remap_triangles(triangles: Triangles_Array, keep: array) -> Triangles_Array:
+    """Traduit les indices de triangles compactés en indices d'origine (keep)."""
+    return Triangles_Array(array('I', map(keep.__getitem__, triangles.indices)))
 
-# 30/11/25 - Je la garde pour l'instant, mais peut etre j'en aurais pas besoin 
 def validate_triangles(triangles: bytes) -> None:
     """Fonction utilitaire. Vérifie l'intégrité de triangles au format binaire.
 
@@ -83,21 +444,47 @@ def validate_triangles(triangles: bytes) -> None:
           - 4 bytes (unsigned long): Index of the third vertex
         
         ---------------------------------------------------------------
+    Aucune boucle par triangle : les deux en-têtes et la longueur totale
+    sont vérifiés par arithmétique, puis la section des indices est lue
+    comme une vue `memoryview.cast('I')` dont le max() est comparé à N.
+
     Returns :
         - None : Ne retourne rien si le Triangles est intègre
 
     Raises :
-        - 500 Internal Server Error : Si le Triangles n'est pas cohérent
-        (ex. On annonce 10 sommets, mais sa longueuer en stocke un nombre différent 
+        - ValueError : Si le Triangles n'est pas cohérent (ex. On annonce 10
+        sommets, mais sa longueuer en stocke un nombre différent) ou si un
+        triangle désigne un sommet inexistant. Traduite en 500 Internal
+        Server Error par la couche logique.
     
     """
-    raise NotImplementedError("validate_point_set pas encore codé")
+    buffer = memoryview(triangles)
+    if buffer.nbytes < 4:
+        raise ValueError(TRIANGLES_MISSING_HEADER)
+    (n,) = struct.unpack_from('I', buffer, 0)
+    if buffer.nbytes < 8 + 8 * n:
+        raise ValueError(TRIANGLES_LENGTH_MISMATCH)
+    (t,) = struct.unpack_from('I', buffer, 4 + 8 * n)
+    if buffer.nbytes != triangles_binary_size(n, t):
+        raise ValueError(TRIANGLES_LENGTH_MISMATCH)
+    check_triangle_indices(buffer[8 + 8 * n:].cast('I'), n)
+
+def check_triangle_indices(indices: memoryview | array, n_points: int) -> None:
+    """Vérifie que tous les indices de sommets sont inférieurs à n_points.
+
+    Raises :
+        ValueError : Un triangle désigne un sommet inexistant
+    """
+    if len(indices) and max(indices) >= n_points:
+        raise ValueError(TRIANGLES_INDEX_OUT_OF_RANGE)
 
 #-------------Fonctions couche Client------------#
 def psm_client_fetch_data(pointSetId: str) -> bytes:
     """Récupère un PointSet au format binaire auprès du PointSetManager (PSM).
 
     Est utilisée par la couche serveur du Triangulateur (triangulation_get).
+    La requête GET /pointset/{pointSetId} passe par le pool de connexions
+    persistantes PSM_POOL : pas de nouvelle connexion TCP par requête.
 
     Args :
         - pointSetId : identifiant du PointSet, type : string, format : UUID
@@ -106,14 +493,106 @@ def psm_client_fetch_data(pointSetId: str) -> bytes:
         - pointSet : PointSet au format binaire
 
     Raises:
+          400 Bad Request : Le PSM refuse le format du PointSetId
           404 Not Found : Se produit quand le PSM ne trouve pas le PointSetId demandé
           503 Service Unavailble : Se produit quand il n'est pas possible de 
           communiquer avec le PSM
 
     """
-    raise NotImplementedError("psm_client_fetch_data not implementend yet")
+    try:
+        status, body = PSM_POOL.request("GET", f"/pointset/{pointSetId}")
+    except (OSError, PSMHTTPException, PoolTimeout) as error:
+        raise ServiceUnavailable(PSM_UNAVAILABLE) from error
+    return _point_set_from_response(status, body)
+
+async def psm_client_fetch_data_async(pointSetId: str) -> bytes:
+    """Variante asyncio de psm_client_fetch_data.
+
+    La requête passe par ASYNC_PSM_CLIENT (connexions persistantes, sans
+    thread bloqué pendant l'attente du PSM). À attendre depuis la boucle
+    ASYNC_LOOP.
+
+    Raises :
+          Identiques à psm_client_fetch_data
+    """
+    try:
+        status, body = await ASYNC_PSM_CLIENT.request(
+            "GET", f"/pointset/{pointSetId}"
+        )
+    except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError,
+            ValueError) as error:
+        raise ServiceUnavailable(PSM_UNAVAILABLE) from error
+    return _point_set_from_response(status, body)
+
+def _point_set_from_response(status: int, body: bytes) -> bytes:
+    """Retourne le PointSet d'une réponse du PSM, ou lève l'erreur HTTP associée."""
+    if status == 200:
+        return body
+    if status == 400:
+        raise BadRequest(PSM_BAD_REQUEST)
+    if status == 404:
+        raise NotFound(PSM_NOT_FOUND)
+    raise ServiceUnavailable(PSM_UNAVAILABLE)
+
+def check_connection_status() -> bool:
+    """Vérifie que le PSM est joignable et préchauffe le pool de connexions.
+
+    Ouvre jusqu'à PSM_POOL_WARM_SIZE connexions persistantes, pour que les
+    premières requêtes ne paient pas l'établissement de la connexion TCP.
+
+    Returns :
+        - True si au moins une connexion au PSM a pu être ouverte
+    """
+    return PSM_POOL.warm(PSM_POOL_WARM_SIZE) > 0
 
 #-------------Fonctions couche Serveur------------#
+def _fetch_point_set(pointSetId: str) -> bytes:
+    """Vérifie le PointSetId puis récupère le PointSet binaire auprès du PSM.
+
+    Raises :
+           400 Bad Request : PointSetId n'a pas le bon format (UUID), ou le PSM
+           le refuse
+           404 Not Found : PSM ne trouve pas le PointSetId demandé
+           503 Service Unavailble : Il n'est pas possible de communiquer avec le PSM
+    """
+#   -----VERIFICATION--------
+    try:
+        with STAGE_METRICS.time("uuid_check"):
+            check_valid_uuid(pointSetId)
+    except ValueError as error:
+        raise BadRequest(str(error)) from error
+
+#   -----COMMUNICATION
+    try:
+        with STAGE_METRICS.time("psm_fetch"):
+            return psm_client_fetch_data(pointSetId)
+    except BadRequest as error:
+        raise BadRequest(PSM_BAD_REQUEST) from error
+    except NotFound as error:
+        raise NotFound(PSM_NOT_FOUND) from error
+    except ServiceUnavailable as error:
+        raise ServiceUnavailable(PSM_UNAVAILABLE) from error
+
+def _fetch_point_set_digest(pointSetId: str) -> tuple[bytes, bytes]:
+    """Réalise _fetch_point_set et retient l'empreinte du PointSet reçu.
+
+    Returns :
+         (PointSet binaire, empreinte du PointSet), l'empreinte étant
+         enregistrée dans POINT_SET_DIGESTS pour ce PointSetId
+    """
+    pointSet = _fetch_point_set(pointSetId)
+    digest = point_set_digest(pointSet)
+    POINT_SET_DIGESTS.put(pointSetId.encode(), digest)
+    return pointSet, digest
+
+def point_set_etag(digest: bytes) -> str:
+    """Retourne l'ETag (fort, sans guillemets) des Triangles d'un PointSet.
+
+    L'ETag porte CACHE_VERSION : une réponse gardée par un client n'est plus
+    validée après un changement de format, de moteur ou d'options.
+    """
+    return f"{CACHE_VERSION}-{digest.hex()}"
+
 def getTriangulation(pointSetId: str) -> bytes :
     """Reçoit un PointSetId et retourne sa triangulation au format binaire.
 
@@ -123,6 +602,10 @@ def getTriangulation(pointSetId: str) -> bytes :
     - le traitement logique (triangulation),
     - les vérifications post-traitement,
 
+    Les requêtes concurrentes pour un même pointSetId sont regroupées
+    (IN_FLIGHT) : la première fait le travail, les autres attendent et
+    reçoivent les mêmes octets, ou la même erreur.
+
     Args :
          pointSetId : identifiant du PS, string au format UUID
 
@@ -135,22 +618,441 @@ def getTriangulation(pointSetId: str) -> bytes :
            500 Internal Server Error : L'algorithme de triangulation échoue
            503 Service Unavailble : Il n'est pas possible de communiquer avec le PSM
     """
+    return IN_FLIGHT.do(pointSetId, lambda: _get_triangulation(pointSetId))
+
+def _get_triangulation(pointSetId: str) -> bytes:
+    """Travail de getTriangulation, fait une fois par groupe de requêtes."""
 #   WORKFLOW
 
-#   -----VERIFICATION--------
+#   -----VERIFICATION + COMMUNICATION--------
 #    - Verification du format de l'entrée <- check_valid_uuid
-
-#   -----COMMUNICATION
 #    - fetch uuid to retrieve ps as binary <- psm_client_fetch_data
+    pointSet = _fetch_point_set(pointSetId)
 
 #   -----BLOCK COMPUTE--------------
 #    - compute triangulation <- triangulation_pipeline
+    try:
+        triangles = triangulation_pipeline(pointSet)
+    except HTTPException:
+        raise
+    except Exception as error:
+        raise InternalServerError(str(error)) from error
 
 #   -----BLOCK COMMUNICATION--------
 #    - return triangulation ps as binary
-    raise NotImplementedError("Not Yet")
+    return triangles
+
+def getTriangulation_stream(
+        pointSetId: str, etags: ETags | None = None
+        ) -> tuple[str, int, Iterator[bytes] | BinaryIO | None]:
+    """Variante de getTriangulation dont la réponse est envoyée par morceaux.
+
+    Les vérifications, la récupération auprès du PSM et le calcul sont faits
+    avant de retourner : toute erreur est donc levée avant le premier octet
+    envoyé. Seul l'encodage est différé (voir triangulation_pipeline_stream).
+    Comme pour getTriangulation, les requêtes concurrentes pour un même
+    pointSetId sont regroupées (IN_FLIGHT_STREAM) : elles partagent le
+    résultat du calcul, chacune l'envoyant avec son propre itérateur.
+
+    Requête conditionnelle : si etags (If-None-Match) contient l'ETag des
+    Triangles, rien n'est calculé ni encodé. L'ETag est l'empreinte du
+    PointSet, prise dans POINT_SET_DIGESTS si le PointSetId y est déjà :
+    le PSM n'est alors pas interrogé.
+
+    Args :
+         pointSetId : identifiant du PS, string au format UUID
+         etags : ETags de l'en-tête If-None-Match de la requête, s'il y en a
+
+    Returns :
+         (ETag, taille totale en octets, corps) ; le corps est un itérateur
+         sur les morceaux de Triangles, ou le fichier (ouvert) qui les
+         contient s'ils ont été écrits dans SPILL_CACHE, ou None si etags
+         contient l'ETag (304 Not Modified)
+
+    Errors :
+           Identiques à getTriangulation
+    """
+    fetched = None
+    if etags:
+        # Un PointSetId connu a déjà passé la vérification du format.
+        digest = POINT_SET_DIGESTS.get(pointSetId.encode())
+        if digest is None:
+            fetched = _fetch_point_set_digest(pointSetId)
+            digest = fetched[1]
+        if etags.contains_weak(point_set_etag(digest)):
+            return point_set_etag(digest), 0, None
+
+    for _ in range(2):
+        digest, size, payload = IN_FLIGHT_STREAM.do(
+            pointSetId, lambda: _get_triangulation_payload(pointSetId, fetched)
+        )
+        if not isinstance(payload, str):
+            return point_set_etag(digest), size, _iter_payload(payload, digest)
+        # Fichier de SPILL_CACHE : chaque réponse a le sien, ouvert avant
+        # de retourner. S'il a été évincé entre-temps, il est réécrit.
+        try:
+            return point_set_etag(digest), size, open(payload, "rb")
+        except FileNotFoundError:
+            continue
+    raise InternalServerError(SPILL_FILE_EVICTED)
+
+def _get_triangulation_payload(
+        pointSetId: str, fetched: tuple[bytes, bytes] | None = None
+        ) -> tuple[bytes, int, bytes | Triangulation_Result | str]:
+    """Travail de getTriangulation_stream, fait une fois par groupe de requêtes.
+
+    Args :
+         pointSetId : identifiant du PS, string au format UUID
+         fetched : (PointSet, empreinte) s'il a déjà été récupéré
+
+    Returns :
+         (empreinte du PointSet, taille totale en octets, résultat du pipeline)
+    """
+    pointSet, digest = fetched or _fetch_point_set_digest(pointSetId)
+    try:
+        return (digest, *triangulation_pipeline_payload(pointSet, digest))
+    except HTTPException:
+        raise
+    except Exception as error:
+        raise InternalServerError(str(error)) from error
+
+def getTriangulations(pointSetIds: object) -> bytes:
+    """Reçoit une liste de PointSetId et retourne toutes leurs triangulations.
+
+    Les PointSet des PointSetId distincts sont tous récupérés en même temps
+    par ASYNC_PSM_CLIENT (asyncio.gather, dans ASYNC_LOOP), sans un thread
+    par récupération en attente, puis triangulés dans les threads de
+    BATCH_EXECUTOR (regroupés avec les requêtes concurrentes par IN_FLIGHT).
+    L'échec d'un PointSetId n'interrompt pas les autres : il est reporté
+    dans son enregistrement.
+
+    Args :
+         pointSetIds : liste JSON décodée de PointSetId (strings)
+
+    Returns :
+         - 4 bytes (unsigned long) : nombre d'enregistrements R, un par
+           PointSetId demandé, dans l'ordre de la liste
+         - puis R enregistrements, chacun :
+           - 4 bytes (unsigned long) : statut HTTP du PointSetId
+           - 4 bytes (unsigned long) : longueur L du contenu
+           - L bytes : Triangles binaires (statut 200), sinon erreur au
+             format du schéma Error, en JSON UTF-8
+
+    Errors :
+           400 Bad Request (INVALID_BATCH_REQUEST) : la requête n'est pas une
+           liste de strings, contient plus de BATCH_MAX_IDS PointSetId, ou
+           la réponse pourrait dépasser BATCH_MAX_BYTES octets (taille
+           majorée, avant tout calcul, d'après le nombre de points des
+           PointSet récupérés)
+    """
+    if (not isinstance(pointSetIds, list)
+            or not all(isinstance(pointSetId, str) for pointSetId in pointSetIds)):
+        raise InvalidBatchRequest(BATCH_NOT_A_LIST)
+    if len(pointSetIds) > BATCH_MAX_IDS:
+        raise InvalidBatchRequest(BATCH_TOO_LARGE)
+
+    unique = list(dict.fromkeys(pointSetIds))
+    pointSets = ASYNC_LOOP.run(_fetch_point_sets_async(unique))
+    bounds = dict(zip(unique, map(_batch_record_bound, pointSets), strict=True))
+    if 4 + sum(bounds[pointSetId] for pointSetId in pointSetIds) > BATCH_MAX_BYTES:
+        raise InvalidBatchRequest(BATCH_RESPONSE_TOO_LARGE)
+    records = dict(zip(
+        unique, BATCH_EXECUTOR.map(_batch_record, unique, pointSets), strict=True
+    ))
+    return b"".join([
+        struct.pack('I', len(pointSetIds)),
+        *(records[pointSetId] for pointSetId in pointSetIds),
+    ])
+
+async def _fetch_point_sets_async(
+        pointSetIds: list[str]
+        ) -> list[bytes | BaseException]:
+    """PointSet de chaque PointSetId, récupérés en même temps.
+
+    Returns :
+         Un PointSet binaire par PointSetId, dans l'ordre de pointSetIds, ou
+         l'erreur levée pour ce PointSetId (voir _fetch_point_set_async)
+    """
+    return await asyncio.gather(
+        *(_fetch_point_set_async(pointSetId) for pointSetId in pointSetIds),
+        return_exceptions=True,
+    )
+
+async def _fetch_point_set_async(pointSetId: str) -> bytes:
+    """Variante asyncio de _fetch_point_set (psm_client_fetch_data_async).
+
+    Raises :
+           Identiques à _fetch_point_set
+    """
+    try:
+        with STAGE_METRICS.time("uuid_check"):
+            check_valid_uuid(pointSetId)
+    except ValueError as error:
+        raise BadRequest(str(error)) from error
+
+    try:
+        with STAGE_METRICS.time("psm_fetch"):
+            return await psm_client_fetch_data_async(pointSetId)
+    except BadRequest as error:
+        raise BadRequest(PSM_BAD_REQUEST) from error
+    except NotFound as error:
+        raise NotFound(PSM_NOT_FOUND) from error
+    except ServiceUnavailable as error:
+        raise ServiceUnavailable(PSM_UNAVAILABLE) from error
+
+def _batch_record_bound(pointSet: bytes | BaseException) -> int:
+    """Majorant de la taille de l'enregistrement d'un PointSet récupéré.
+
+    Une triangulation de N points a au plus 2N - 5 triangles. Une erreur, ou
+    un PointSet sans en-tête, donne un court enregistrement d'erreur : seul
+    son en-tête est compté.
+    """
+    if isinstance(pointSet, BaseException) or len(pointSet) < 4:
+        return 8
+    (n,) = struct.unpack_from('I', pointSet, 0)
+    return 8 + triangles_binary_size(n, max(2 * n - 5, 0))
+
+def _batch_record(pointSetId: str, pointSet: bytes | BaseException) -> bytes:
+    """Enregistrement de getTriangulations pour un PointSetId et son PointSet."""
+    try:
+        if isinstance(pointSet, BaseException):
+            raise pointSet
+        status, payload = 200, IN_FLIGHT.do(
+            pointSetId, lambda: triangulation_pipeline(pointSet)
+        )
+    except HTTPException as error:
+        status, payload = error.code or 500, _error_json(error)
+    except Exception as error:
+        status, payload = 500, _error_json(InternalServerError(str(error)))
+    return struct.pack('II', status, len(payload)) + payload
+
+def insertTriangulationPoints(pointSetId: str, points: bytes) -> bytes:
+    """Ajoute des points à la triangulation d'un PointSet et la retourne.
+
+    Les points sont insérés un à un dans le maillage de la triangulation de
+    base (IncrementalMesh), avec bascules locales : le calcul dépend du
+    nombre de points ajoutés, pas de la taille du PointSet. Le maillage est
+    reconstruit une fois depuis les Triangles de base (pris dans les caches,
+    sinon calculés par triangulation_pipeline) puis gardé dans MESH_CACHE ;
+    si le PointSetId a déjà été vu (POINT_SET_DIGESTS), le PSM n'est pas
+    interrogé. Seule la recopie des tableaux et des octets reste
+    proportionnelle à la taille du résultat.
+
+    Le résultat est celui de triangulation_pipeline sur le PointSet « union »
+    (points de base suivis des points ajoutés), et il est mis en cache comme
+    tel. Si la triangulation de base n'a aucun triangle (PointSet dégénéré),
+    l'union est triangulée entièrement.
+
+    Args :
+         pointSetId : identifiant du PS de base, string au format UUID
+         points : PointSet binaire des points à ajouter
+
+    Returns :
+         triangles : Triangles binaires de l'union ; le point ajouté i a
+         l'indice N + i (N points de base)
+
+    Errors :
+           400 Bad Request : PointSetId n'a pas le bon format (UUID)
+           400 Bad Request (INVALID_POINTS) : les points à ajouter ne forment
+           pas un PointSet valide (ou, avec DUPLICATES_REJECT, l'union
+           contient des points en double)
+           404, 500, 503 : Identiques à getTriangulation
+    """
+    try:
+        with STAGE_METRICS.time("uuid_check"):
+            check_valid_uuid(pointSetId)
+    except ValueError as error:
+        raise BadRequest(str(error)) from error
+    try:
+        with STAGE_METRICS.time("validate_decode"):
+            delta, _ = validate_and_decode_point_set(points)
+    except ValueError as error:
+        raise InvalidPoints(str(error)) from error
+
+    base, mesh = _base_mesh(pointSetId)
+    (n,) = struct.unpack_from('I', base, 0)
+    union = b"".join([
+        struct.pack('I', n + len(delta)), memoryview(base)[4:], memoryview(points)[4:]
+    ])
+    if DUPLICATE_POINTS == DUPLICATES_REJECT:
+        try:
+            with STAGE_METRICS.time("deduplicate"):
+                deduplicate_point_set(union)
+        except ValueError as error:
+            raise InvalidPoints(str(error)) from error
+    if mesh is None:
+        return triangulation_pipeline(union)
+
+    key = point_set_digest(union)
+    cached = get_cached_triangles(key)
+    if cached is not None:
+        return cached
+    with STAGE_METRICS.time("compute"):
+        indices = mesh.insert_points(delta.xs, delta.ys)
+    with STAGE_METRICS.time("encode"):
+        triangles = b"".join([
+            union, struct.pack('I', len(indices) // 3), memoryview(indices).cast('B')
+        ])
+    if VALIDATE_TRIANGLES:
+        try:
+            with STAGE_METRICS.time("validate_triangles"):
+                validate_triangles(triangles)
+        except ValueError as error:
+            raise InternalServerError(str(error)) from error
+    put_cached_triangles(key, triangles)
+    return triangles
+
+def _base_mesh(pointSetId: str) -> tuple[bytes, IncrementalMesh | None]:
+    """PointSet de base et maillage de sa triangulation (None s'il n'en a pas).
+
+    Le PointSet est la première partie de ses Triangles (mêmes octets) :
+    s'ils sont en cache, il n'est pas récupéré auprès du PSM. Une base déjà
+    reconnue sans triangulation (NO_MESH) n'est pas recalculée.
+    """
+    digest = POINT_SET_DIGESTS.get(pointSetId.encode())
+    if digest is not None:
+        with _cached_triangles(digest) as triangles:
+            if triangles is not None:
+                return _split_triangles(digest, triangles)
+    pointSet, digest = _fetch_point_set_digest(pointSetId)
+    if MESH_CACHE.get(digest) is NO_MESH:
+        return pointSet, None
+    try:
+        triangles = triangulation_pipeline(pointSet)
+    except InternalServerError:
+        # Pas de triangulation de base : l'union sera triangulée entièrement.
+        MESH_CACHE.put(digest, NO_MESH)
+        return pointSet, None
+    return _split_triangles(digest, triangles)
+
+def _split_triangles(
+        digest: bytes, triangles: bytes | mmap.mmap
+        ) -> tuple[bytes, IncrementalMesh | None]:
+    """PointSet de base (copié) et maillage des Triangles binaires, via MESH_CACHE."""
+    (n,) = struct.unpack_from('I', triangles, 0)
+    base = triangles[:4 + 8 * n]
+    mesh = MESH_CACHE.get(digest)
+    if mesh is None:
+        mesh = IN_FLIGHT_MESH.do(digest, lambda: _build_mesh(digest, triangles))
+    return base, None if mesh is NO_MESH else mesh
+
+def _build_mesh(
+        digest: bytes, triangles: bytes | mmap.mmap
+        ) -> IncrementalMesh | _NoMesh:
+    """Reconstruit le maillage des Triangles binaires et le met dans MESH_CACHE."""
+    coords = array('f')
+    indices = array('I')
+    # Aucune vue ne survit au bloc : un mmap peut être fermé ensuite.
+    with memoryview(triangles) as buffer:
+        (n,) = struct.unpack_from('I', buffer, 0)
+        coords.frombytes(buffer[4:4 + 8 * n])
+        indices.frombytes(buffer[8 + 8 * n:])
+    try:
+        with STAGE_METRICS.time("compute"):
+            mesh = IncrementalMesh(coords[0::2], coords[1::2], indices)
+    except ValueError:
+        # Aucun triangle (PointSet dégénéré, DEGENERATE_EMPTY).
+        mesh = NO_MESH
+    MESH_CACHE.put(digest, mesh)
+    return mesh
+
+@contextmanager
+def _cached_triangles(key: bytes) -> Iterator[bytes | mmap.mmap | None]:
+    """Triangles binaires en cache pour key, ou None.
+
+    Un fichier de SPILL_CACHE n'est pas lu en mémoire : il est projeté
+    (mmap) le temps du bloc, et seules les parties utilisées sont lues.
+    """
+    cached = get_cached_triangles(key, spill=True)
+    if cached is None or isinstance(cached, bytes):
+        yield cached
+        return
+    path, _ = cached
+    with ExitStack() as stack:
+        try:
+            file = stack.enter_context(open(path, "rb"))
+        except FileNotFoundError:
+            # Évincé entre-temps.
+            yield None
+            return
+        yield stack.enter_context(
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        )
 
 # ------------Fonction Mathematiques--------------------------#
+def triangles_binary_size(n_points: int, n_triangles: int) -> int:
+    """Taille en octets de la représentation binaire Triangles.
+
+    Args :
+         n_points : Nombre de sommets (N)
+         n_triangles : Nombre de triangles (T)
+
+    Returns :
+            4 + 8 * N + 4 + 12 * T
+    """
+    return 8 + 8 * n_points + 12 * n_triangles
+
+def _as_arrays(
+        triangulation_Result: Triangulation_Result
+        ) -> tuple[PointSet_Array, Triangles_Array]:
+    """Retourne les points et triangles du résultat sous forme compacte."""
+    points = triangulation_Result['points']
+    triangles = triangulation_Result['triangles']
+    if not isinstance(points, PointSet_Array):
+        points = PointSet_Array.from_geom(points)
+    if not isinstance(triangles, Triangles_Array):
+        triangles = Triangles_Array.from_geom(triangles)
+    return points, triangles
+
+def encode_triangulation_result_into(
+        triangulation_Result: Triangulation_Result,
+        buffer: bytearray | memoryview,
+        offset: int = 0
+        ) -> int:
+    """Encode le résultat au format Triangles dans un tampon fourni par l'appelant.
+
+    Permet à la couche HTTP de réutiliser un même tampon d'une requête à
+    l'autre. Les sections sont écrites en bloc : en-têtes par
+    `struct.pack_into`, coordonnées par affectation de vues `memoryview`,
+    indices depuis le tampon de l'`array('I')`.
+
+    Args :
+         triangulation_Result : Points et triangles à encoder
+         buffer : Tampon accessible en écriture, d'au moins
+           offset + triangles_binary_size(N, T) octets
+         offset : Position d'écriture dans le tampon
+
+    Returns :
+            Nombre d'octets écrits
+
+    Raises :
+        ValueError : Le tampon est trop petit
+    """
+    points, triangles = _as_arrays(triangulation_Result)
+    n = len(points)
+    t = len(triangles)
+    size = triangles_binary_size(n, t)
+
+    view = memoryview(buffer).cast('B')[offset:offset + size]
+    if view.nbytes < size:
+        raise ValueError(
+            f"Buffer too small : {size} bytes needed from offset {offset}"
+        )
+
+    # Partie 1 : sommets, coordonnées entrelacées (x0, y0, x1, y1, ...).
+    struct.pack_into('I', view, 0, n)
+    xs, ys = points.xs, points.ys
+    if points.typecode != 'f':
+        xs, ys = array('f', xs), array('f', ys)
+    coords = view[4:4 + 8 * n].cast('f')
+    coords[0::2] = xs
+    coords[1::2] = ys
+
+    # Partie 2 : triangles.
+    struct.pack_into('I', view, 4 + 8 * n, t)
+    view[8 + 8 * n:] = memoryview(triangles.indices).cast('B')
+    return size
+
 def encode_triangulation_result_to_binary(
         triangulation_Result: Triangulation_Result
         ) -> bytes:
@@ -158,6 +1060,10 @@ def encode_triangulation_result_to_binary(
 
     Cette fonction est l'étape finale du pipeline, assurant que le résultat 
     du calcul respecte le schéma 'Triangles' de l'API.
+    Les points et triangles peuvent être fournis sous forme compacte
+    (PointSet_Array, Triangles_Array) ou sous forme de listes de dictionnaires.
+    Le résultat est écrit dans un unique tampon dimensionné à partir de N et T
+    (voir encode_triangulation_result_into).
 
     Args :
          triangles_geom : Représentation géométrique des triangles
@@ -166,45 +1072,269 @@ def encode_triangulation_result_to_binary(
     Returns :
             triangles : Réprésentation binaire des triangles (type: Triangles) 
     """
-    raise NotImplementedError("Not Yet")
+    points, triangles = _as_arrays(triangulation_Result)
+    buffer = bytearray(triangles_binary_size(len(points), len(triangles)))
+    encode_triangulation_result_into(
+        {'points': points, 'triangles': triangles}, buffer
+    )
+    return bytes(buffer)
     
-def decode_binary_point_set_to_geometric(pointSet: bytes) -> PointSet_Geom:
+def iter_triangulation_result_chunks(
+        triangulation_Result: Triangulation_Result,
+        chunk_size: int = STREAM_CHUNK_SIZE
+        ) -> Iterator[bytes]:
+    """Encode le résultat au format Triangles, morceau par morceau.
+
+    Produit dans l'ordre : le nombre de sommets, les sommets, le nombre de
+    triangles, puis les indices des triangles. Chaque morceau de sommets ou
+    d'indices fait au plus chunk_size octets (arrondi à un enregistrement
+    entier) : la mémoire utilisée ne dépend pas de la taille du résultat.
+    La concaténation des morceaux est égale à
+    encode_triangulation_result_to_binary(triangulation_Result).
+
+    Args :
+         triangulation_Result : Points et triangles à encoder
+         chunk_size : Taille maximale (octets) d'un morceau
+
+    Returns :
+            Itérateur sur les morceaux (bytes) de la représentation Triangles
+    """
+    points, triangles = _as_arrays(triangulation_Result)
+    n = len(points)
+    xs, ys = points.xs, points.ys
+    convert = points.typecode != 'f'
+
+#   -----Partie 1 : sommets--------
+    yield struct.pack('I', n)
+    step = max(1, chunk_size // 8)
+    for start in range(0, n, step):
+        stop = min(start + step, n)
+        chunk = bytearray(8 * (stop - start))
+        coords = memoryview(chunk).cast('f')
+        if convert:
+            coords[0::2] = array('f', xs[start:stop])
+            coords[1::2] = array('f', ys[start:stop])
+        else:
+            coords[0::2] = xs[start:stop]
+            coords[1::2] = ys[start:stop]
+        yield bytes(chunk)
+
+#   -----Partie 2 : triangles--------
+    yield struct.pack('I', len(triangles))
+    indices = memoryview(triangles.indices).cast('B')
+    step = max(12, chunk_size // 12 * 12)
+    for start in range(0, indices.nbytes, step):
+        yield indices[start:start + step].tobytes()
+
+def decode_binary_point_set_to_geometric(
+        pointSet: bytes, copy: bool = False
+        ) -> PointSet_Array:
     """Décode le PointSet binaire en représentation géométrique pour le trianguler.
     
-    Cette fonction convertit le flux binaire brut en une liste de points
-    (coordonnées X, Y).
+    Après validation de l'en-tête (4 octets), les coordonnées sont exposées
+    sans copie : `memoryview(pointSet).cast('f')` sur le tampon reçu du PSM,
+    dont les abscisses et ordonnées sont deux vues à pas de 2. Aucun objet
+    n'est créé par point et les données ne sont pas dupliquées.
 
     Args:
         pointSet (bytes) : Le flux d'octets du PointSet récupéré du PSM.
+        copy : Si vrai, les coordonnées sont copiées dans des `array('f')`
+          indépendants du tampon (utile si celui-ci doit être réutilisé).
         
     Returns:
-        PointSet_Geom : La structure utilisable par le calcul
-        (ex: liste de tuples (x, y)).
+        PointSet_Array : La structure utilisable par le calcul, qui se
+        comporte aussi comme un PointSet_Geom (liste de points {'x', 'y'}).
+
+    Raises:
+        ValueError : La longueur du flux ne correspond pas au nombre de
+        points annoncé dans l'en-tête.
     
     """
-    raise NotImplementedError("Not Yet")
+    buffer = memoryview(pointSet)
+    if buffer.nbytes < 4:
+        raise ValueError(POINT_SET_MISSING_HEADER)
+    (n,) = struct.unpack_from('I', buffer, 0)
+    if buffer.nbytes != 4 + 8 * n:
+        raise ValueError(POINT_SET_LENGTH_MISMATCH)
+
+    xy = buffer[4:].cast('f')
+    if copy:
+        xy = array('f', xy.tobytes())
+    return PointSet_Array(xy[0::2], xy[1::2])
+
+def validate_and_decode_point_set(
+        pointSet: bytes
+        ) -> tuple[PointSet_Array, Bounds | None]:
+    """Vérifie et décode le PointSet binaire, en une seule étape.
 
-def triangulation_compute(pointSet_geom: PointSet_Geom)-> Triangulation_Result:
+    Remplace validate_point_set suivie de decode_binary_point_set_to_geometric,
+    qui parcourent chacune le tampon : l'en-tête est lu une fois, la longueur
+    vérifiée en O(1), puis les coordonnées sont parcourues en C, sans objet
+    par point :
+    - NaN : une vue `memoryview` n'est différente d'elle-même que si l'une de
+      ses valeurs est NaN (NaN != NaN), test plus rapide qu'une somme ;
+    - infinis et boîte englobante : min et max des abscisses et ordonnées
+      (une valeur infinie est forcément une borne).
+    Comme decode_binary_point_set_to_geometric, les coordonnées sont deux vues
+    à pas de 2 sur le tampon reçu, sans copie. La boîte englobante sert
+    ensuite à l'ordre spatial (voir triangulation_compute).
+
+    Args :
+        pointSet : Le flux d'octets du PointSet récupéré du PSM.
+
+    Returns :
+        (points, boîte englobante (min_x, min_y, max_x, max_y)), la boîte
+        valant None pour un PointSet vide
+
+    Raises :
+        ValueError : Mêmes cas que validate_point_set. Traduite en 500
+        Internal Server Error par la couche logique.
+    """
+    buffer = memoryview(pointSet)
+    if buffer.nbytes < 4:
+        raise ValueError(POINT_SET_MISSING_HEADER)
+    (n,) = struct.unpack_from('I', buffer, 0)
+    if n > MAX_POINTS:
+        raise ValueError(POINT_SET_TOO_LARGE)
+    if buffer.nbytes != 4 + 8 * n:
+        raise ValueError(POINT_SET_LENGTH_MISMATCH)
+
+    xy = buffer[4:].cast('f')
+    if xy != xy:
+        raise ValueError(POINT_SET_CORRUPTED)
+    points = PointSet_Array(xy[0::2], xy[1::2])
+    if n == 0:
+        return points, None
+    bounds = (min(points.xs), min(points.ys), max(points.xs), max(points.ys))
+    if not all(map(isfinite, bounds)):
+        raise ValueError(POINT_SET_CORRUPTED)
+    return points, bounds
+
+def triangulation_compute(
+        pointSet_geom: PointSet_Geom | PointSet_Array,
+        bounds: Bounds | None = None
+        )-> Triangulation_Result:
     """Réalise l'algorithme de triangulation pour un ensemble de points en entrée.
 
+    La triangulation de Delaunay est calculée par le moteur TRIANGULATION_ENGINE
+    (module `engines`) : par défaut, insertion incrémentale dans l'ordre
+    spatial SPATIAL_ORDER (BRIO), sinon diviser-pour-régner de Guibas-Stolfi.
+    Si COMPUTE_POOL est configuré (COMPUTE_WORKERS > 0), le calcul est
+    confié à un processus du pool : les coordonnées y sont envoyées sous
+    forme d'octets bruts et le thread appelant libère le GIL en attendant.
+
     Args:
         pointSet_geom : L'ensemble des points dont on souhaite réaliser 
-          la triangulation, au format géométrique (PointSet_Geom).
+          la triangulation, au format géométrique (PointSet_Geom ou
+          PointSet_Array).
+        bounds : Boîte englobante des points, si elle est déjà connue
+          (validate_and_decode_point_set) : l'ordre spatial ne la recalcule
+          pas.
 
     Returns:
         triangles_geom : L'ensemble des triangles produits par la triangulation,
-          au format géométrique (Triangles_Geom).
+          au format géométrique (Triangles_Array, qui se comporte comme un
+          Triangles_Geom).
 
     Raises:
-        - 500 Internal Server Error : L'algorithme de triangulation échoue
+        - ValueError : L'algorithme de triangulation échoue (entrée vide,
+          moins de 3 points, points alignés). Traduite en 500 Internal Server
+          Error par la couche logique.
     
     """
-    raise NotImplementedError("Not Yet")
+    if isinstance(pointSet_geom, PointSet_Array):
+        xs, ys = pointSet_geom.xs, pointSet_geom.ys
+        typecode = pointSet_geom.typecode
+    else:
+        xs = [point['x'] for point in pointSet_geom]
+        ys = [point['y'] for point in pointSet_geom]
+        typecode = 'd'
+
+    if COMPUTE_POOL is None:
+        indices = triangulate(xs, ys, TRIANGULATION_ENGINE, SPATIAL_ORDER, bounds)
+    else:
+        if isinstance(xs, list):
+            xs, ys = array('d', xs), array('d', ys)
+        indices = COMPUTE_POOL.triangulate(
+            xs, ys, typecode, TRIANGULATION_ENGINE, SPATIAL_ORDER, bounds
+        )
+    triangles = Triangles_Array(indices)
+    return {'points': pointSet_geom, 'triangles': triangles}
 
 
 
 
 #-------------Fonctions couche Logique------------#
+def _triangulate_point_set(pointSet: bytes) -> Triangulation_Result:
+    """Étapes communes aux pipelines : vérification, prétraitement et calcul.
+
+    Si le PointSet contient des points en double (DUPLICATES_COLLAPSE), le
+    calcul porte sur les points distincts ; les indices des triangles sont
+    ensuite traduits par la table keep, et le résultat garde les N sommets
+    d'origine. Un PointSet dégénéré (point_set_degeneracy) est écarté avant
+    le calcul, selon DEGENERATE_POINT_SETS.
+
+    Raises :
+        ValueError : Le PointSet est invalide ou la triangulation échoue
+    """
+#   -----Verification + Pretraitement--------
+    with STAGE_METRICS.time("validate_decode"):
+        pointSet_geom, bounds = validate_and_decode_point_set(pointSet)
+    with STAGE_METRICS.time("deduplicate"):
+        keep = deduplicate_point_set(pointSet)
+        if keep is not None:
+            unique_points = compact_point_set(pointSet, keep)
+
+#   -----Compute--------
+    points = pointSet_geom if keep is None else unique_points
+    if not isinstance(points, PointSet_Array):
+        points = PointSet_Array.from_geom(points)
+    with STAGE_METRICS.time("degeneracy_check"):
+        reason = point_set_degeneracy(points.xs, points.ys)
+    if reason is not None:
+        if DEGENERATE_POINT_SETS != DEGENERATE_EMPTY:
+            raise ValueError(reason)
+        return {'points': pointSet_geom, 'triangles': Triangles_Array(array('I'))}
+    with STAGE_METRICS.time("compute"):
+        if keep is None:
+            return triangulation_compute(pointSet_geom, bounds)
+        _, triangles = _as_arrays(triangulation_compute(points, bounds))
+        return {'points': pointSet_geom, 'triangles': remap_triangles(triangles, keep)}
+
+def get_cached_triangles(
+        key: bytes, spill: bool = False
+        ) -> bytes | tuple[str, int] | None:
+    """Retourne les Triangles en cache pour l'empreinte key, ou None.
+
+    RESULT_CACHE est consulté en premier ; un résultat trouvé dans
+    DISK_CACHE y est remonté. Avec spill, un résultat gardé dans
+    SPILL_CACHE, ou de plus de STREAM_MIN_BYTES octets dans DISK_CACHE,
+    n'est pas lu : (chemin du fichier, taille) est retourné, pour un envoi
+    direct depuis le fichier.
+    """
+    cached = RESULT_CACHE.get(key)
+    if cached is not None:
+        return cached
+    if spill and SPILL_CACHE is not None:
+        located = SPILL_CACHE.locate(key)
+        if located is not None or SPILL_CACHE is DISK_CACHE:
+            return located
+    if spill and DISK_CACHE is not None:
+        located = DISK_CACHE.locate(key)
+        if located is None or located[1] > STREAM_MIN_BYTES:
+            return located
+    if DISK_CACHE is not None:
+        cached = DISK_CACHE.get(key)
+        if cached is not None:
+            RESULT_CACHE.put(key, cached)
+    return cached
+
+def put_cached_triangles(key: bytes, triangles: bytes) -> None:
+    """Met les Triangles de l'empreinte key en cache, en mémoire et sur disque."""
+    RESULT_CACHE.put(key, triangles)
+    if DISK_CACHE is not None:
+        DISK_CACHE.put(key, triangles)
+
 def triangulation_pipeline(pointSet: bytes) -> bytes :
     """Réalise la triangulation d'un ensemble de points.
 
@@ -216,6 +1346,10 @@ def triangulation_pipeline(pointSet: bytes) -> bytes :
             triangles : L'ensemble des triangles produits par la triangulation, 
             au format binaire (Triangles)
 
+    Les Triangles encodés sont mis en cache (RESULT_CACHE, puis DISK_CACHE
+    s'il est configuré), indexés par l'empreinte du PointSet : une requête
+    répétée ne refait aucun calcul.
+
     Raises :
         ----- 500 Internal Server Error ----------------------
         Se produit quand l'algorithme de triangulation échoue, pour plusieurs raisons:
@@ -223,27 +1357,258 @@ def triangulation_pipeline(pointSet: bytes) -> bytes :
         - Le pointSet présente une incohérence de données
         - etc...
     """
-#   WORKFLOW prévu
+#   -----Cache--------
+    key = point_set_digest(pointSet)
+    cached = get_cached_triangles(key)
+    if cached is not None:
+        return cached
 
-#   -----Verification--------
-#    - Check PointSet integrity  <- validate_point_set
+    try:
+        triangulation_result = _triangulate_point_set(pointSet)
 
-#   -----Pretraitement--------
-#    - Convert to greometric <- decode_binary_to_geometric
+#   -----Post - traitement--------------
+        with STAGE_METRICS.time("encode"):
+            triangles = encode_triangulation_result_to_binary(triangulation_result)
+        if VALIDATE_TRIANGLES:
+            with STAGE_METRICS.time("validate_triangles"):
+                validate_triangles(triangles)
+    except ValueError as error:
+        raise InternalServerError(str(error)) from error
 
-#   -----Compute--------
-    #Algo the triangulation <- tringulation_compute
+#   -----RETURN--------
+    put_cached_triangles(key, triangles)
+    return triangles
+
+def triangulation_pipeline_stream(
+        pointSet: bytes
+        ) -> tuple[int, Iterator[bytes]]:
+    """Variante de triangulation_pipeline pour une réponse envoyée par morceaux.
+
+    La validation, le décodage et le calcul sont faits immédiatement (les
+    erreurs sont levées avant le premier octet envoyé). Si le résultat
+    encodé dépasse STREAM_MIN_BYTES, il n'est jamais construit en entier
+    avant l'envoi : l'itérateur retourné l'encode par morceaux de
+    STREAM_CHUNK_SIZE octets (cet encodage, entrelacé avec l'envoi, n'est
+    pas compté dans l'étape "encode" de STAGE_METRICS). Les morceaux envoyés
+    sont écrits dans le cache disque au fil de l'envoi, jamais gardés en
+    mémoire (voir _iter_payload). Sinon, le résultat passe par le chemin
+    habituel (encodage en un bloc et mise en cache).
+
+    Args :
+          pointSet : L'ensemble des points, au format binaire (PointSet)
+
+    Returns :
+            (taille totale en octets, itérateur sur les morceaux de Triangles)
+
+    Raises :
+        ----- 500 Internal Server Error ----------------------
+        Identiques à triangulation_pipeline
+    """
+    key = point_set_digest(pointSet)
+    size, payload = triangulation_pipeline_payload(pointSet, key)
+    return size, _iter_payload(payload, key)
+
+def triangulation_pipeline_payload(
+        pointSet: bytes, digest: bytes | None = None
+        ) -> tuple[int, bytes | Triangulation_Result | str]:
+    """Réalise triangulation_pipeline_stream, sans créer l'itérateur d'envoi.
+
+    Le résultat peut ainsi être partagé par plusieurs réponses, chacune
+    créant son itérateur (voir _iter_payload).
+
+    Si SPILL_CACHE est configuré, un résultat de plus de SPILL_MIN_BYTES
+    octets est encodé par morceaux dans un fichier de SPILL_CACHE, sans
+    jamais être entier en mémoire ; le chemin du fichier est retourné, et
+    un résultat déjà écrit n'est ni recalculé ni relu.
+
+    Args :
+          pointSet : L'ensemble des points, au format binaire (PointSet)
+          digest : empreinte du PointSet (point_set_digest), si elle est
+          déjà connue
+
+    Returns :
+            (taille totale en octets, Triangles binaire), ou, au-delà de
+            SPILL_MIN_BYTES, (taille totale en octets, chemin du fichier de
+            Triangles), ou, au-delà de STREAM_MIN_BYTES, (taille totale en
+            octets, résultat non encodé)
+
+    Raises :
+        ----- 500 Internal Server Error ----------------------
+        Identiques à triangulation_pipeline
+    """
+#   -----Cache--------
+    key = point_set_digest(pointSet) if digest is None else digest
+    cached = get_cached_triangles(key, spill=True)
+    if isinstance(cached, bytes):
+        return len(cached), cached
+    if cached is not None:
+        path, size = cached
+        return size, path
+
+    try:
+        triangulation_result = _triangulate_point_set(pointSet)
+        points, triangles_array = _as_arrays(triangulation_result)
+        size = triangles_binary_size(len(points), len(triangles_array))
 
 #   -----Post - traitement--------------
-#    - Convert to binary <- encode_geometric_to_binary
-#    [IMPLEMENTATION STOP (- Check triangles integrity  <- validate_triangles)]
+        if size > STREAM_MIN_BYTES or (SPILL_CACHE is not None
+                                       and size > SPILL_MIN_BYTES):
+            # Pas de Triangles binaire complet : mêmes vérifications, sur les
+            # tableaux (la longueur découle de N et T).
+            if VALIDATE_TRIANGLES:
+                with STAGE_METRICS.time("validate_triangles"):
+                    check_triangle_indices(triangles_array.indices, len(points))
+            if SPILL_CACHE is not None and size > SPILL_MIN_BYTES:
+                with STAGE_METRICS.time("encode"):
+                    path = SPILL_CACHE.put_chunks(
+                        key, iter_triangulation_result_chunks(triangulation_result)
+                    )
+                if path is not None:
+                    return size, path
+            return size, triangulation_result
+        with STAGE_METRICS.time("encode"):
+            triangles = encode_triangulation_result_to_binary(triangulation_result)
+        if VALIDATE_TRIANGLES:
+            with STAGE_METRICS.time("validate_triangles"):
+                validate_triangles(triangles)
+    except ValueError as error:
+        raise InternalServerError(str(error)) from error
 
 #   -----RETURN--------
-#    - return triangulation ps as binary
-    
-    raise NotImplementedError("Not Yet")
+    put_cached_triangles(key, triangles)
+    return size, triangles
+
+def _iter_payload(
+        payload: bytes | Triangulation_Result | str, key: bytes | None = None
+        ) -> Iterator[bytes]:
+    """Retourne un nouvel itérateur d'envoi sur un résultat de pipeline.
+
+    Un résultat non encodé l'est pendant l'envoi ; avec key (empreinte du
+    PointSet), chaque morceau est aussi écrit dans DISK_CACHE (à défaut
+    SPILL_CACHE), et l'entrée gardée si l'envoi va jusqu'au bout (voir
+    DiskCache.tee_chunks). Aucun morceau n'est gardé en mémoire : sans cache
+    disque, un tel résultat n'est pas mis en cache.
+    """
+    if isinstance(payload, bytes):
+        return iter((payload,))
+    if isinstance(payload, str):
+        return _iter_file(payload)
+    chunks = iter_triangulation_result_chunks(payload)
+    cache = DISK_CACHE if DISK_CACHE is not None else SPILL_CACHE
+    if key is None or cache is None:
+        return chunks
+    return cache.tee_chunks(key, chunks)
+
+def _iter_file(path: str) -> Iterator[bytes]:
+    """Lit un fichier de Triangles par morceaux de STREAM_CHUNK_SIZE octets."""
+    with open(path, "rb") as file:
+        yield from iter(lambda: file.read(STREAM_CHUNK_SIZE), b"")
 # --------------End Triangulation Pipeline Definition ---------------#
 
+
+#-------------Application Flask------------#
+triangulator_app = Flask(__name__)
+
+# Code d'erreur interne (schéma Error de l'API) associé à chaque statut HTTP.
+ERROR_CODES = {
+    400: "INVALID_POINT_SET_ID",
+    404: "POINT_SET_NOT_FOUND",
+    500: "TRIANGULATION_FAILED",
+    503: "POINT_SET_MANAGER_UNAVAILABLE",
+}
+
+def _error_code(error: HTTPException) -> str:
+    """Code d'erreur interne du schéma Error associé à une erreur HTTP.
+
+    Une erreur qui porte son propre code (attribut error_code, par exemple
+    InvalidBatchRequest) le garde ; sinon, le code dépend du statut HTTP.
+    """
+    code = getattr(error, "error_code", None)
+    if code is not None:
+        return code
+    return ERROR_CODES.get(error.code or 500, error.name.upper().replace(" ", "_"))
+
+def _error_json(error: HTTPException) -> bytes:
+    """Erreur HTTP au format du schéma Error, en JSON UTF-8."""
+    return json.dumps(
+        {"code": _error_code(error), "message": error.description}
+    ).encode("utf-8")
+
+@triangulator_app.errorhandler(HTTPException)
+def handle_http_error(error: HTTPException) -> tuple[Response, int]:
+    """Retourne toute erreur HTTP au format du schéma Error : {code, message}."""
+    status = error.code or 500
+    return jsonify(code=_error_code(error), message=error.description), status
+
+@triangulator_app.route("/triangulation/<pointSetId>", methods=["GET"])
+def triangulation_get(pointSetId: str) -> Response:
+    """Route GET /triangulation/{pointSetId} : retourne les Triangles binaires.
+
+    Les erreurs sont levées avant l'envoi ; la réponse 200 est ensuite
+    envoyée par morceaux (voir getTriangulation_stream), ou par send_file
+    si les Triangles ont été écrits dans un fichier. Elle porte un ETag
+    fort et peut être gardée indéfiniment par le client : une requête
+    If-None-Match correspondante reçoit 304 Not Modified.
+    """
+    etag, size, body = getTriangulation_stream(pointSetId, request.if_none_match)
+    if body is None:
+        response = Response(status=304)
+    elif isinstance(body, io.BufferedIOBase):
+        # Fichier de SPILL_CACHE : envoyé par le serveur WSGI, sans copie.
+        response = send_file(body, mimetype="application/octet-stream",
+                             conditional=False, etag=False)
+        response.content_length = size
+    else:
+        response = Response(
+            body,
+            mimetype="application/octet-stream",
+            headers={"Content-Length": str(size)},
+        )
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = TRIANGLES_CACHE_CONTROL
+    return response
+
+@triangulator_app.route("/triangulations", methods=["POST"])
+def triangulations_post() -> Response:
+    """Route POST /triangulations : triangulations d'une liste de PointSetId.
+
+    Le corps est une liste JSON de PointSetId ; la réponse regroupe un
+    enregistrement par PointSetId (voir getTriangulations).
+    """
+    triangles = getTriangulations(request.get_json(silent=True))
+    return Response(triangles, mimetype="application/octet-stream")
+
+@triangulator_app.route("/triangulation/<pointSetId>/points", methods=["POST"])
+def triangulation_points_post(pointSetId: str) -> Response:
+    """Route POST /triangulation/{pointSetId}/points : ajoute des points.
+
+    Le corps est un PointSet binaire des points à ajouter ; la réponse est
+    la triangulation, en Triangles binaires, des points du PointSet suivis
+    des points ajoutés (voir insertTriangulationPoints).
+    """
+    triangles = insertTriangulationPoints(pointSetId, request.get_data())
+    return Response(triangles, mimetype="application/octet-stream")
+
+@triangulator_app.route("/metrics", methods=["GET"])
+def metrics_get() -> Response:
+    """Route GET /metrics : métriques au format texte de Prometheus.
+
+    Latence par étape, et appels des prédicats géométriques avec leurs
+    recours au calcul exact (taux de réussite du filtre : 1 - exact / calls).
+    Les calculs faits dans le pool de calcul ne sont pas comptés.
+    """
+    predicates = PREDICATE_STATS.snapshot()
+    calls = {name: counts['calls'] for name, counts in predicates.items()}
+    exact = {name: counts['exact'] for name, counts in predicates.items()}
+    return Response(
+        STAGE_METRICS.render()
+        + render_counter(PREDICATE_CALLS_METRIC_NAME, PREDICATE_CALLS_METRIC_HELP,
+                         "predicate", calls)
+        + render_counter(PREDICATE_EXACT_METRIC_NAME, PREDICATE_EXACT_METRIC_HELP,
+                         "predicate", exact),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
 if __name__=="__main__":
     
     """
@@ -251,3 +1616,6 @@ if __name__=="__main__":
 
     Check connection to PSM with check_connection_status
     """
+    if not check_connection_status():
+        logger.warning("PSM unreachable at %s:%s", PSM_HOST, PSM_PORT)
+    triangulator_app.run(debug=True, port=5000)  # pragma: no cover
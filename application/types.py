@@ -1,4 +1,7 @@
 """------------Structure de données internes au Triangulateur-------------."""
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from sys import getsizeof
 from typing import TypeAlias
 
 # Point Set au format géométrique
@@ -25,4 +28,257 @@ Triangles_Geom: TypeAlias = list[Triangle_Indices]
 Cette structure permet de stocker plusieurs triangles. 
 """
 
-Triangulation_Result: TypeAlias = dict[str, PointSet_Geom | Triangles_Geom]
\ No newline at end of file
+
+# Conteneurs compacts (structure de tableaux)
+Coordinates: TypeAlias = array | memoryview
+"""
+Tableau de coordonnées : `array('f')` / `array('d')`, ou vue `memoryview`
+au format 'f' (éventuellement à pas de 2) sur un tampon PointSet binaire.
+"""
+
+Bounds: TypeAlias = tuple[float, float, float, float]
+"""
+Boîte englobante d'un ensemble de points : (min_x, min_y, max_x, max_y).
+"""
+
+
+class PointView(Mapping[str, float]):
+    """Vue {'x', 'y'} sur un point d'un PointSet_Array, sans copie."""
+
+    __slots__ = ('_points', '_index')
+
+    _KEYS = ('x', 'y')
+
+    def __init__(self, points: "PointSet_Array", index: int) -> None:
+        """Associe la vue au point d'indice index."""
+        self._points = points
+        self._index = index
+
+    def __getitem__(self, key: str) -> float:
+        """Retourne la coordonnée 'x' ou 'y' du point."""
+        if key == 'x':
+            return self._points.xs[self._index]
+        if key == 'y':
+            return self._points.ys[self._index]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Itère sur les clés 'x' puis 'y'."""
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        """Un point a toujours deux coordonnées."""
+        return 2
+
+    def __repr__(self) -> str:
+        """Représentation identique à celle d'un PointGeom."""
+        return repr(dict(self))
+
+
+class TriangleView(Mapping[str, int]):
+    """Vue {'v1', 'v2', 'v3'} sur un triangle d'un Triangles_Array, sans copie."""
+
+    __slots__ = ('_indices', '_offset')
+
+    _KEYS = ('v1', 'v2', 'v3')
+
+    def __init__(self, indices: array, offset: int) -> None:
+        """Associe la vue au triangle commençant à la position offset."""
+        self._indices = indices
+        self._offset = offset
+
+    def __getitem__(self, key: str) -> int:
+        """Retourne l'indice du sommet 'v1', 'v2' ou 'v3'."""
+        if key == 'v1':
+            return self._indices[self._offset]
+        if key == 'v2':
+            return self._indices[self._offset + 1]
+        if key == 'v3':
+            return self._indices[self._offset + 2]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Itère sur les clés 'v1', 'v2', 'v3'."""
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        """Un triangle a toujours trois sommets."""
+        return 3
+
+    def __repr__(self) -> str:
+        """Représentation identique à celle d'un Triangle_Indices."""
+        return repr(dict(self))
+
+
+class PointSet_Array:
+    """PointSet géométrique stocké en deux tableaux de coordonnées.
+
+    Les abscisses et ordonnées sont rangées dans deux `array` ('f' par
+    défaut, comme le format binaire PointSet, ou 'd'), soit 8 octets par point
+    au lieu de plus de 200 pour un dictionnaire. Elles peuvent aussi être des
+    `memoryview` sur le tampon binaire reçu, sans aucune copie.
+    Le conteneur se comporte comme une séquence de points {'x', 'y'}
+    (PointSet_Geom), les calculs accédant directement à `xs` et `ys`.
+    """
+
+    __slots__ = ('xs', 'ys')
+
+    def __init__(self, xs: Coordinates, ys: Coordinates) -> None:
+        """Construit le conteneur à partir de deux tableaux de même longueur."""
+        if len(xs) != len(ys):
+            raise ValueError("xs and ys must have the same length")
+        self.xs = xs
+        self.ys = ys
+
+    @classmethod
+    def from_geom(
+            cls, points: Sequence[Mapping[str, float]], typecode: str = 'f'
+            ) -> "PointSet_Array":
+        """Convertit un PointSet_Geom (liste de dictionnaires) en tableaux."""
+        return cls(array(typecode, [p['x'] for p in points]),
+                   array(typecode, [p['y'] for p in points]))
+
+    def to_geom(self) -> PointSet_Geom:
+        """Convertit en PointSet_Geom (liste de dictionnaires)."""
+        return [{'x': x, 'y': y} for x, y in zip(self.xs, self.ys, strict=True)]
+
+    @property
+    def typecode(self) -> str:
+        """Type des coordonnées ('f' ou 'd')."""
+        xs = self.xs
+        return xs.format if isinstance(xs, memoryview) else xs.typecode
+
+    @property
+    def nbytes(self) -> int:
+        """Mémoire occupée par le conteneur et ses tableaux, en octets.
+
+        Pour des vues `memoryview`, le tampon partagé n'est pas compté.
+        """
+        return getsizeof(self) + getsizeof(self.xs) + getsizeof(self.ys)
+
+    def __len__(self) -> int:
+        """Nombre de points."""
+        return len(self.xs)
+
+    def __getitem__(self, index: int) -> PointView:
+        """Retourne une vue {'x', 'y'} sur le point d'indice index."""
+        if index < 0:
+            index += len(self.xs)
+        if not 0 <= index < len(self.xs):
+            raise IndexError("point index out of range")
+        return PointView(self, index)
+
+    def __iter__(self) -> Iterator[PointView]:
+        """Itère sur les points sous forme de vues {'x', 'y'}."""
+        for index in range(len(self.xs)):
+            yield PointView(self, index)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare à un autre conteneur ou à un PointSet_Geom.
+
+        La comparaison à une liste de dictionnaires se fait à la précision de
+        stockage (float 32 bits pour 'f'), comme après un aller-retour binaire.
+        """
+        if isinstance(other, PointSet_Array):
+            return self.xs == other.xs and self.ys == other.ys
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        if len(other) != len(self.xs):
+            return False
+        typecode = self.typecode
+        try:
+            xs = array(typecode, [p['x'] for p in other])
+            ys = array(typecode, [p['y'] for p in other])
+        except (KeyError, TypeError):
+            return False
+        return self.xs == xs and self.ys == ys
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Représentation courte (nombre de points et type des tableaux)."""
+        return f"PointSet_Array(n={len(self.xs)}, typecode={self.typecode!r})"
+
+
+class Triangles_Array:
+    """Triangles géométriques stockés dans un tableau plat d'indices.
+
+    Les indices des sommets sont rangés à la suite dans un `array('I')`
+    [v1, v2, v3, v1, v2, v3, ...], soit 12 octets par triangle.
+    Le conteneur se comporte comme une séquence de triangles
+    {'v1', 'v2', 'v3'} (Triangles_Geom).
+    """
+
+    __slots__ = ('indices',)
+
+    def __init__(self, indices: array) -> None:
+        """Construit le conteneur à partir du tableau plat d'indices."""
+        if len(indices) % 3:
+            raise ValueError("indices length must be a multiple of 3")
+        self.indices = indices
+
+    @classmethod
+    def from_geom(
+            cls, triangles: Sequence[Mapping[str, int]]
+            ) -> "Triangles_Array":
+        """Convertit un Triangles_Geom (liste de dictionnaires) en tableau."""
+        indices = array('I')
+        for t in triangles:
+            indices.append(t['v1'])
+            indices.append(t['v2'])
+            indices.append(t['v3'])
+        return cls(indices)
+
+    def to_geom(self) -> Triangles_Geom:
+        """Convertit en Triangles_Geom (liste de dictionnaires)."""
+        it = iter(self.indices)
+        return [{'v1': a, 'v2': b, 'v3': c} for a, b, c in zip(it, it, it, strict=True)]
+
+    @property
+    def nbytes(self) -> int:
+        """Mémoire occupée par le conteneur et son tableau, en octets."""
+        return getsizeof(self) + getsizeof(self.indices)
+
+    def __len__(self) -> int:
+        """Nombre de triangles."""
+        return len(self.indices) // 3
+
+    def __getitem__(self, index: int) -> TriangleView:
+        """Retourne une vue {'v1', 'v2', 'v3'} sur le triangle d'indice index."""
+        count = len(self.indices) // 3
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("triangle index out of range")
+        return TriangleView(self.indices, 3 * index)
+
+    def __iter__(self) -> Iterator[TriangleView]:
+        """Itère sur les triangles sous forme de vues {'v1', 'v2', 'v3'}."""
+        for offset in range(0, len(self.indices), 3):
+            yield TriangleView(self.indices, offset)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare à un autre conteneur ou à un Triangles_Geom."""
+        if isinstance(other, Triangles_Array):
+            return self.indices == other.indices
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        try:
+            return self.indices == Triangles_Array.from_geom(other).indices
+        except (KeyError, TypeError, OverflowError):
+            return False
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Représentation courte (nombre de triangles)."""
+        return f"Triangles_Array(n={len(self)})"
+
+
+Triangulation_Result: TypeAlias = dict[
+    str, PointSet_Geom | Triangles_Geom | PointSet_Array | Triangles_Array
+]
+"""
+Résultat de la triangulation : {'points': ..., 'triangles': ...}.
+Les deux entrées acceptent la forme liste de dictionnaires ou la forme compacte.
+"""